@@ -18,6 +18,57 @@ class TimeoutConstants:
     ELEMENT_CHECK_TIMEOUT = 3
 
 
+class LocatorConstants:
+    """Constants for waits that race fallback locators in the browser"""
+
+    # Conditions a locator's elements are checked for
+    PRESENT = "present"
+    VISIBLE = "visible"
+    CLICKABLE = "clickable"
+    INVISIBLE = "invisible"  # No element or the first one is hidden
+    TEXT = "text"  # The first element's text contains a given text
+    CONDITIONS = [PRESENT, VISIBLE, CLICKABLE, INVISIBLE, TEXT]
+
+    # Wait engines: poll the page from Python, or observe DOM mutations in the browser
+    POLL = "poll"
+    OBSERVER = "observer"
+    WAIT_ENGINES = [POLL, OBSERVER]
+    DEFAULT_WAIT_ENGINE = POLL
+
+    # Seconds between polls; each poll checks every locator in one script call
+    POLL_FREQUENCY = 0.2
+
+    # Observer engine: milliseconds between re-checks of visibility conditions, which can change
+    # without DOM mutations, and the longest single observing script in seconds (below the
+    # driver's script timeout, BrowserConstants.CHROME_SCRIPT_TIMEOUT)
+    OBSERVER_RECHECK_MS = 100
+    OBSERVER_MAX_WAIT = 25
+
+    # Characters of text returned per element by bulk element queries
+    QUERY_MAX_TEXT = 500
+
+
+class LocatorStatsConstants:
+    """Constants for the persistent statistics of which fallback locators match"""
+
+    # Statistics are kept unless disabled with --no-locator-stats / LOCATOR_STATS=false
+    DEFAULT_ENABLED = True
+
+    # Store location inside the shared cache directory (override with LOCATOR_STATS_FILE)
+    STATS_FILE = "locator_stats.json"
+    LOCK_TIMEOUT = 10
+    FORMAT_VERSION = 1
+
+    # Waits of a locator list recorded before its fallbacks are reordered by their scores
+    MIN_SAMPLES = 3
+
+    # Weight kept by older matches on every new wait, so the order follows DOM drift
+    SCORE_DECAY = 0.9
+
+    # Locator lists not used for this many days are dropped from the store
+    PRUNE_DAYS = 30
+
+
 class BrowserConstants:
     """Browser-related constants"""
     
@@ -35,6 +86,462 @@ class BrowserConstants:
     CHROME_SCRIPT_TIMEOUT = 30
 
 
+class DriverPoolConstants:
+    """WebDriver pool constants"""
+
+    # Pooling is enabled by default; disable to launch and quit a driver per test
+    DEFAULT_ENABLED = True
+
+    # Pool sizing (per worker process and driver configuration)
+    DEFAULT_MIN_SIZE = 1
+    DEFAULT_MAX_SIZE = 4
+
+    # Idle drivers above the minimum size are quit after this many seconds
+    DEFAULT_IDLE_TIMEOUT = 300
+
+    # How long a checkout waits for a driver to be returned when the pool is full
+    DEFAULT_CHECKOUT_TIMEOUT = 60
+
+    # Drivers kept ready for the next checkout, launched in the background when no returning driver will serve it
+    DEFAULT_PREFETCH_DEPTH = 1
+
+
+class SessionResetConstants:
+    """Constants for resetting pooled drivers between tests"""
+
+    # Page loaded into the remaining window after a reset
+    BLANK_URL = "about:blank"
+
+    # Verify the reset and fail loudly when state leaks into the next test
+    VERIFY_RESET = True
+
+    # Storage types cleared per origin (Storage.clearDataForOrigin)
+    CLEARED_STORAGE_TYPES = "all"
+
+    # Quota-managed storage types that must report zero usage after a reset
+    VERIFIED_STORAGE_TYPES = ["indexeddb", "cache_storage", "service_workers"]
+
+    # Sec-Fetch-Dest values of requests loading a document, whose origins are cleared on reset
+    DOCUMENT_DESTINATIONS = ["document", "iframe", "frame", "embed", "object"]
+
+    # DevTools resource type of requests loading a document (pages and frames)
+    DOCUMENT_RESOURCE_TYPE = "Document"
+
+
+class DriverCacheConstants:
+    """Constants for the on-disk chromedriver binary cache shared by workers"""
+
+    # Cache location (override with DRIVER_CACHE_DIR)
+    DEFAULT_CACHE_DIR = "~/.cache/sporty_web_assignment"
+    CACHE_FILE = "chromedriver_cache.json"
+    LOCK_FILE = "chromedriver_cache.lock"
+
+    # Seconds a worker waits for another worker resolving the binary
+    LOCK_TIMEOUT = 300
+
+    # Chrome executables probed for the installed version (override with CHROME_BINARY)
+    CHROME_BINARY_CANDIDATES = [
+        "google-chrome",
+        "google-chrome-stable",
+        "chromium",
+        "chromium-browser",
+        "chrome",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+    ]
+    VERSION_COMMAND_TIMEOUT = 10
+
+
+class ChromeProfileConstants:
+    """Constants for per-driver Chrome profiles cloned from a warmed template"""
+
+    # Template profile location (inside DRIVER_CACHE_DIR) and its metadata marker
+    TEMPLATE_DIR_NAME = "chrome_profile_template"
+    TEMPLATE_MARKER_FILE = ".sporty_template.json"
+    TEMPLATE_LOCK_FILE = "chrome_profile_template.lock"
+
+    # Template is re-warmed after this many hours or when Chrome's major version changes
+    TEMPLATE_MAX_AGE_HOURS = 24
+
+    # Seconds a worker waits for another worker warming the template
+    TEMPLATE_LOCK_TIMEOUT = 300
+
+    # Seconds to wait for the app-shell service worker while warming
+    SERVICE_WORKER_TIMEOUT = 10
+
+    # Consent dialog dismissed while warming so the consent cookie lands in the template
+    CONSENT_BUTTON_XPATH = "//div[contains(text(), 'Proceed')]"
+
+    # Working profile locations (tmpfs is used when requested and available)
+    TMPFS_DIR = "/dev/shm"
+    PROFILE_DIR_NAME = "sporty_chrome_profiles"
+
+    # Files never cloned from the template (per-process locks and debug endpoints)
+    SKIPPED_FILES = ["SingletonLock", "SingletonCookie", "SingletonSocket", "lockfile", "DevToolsActivePort"]
+
+
+class DriverTimingConstants:
+    """Driver startup timing constants"""
+
+    # Startup phases in the order they happen
+    PHASES = [
+        "profile_clone",
+        "binary_resolution",
+        "proxy_setup",
+        "chromedriver_spawn",
+        "session_creation",
+        "timeout_configuration",
+        "device_emulation",
+        "first_navigation",
+        "context_creation",
+        "target_creation",
+        "session_attach",
+    ]
+
+    # Page loaded to verify a new session can navigate
+    FIRST_NAVIGATION_URL = "about:blank"
+
+    # Per-worker startup records are written here (inside REPORT_DIR)
+    METRICS_DIR = "metrics"
+    STARTUP_RECORDS_FILE = "driver_startup.json"
+
+    # Lock waits longer than this many seconds count as contended
+    LOCK_CONTENTION_THRESHOLD = 0.001
+
+
+class NetworkCaptureConstants:
+    """Network capture backend constants"""
+
+    # Backends: selenium-wire proxy, Chrome DevTools Network events, or no capture
+    WIRE = "wire"
+    CDP = "cdp"
+    NONE = "none"
+    BACKENDS = [WIRE, CDP, NONE]
+    DEFAULT_BACKEND = WIRE
+
+    # Chromedriver performance log carrying DevTools Network events
+    PERFORMANCE_LOG = "performance"
+
+    # Seconds between polls while waiting for a captured request
+    POLL_INTERVAL = 0.2
+
+
+class BrowserContextConstants:
+    """Browser context driver mode constants"""
+
+    # Driver modes: one Chrome process per test driver, or one Chrome per worker with a browser context per test
+    PROCESS = "process"
+    CONTEXT = "context"
+    MODES = [PROCESS, CONTEXT]
+    DEFAULT_MODE = PROCESS
+
+    # Browser contexts open at the same time in one Chrome process
+    DEFAULT_MAX_CONTEXTS = 4
+
+
+class LaunchProfileConstants:
+    """Named Chrome launch profiles"""
+
+    # "default" keeps the classic behaviour: headed unless HEADLESS/--headless is set
+    DEFAULT = "default"
+    GUI = "gui"
+    HEADLESS = "headless"
+    HEADLESS_SHELL = "headless-shell"
+    LEAN = "lean"
+    DEFAULT_PROFILE = DEFAULT
+
+    # Arguments each profile adds to ChromeOptionsConstants.CHROME_ARGS
+    PROFILES = {
+        DEFAULT: {"headless": None, "binary": None, "args": []},
+        GUI: {"headless": False, "binary": None, "args": []},
+        HEADLESS: {"headless": True, "binary": None, "args": ["--headless=new"]},
+        HEADLESS_SHELL: {"headless": True, "binary": "chrome-headless-shell", "args": []},
+        LEAN: {
+            "headless": True,
+            "binary": None,
+            "args": [
+                "--headless=new",
+                "--renderer-process-limit=2",
+                "--disable-site-isolation-trials",
+                "--disable-background-networking",
+                "--disable-component-update",
+                "--disable-sync",
+                "--disable-domain-reliability",
+                "--disable-client-side-phishing-detection",
+                "--disable-breakpad",
+                "--no-first-run",
+                "--mute-audio",
+            ],
+        },
+    }
+
+    # Environment variable overriding the path of a profile's binary
+    BINARY_ENV_OVERRIDES = {"chrome-headless-shell": "CHROME_HEADLESS_SHELL"}
+
+
+class DeviceCatalogConstants:
+    """Device catalog used for launch emulation and runtime switching (metrics match Chrome DevTools presets)"""
+
+    _IOS_UA = (
+        "Mozilla/5.0 ({device}; CPU {os} 16_6 like Mac OS X) AppleWebKit/605.1.15 "
+        "(KHTML, like Gecko) Version/16.6 Mobile/15E148 Safari/604.1"
+    )
+    _ANDROID_UA = (
+        "Mozilla/5.0 (Linux; Android 13; {model}) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/116.0.0.0 Mobile Safari/537.36"
+    )
+
+    DEVICES = {
+        "iPhone SE": {
+            "width": 375, "height": 667, "device_scale_factor": 2, "mobile": True, "touch": True,
+            "platform": "iPhone", "user_agent": _IOS_UA.format(device="iPhone", os="iPhone OS"),
+        },
+        "iPhone 12 Pro": {
+            "width": 390, "height": 844, "device_scale_factor": 3, "mobile": True, "touch": True,
+            "platform": "iPhone", "user_agent": _IOS_UA.format(device="iPhone", os="iPhone OS"),
+        },
+        "iPhone 14 Pro Max": {
+            "width": 430, "height": 932, "device_scale_factor": 3, "mobile": True, "touch": True,
+            "platform": "iPhone", "user_agent": _IOS_UA.format(device="iPhone", os="iPhone OS"),
+        },
+        "Pixel 7": {
+            "width": 412, "height": 915, "device_scale_factor": 2.625, "mobile": True, "touch": True,
+            "platform": "Linux armv8l", "user_agent": _ANDROID_UA.format(model="Pixel 7"),
+        },
+        "Samsung Galaxy S20 Ultra": {
+            "width": 412, "height": 915, "device_scale_factor": 3.5, "mobile": True, "touch": True,
+            "platform": "Linux armv8l", "user_agent": _ANDROID_UA.format(model="SM-G988B"),
+        },
+        "Samsung Galaxy S8+": {
+            "width": 360, "height": 740, "device_scale_factor": 4, "mobile": True, "touch": True,
+            "platform": "Linux armv8l", "user_agent": _ANDROID_UA.format(model="SM-G955U"),
+        },
+        "iPad Mini": {
+            "width": 768, "height": 1024, "device_scale_factor": 2, "mobile": True, "touch": True,
+            "platform": "iPad", "user_agent": _IOS_UA.format(device="iPad", os="OS"),
+        },
+    }
+
+    # Touch points reported by emulated touch devices
+    MAX_TOUCH_POINTS = 5
+
+
+class PerformanceProfileConstants:
+    """Network and CPU throttling profiles for low-end device simulation (applied over DevTools)"""
+
+    # No throttling: desktop-class network and CPU
+    NONE = "none"
+    DEFAULT_PROFILE = NONE
+
+    # Latency in ms, throughput in kbit/s, CPU slowdown multiplier (values of the DevTools and Lighthouse presets)
+    PROFILES = {
+        NONE: {"latency_ms": 0, "download_kbps": 0, "upload_kbps": 0, "cpu_slowdown": 1},
+        "3g": {"latency_ms": 562.5, "download_kbps": 1440, "upload_kbps": 675, "cpu_slowdown": 1},
+        "slow-4g": {"latency_ms": 150, "download_kbps": 1638.4, "upload_kbps": 750, "cpu_slowdown": 1},
+        "low-end-mobile": {"latency_ms": 150, "download_kbps": 1638.4, "upload_kbps": 750, "cpu_slowdown": 4},
+    }
+
+
+class DriverHealthConstants:
+    """Driver health recycling constants (0 disables a threshold)"""
+
+    # Chrome process tree RSS above which a returned driver is recycled
+    DEFAULT_MAX_RSS_MB = 1500
+
+    # Seconds since launch after which a returned driver is recycled
+    DEFAULT_MAX_AGE = 1800
+
+    # Tests served after which a returned driver is recycled
+    DEFAULT_MAX_TESTS = 50
+
+
+class SessionProbeConstants:
+    """Constants for detecting dead WebDriver sessions"""
+
+    # Seconds the status probe waits for chromedriver per attempt
+    PROBE_TIMEOUT = 2
+
+    # Attempts before a probe that keeps timing out gives up; a slow chromedriver is not a dead session
+    PROBE_ATTEMPTS = 2
+
+    # Error codes and message fragments chromedriver reports once the browser or session is gone
+    DEAD_SESSION_MARKERS = [
+        "invalid session id",
+        "session deleted",
+        "chrome not reachable",
+        "not connected to devtools",
+        "disconnected",
+        "tab crashed",
+    ]
+
+
+class NetworkIdleConstants:
+    """Constants for in-flight request tracking used by network idle waits"""
+
+    # Seconds without in-flight requests before the network counts as idle
+    DEFAULT_IDLE_TIME = 0.25
+
+    # Seconds between performance log drains while waiting (DevTools capture only)
+    POLL_INTERVAL = 0.05
+
+    # Seconds after which a request without a response (failed, aborted) stops blocking idle.
+    # selenium-wire reports no finish for failed requests, so this must stay below typical wait timeouts
+    STALE_REQUEST_TIMEOUT = 5
+
+    # Share of an idle wait's timeout after which an unfinished request counts as stale
+    STALE_TIMEOUT_SHARE = 0.5
+
+    # URL patterns of long-polling and streaming traffic that never settles (override with NETWORK_IDLE_IGNORE)
+    DEFAULT_IGNORED_URL_PATTERNS = [
+        r"\.ttvnw\.net/",  # HLS playlists and video segments
+        r"//video-weaver\.",
+        r"//spade\.twitch\.tv",  # Analytics beacons
+        r"//pubsub-edge\.twitch\.tv",
+        r"//hermes\.twitch\.tv",
+        r"//irc-ws\.chat\.twitch\.tv",
+    ]
+
+
+class CaptureStorageConstants:
+    """Constants for bounded selenium-wire request storage"""
+
+    # Where captured requests are kept: process memory or pickled files in a temp directory
+    MEMORY = "memory"
+    DISK = "disk"
+    STORAGES = [MEMORY, DISK]
+    DEFAULT_STORAGE = MEMORY
+
+    # URL patterns of stored requests (empty stores everything); interceptors still see requests outside the scopes
+    DEFAULT_SCOPES = []
+
+    # Ring buffer bounds, oldest requests are evicted first (0 disables a bound)
+    DEFAULT_MAX_ENTRIES = 1000
+    DEFAULT_MAX_MB = 64
+
+    # Request and response bodies are truncated to this size when stored (0 disables)
+    DEFAULT_MAX_BODY_KB = 1024
+
+
+class AssetCacheConstants:
+    """Constants for the disk cache of immutable static assets shared by all workers (selenium-wire capture only)"""
+
+    # The cache is optional and off unless requested with --asset-cache / ASSET_CACHE
+    DEFAULT_ENABLED = False
+
+    # Cache location inside DRIVER_CACHE_DIR (override with ASSET_CACHE_DIR)
+    CACHE_DIR_NAME = "asset_cache"
+    LOCK_FILE = "asset_cache.lock"
+    FILE_SUFFIX = ".asset"
+
+    # Bumped when the entry layout changes; entries of other versions count as misses
+    FORMAT_VERSION = 2
+
+    # Size cap; least recently used assets are evicted down to EVICT_TO_RATIO of it
+    DEFAULT_MAX_MB = 512
+    EVICT_TO_RATIO = 0.9
+
+    # Share of the cap a worker stores before it checks the cache size again
+    EVICTION_CHECK_RATIO = 0.05
+
+    # Seconds a worker waits for another worker evicting
+    LOCK_TIMEOUT = 30
+
+    # Immutable, content-hashed asset URLs served from the cache
+    ASSET_URL_PATTERNS = [
+        r"//static\.twitchcdn\.net/assets/",
+        r"//assets\.twitch\.tv/assets/",
+        r"[.-][0-9a-f]{8,}\.(?:js|css|woff2?|ttf|otf|svg|png|jpe?g|webp|gif)(?:\?|$)",
+    ]
+
+    # Response headers never stored with an asset (bodies are stored decoded, the proxy
+    # sets the length of served bodies)
+    SKIPPED_HEADERS = [
+        "connection", "keep-alive", "transfer-encoding", "set-cookie", "date", "age",
+        "content-encoding", "content-length",
+    ]
+
+    # Header marking responses served from the cache
+    HIT_HEADER = "X-Sporty-Asset-Cache"
+
+
+class GraphQLConstants:
+    """Constants for the index of captured GraphQL exchanges"""
+
+    # Requests to URLs matching this pattern are indexed by operationName
+    ENDPOINT_PATTERN = r"gql\.twitch\.tv/gql"
+
+    # Most recent exchanges kept per operation
+    MAX_EXCHANGES_PER_OPERATION = 50
+
+    # Seconds to wait for a GraphQL operation to complete
+    DEFAULT_TIMEOUT = 10
+
+    # Seconds between performance log drains while waiting (DevTools capture only)
+    POLL_INTERVAL = 0.05
+
+    # Operation answering the search box typeahead
+    SEARCH_SUGGESTIONS_OPERATION = "SearchTray_SearchSuggestions"
+
+
+class HarConstants:
+    """Constants for streaming HAR export of captured traffic"""
+
+    # HAR export is off unless requested with --har / HAR_EXPORT
+    DEFAULT_ENABLED = False
+
+    # HAR files are written here (inside REPORT_DIR, override with HAR_DIR)
+    HAR_DIR = "har"
+
+    # Textual response bodies up to this size are embedded in entries (0 disables)
+    DEFAULT_MAX_TEXT_KB = 64
+
+    # Content types whose bodies are embedded as text
+    TEXT_MIME_PATTERN = r"^(text/|application/(json|javascript|xml|graphql|x-www-form-urlencoded))|\+json|\+xml"
+
+    # HAR format version
+    VERSION = "1.2"
+
+
+class NetworkMetricsConstants:
+    """Constants for per-test network timing metrics built from captured requests"""
+
+    # Metrics are collected only when requested with --network-metrics / NETWORK_METRICS
+    DEFAULT_ENABLED = False
+
+    # Percentiles reported for every timing (max is always reported)
+    PERCENTILES = [50, 95]
+
+    # Hosts with the most requests listed individually, the rest are summed under "other"
+    DEFAULT_MAX_HOSTS = 15
+
+
+class CassetteConstants:
+    """Constants for recording and replaying GraphQL traffic (selenium-wire capture only)"""
+
+    # Modes: hit the network, record GraphQL exchanges to a cassette, or serve them from one
+    OFF = "off"
+    RECORD = "record"
+    REPLAY = "replay"
+    MODES = [OFF, RECORD, REPLAY]
+    DEFAULT_MODE = OFF
+
+    # One gzipped JSON cassette per test (override with CASSETTE_DIR)
+    DEFAULT_DIR = "tests/cassettes"
+    FILE_SUFFIX = ".json.gz"
+    FORMAT_VERSION = 1
+
+    # Milliseconds added before each replayed response
+    DEFAULT_LATENCY_MS = 0
+
+    # Variables that change between page loads and must not affect matching
+    VOLATILE_VARIABLES = ["requestID", "requestId", "sessionID", "sessionId", "clientSessionId", "deviceID"]
+
+    # Response headers kept in the cassette (CORS headers let the browser accept replayed answers)
+    RECORDED_HEADERS = ["Content-Type", "Access-Control-Allow-Origin", "Access-Control-Allow-Credentials"]
+
+    # Status of the placeholder answer to requests missing from the cassette
+    UNMATCHED_STATUS = 501
+
+
 class TestConstants:
     """Test execution constants"""
     
@@ -110,7 +617,6 @@ class ChromeOptionsConstants:
         "--disable-web-security",
         "--disable-features=VizDisplayCompositor",
         "--remote-debugging-port=0",
-        "--user-data-dir=/tmp/chrome_dev_test",
         "--disable-infobars",
         "--disable-notifications",
         "--disable-popup-blocking",
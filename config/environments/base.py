@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from typing import Dict, Any
 
 from ..constants import (
+    LaunchProfileConstants,
+    PerformanceProfileConstants,
     TimeoutConstants,
     TestConstants,
     ReportConstants,
@@ -33,6 +35,8 @@ class BaseEnvironmentConfig(ABC):
     
     # Environment-specific browser settings
     headless_mode: bool = False
+    launch_profile: str = LaunchProfileConstants.DEFAULT_PROFILE
+    performance_profile: str = PerformanceProfileConstants.DEFAULT_PROFILE
     
     # Test data settings
     test_data_source: str = TestConstants.DEFAULT_TEST_DATA_SOURCE
@@ -52,7 +56,9 @@ class BaseEnvironmentConfig(ABC):
         return {
             "headless": self.headless_mode,
             "explicit_wait": self.explicit_wait,
-            "page_load_timeout": self.page_load_timeout
+            "page_load_timeout": self.page_load_timeout,
+            "launch_profile": self.launch_profile,
+            "performance_profile": self.performance_profile,
         }
     
     def validate_environment(self) -> bool:
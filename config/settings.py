@@ -3,13 +3,27 @@ Configuration settings for Sporty Web Assignment Testing Framework
 """
 
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from dotenv import load_dotenv
 from .constants import (
+    AssetCacheConstants,
     TimeoutConstants,
     BrowserConstants,
+    BrowserContextConstants,
+    CaptureStorageConstants,
+    CassetteConstants,
+    DriverHealthConstants,
+    DriverPoolConstants,
+    HarConstants,
+    LaunchProfileConstants,
+    LocatorConstants,
+    LocatorStatsConstants,
+    NetworkCaptureConstants,
+    NetworkIdleConstants,
+    NetworkMetricsConstants,
+    PerformanceProfileConstants,
     TestConstants,
     ReportConstants,
     FrameworkConstants,
@@ -29,6 +43,109 @@ class BrowserConfig:
     page_load_timeout: int = TimeoutConstants.PAGE_LOAD_TIMEOUT
     mobile_emulation: bool = BrowserConstants.MOBILE_EMULATION_ENABLED
     device: str = BrowserConstants.DEFAULT_DEVICE
+    network_capture: str = NetworkCaptureConstants.DEFAULT_BACKEND
+    launch_profile: str = LaunchProfileConstants.DEFAULT_PROFILE
+    performance_profile: str = PerformanceProfileConstants.DEFAULT_PROFILE
+
+
+@dataclass
+class DriverPoolConfig:
+    """WebDriver pool configuration"""
+
+    enabled: bool = DriverPoolConstants.DEFAULT_ENABLED
+    min_size: int = DriverPoolConstants.DEFAULT_MIN_SIZE
+    max_size: int = DriverPoolConstants.DEFAULT_MAX_SIZE
+    idle_timeout: float = DriverPoolConstants.DEFAULT_IDLE_TIMEOUT
+    checkout_timeout: float = DriverPoolConstants.DEFAULT_CHECKOUT_TIMEOUT
+    prefetch_depth: int = DriverPoolConstants.DEFAULT_PREFETCH_DEPTH
+
+
+@dataclass
+class DriverHealthConfig:
+    """Driver health recycling thresholds (0 disables a threshold)"""
+
+    max_rss_mb: float = DriverHealthConstants.DEFAULT_MAX_RSS_MB
+    max_age: float = DriverHealthConstants.DEFAULT_MAX_AGE
+    max_tests: int = DriverHealthConstants.DEFAULT_MAX_TESTS
+
+
+@dataclass
+class BrowserContextConfig:
+    """Browser context driver mode configuration"""
+
+    mode: str = BrowserContextConstants.DEFAULT_MODE
+    max_contexts: int = BrowserContextConstants.DEFAULT_MAX_CONTEXTS
+
+
+@dataclass
+class NetworkIdleConfig:
+    """In-flight request tracking configuration for network idle waits"""
+
+    idle_time: float = NetworkIdleConstants.DEFAULT_IDLE_TIME
+    ignored_url_patterns: List[str] = field(
+        default_factory=lambda: list(NetworkIdleConstants.DEFAULT_IGNORED_URL_PATTERNS)
+    )
+
+
+@dataclass
+class CaptureStorageConfig:
+    """Bounded, scoped storage of selenium-wire captured requests"""
+
+    storage: str = CaptureStorageConstants.DEFAULT_STORAGE
+    scopes: List[str] = field(default_factory=lambda: list(CaptureStorageConstants.DEFAULT_SCOPES))
+    max_entries: int = CaptureStorageConstants.DEFAULT_MAX_ENTRIES
+    max_mb: float = CaptureStorageConstants.DEFAULT_MAX_MB
+    max_body_kb: int = CaptureStorageConstants.DEFAULT_MAX_BODY_KB
+
+
+@dataclass
+class LocatorConfig:
+    """Element wait settings"""
+
+    wait_engine: str = LocatorConstants.DEFAULT_WAIT_ENGINE
+
+
+@dataclass
+class LocatorStatsConfig:
+    """Persistent fallback locator statistics and adaptive ordering"""
+
+    enabled: bool = LocatorStatsConstants.DEFAULT_ENABLED
+    stats_file: Optional[str] = None  # Inside DRIVER_CACHE_DIR when not set
+
+
+@dataclass
+class HarConfig:
+    """Streaming HAR export of each test's captured traffic"""
+
+    enabled: bool = HarConstants.DEFAULT_ENABLED
+    har_dir: str = os.path.join(ReportConstants.DEFAULT_REPORT_DIR, HarConstants.HAR_DIR)
+    max_text_kb: int = HarConstants.DEFAULT_MAX_TEXT_KB
+
+
+@dataclass
+class NetworkMetricsConfig:
+    """Per-test network timing metrics"""
+
+    enabled: bool = NetworkMetricsConstants.DEFAULT_ENABLED
+    max_hosts: int = NetworkMetricsConstants.DEFAULT_MAX_HOSTS
+
+
+@dataclass
+class CassetteConfig:
+    """Record and replay of GraphQL traffic"""
+
+    mode: str = CassetteConstants.DEFAULT_MODE
+    cassette_dir: str = CassetteConstants.DEFAULT_DIR
+    latency_ms: float = CassetteConstants.DEFAULT_LATENCY_MS
+
+
+@dataclass
+class AssetCacheConfig:
+    """Disk cache of immutable static assets shared by all workers"""
+
+    enabled: bool = AssetCacheConstants.DEFAULT_ENABLED
+    cache_dir: Optional[str] = None  # Inside DRIVER_CACHE_DIR when not set
+    max_mb: float = AssetCacheConstants.DEFAULT_MAX_MB
 
 
 @dataclass
@@ -79,6 +196,119 @@ class Settings:
             page_load_timeout=int(os.getenv("PAGE_LOAD_TIMEOUT", str(browser_options.get("page_load_timeout", 30)))),
             mobile_emulation=os.getenv("MOBILE_EMULATION", "true").lower() == "true",
             device=os.getenv("DEVICE", "iPhone SE"),
+            network_capture=os.getenv("NETWORK_CAPTURE", NetworkCaptureConstants.DEFAULT_BACKEND).lower(),
+            launch_profile=os.getenv(
+                "LAUNCH_PROFILE", browser_options.get("launch_profile", LaunchProfileConstants.DEFAULT_PROFILE)
+            ).lower(),
+            performance_profile=os.getenv(
+                "PERFORMANCE_PROFILE",
+                browser_options.get("performance_profile", PerformanceProfileConstants.DEFAULT_PROFILE),
+            ).lower(),
+        )
+
+    @classmethod
+    def get_driver_pool_config(cls) -> DriverPoolConfig:
+        """Get WebDriver pool configuration with environment overrides"""
+        return DriverPoolConfig(
+            enabled=os.getenv("DRIVER_POOL", str(DriverPoolConstants.DEFAULT_ENABLED)).lower() == "true",
+            min_size=int(os.getenv("DRIVER_POOL_MIN_SIZE", str(DriverPoolConstants.DEFAULT_MIN_SIZE))),
+            max_size=int(os.getenv("DRIVER_POOL_MAX_SIZE", str(DriverPoolConstants.DEFAULT_MAX_SIZE))),
+            idle_timeout=float(os.getenv("DRIVER_POOL_IDLE_TIMEOUT", str(DriverPoolConstants.DEFAULT_IDLE_TIMEOUT))),
+            checkout_timeout=float(os.getenv("DRIVER_POOL_CHECKOUT_TIMEOUT", str(DriverPoolConstants.DEFAULT_CHECKOUT_TIMEOUT))),
+            prefetch_depth=int(os.getenv("DRIVER_POOL_PREFETCH_DEPTH", str(DriverPoolConstants.DEFAULT_PREFETCH_DEPTH))),
+        )
+
+    @classmethod
+    def get_driver_health_config(cls) -> DriverHealthConfig:
+        """Get driver health recycling thresholds with environment overrides"""
+        return DriverHealthConfig(
+            max_rss_mb=float(os.getenv("DRIVER_RECYCLE_MAX_RSS_MB", str(DriverHealthConstants.DEFAULT_MAX_RSS_MB))),
+            max_age=float(os.getenv("DRIVER_RECYCLE_MAX_AGE", str(DriverHealthConstants.DEFAULT_MAX_AGE))),
+            max_tests=int(os.getenv("DRIVER_RECYCLE_MAX_TESTS", str(DriverHealthConstants.DEFAULT_MAX_TESTS))),
+        )
+
+    @classmethod
+    def get_browser_context_config(cls) -> BrowserContextConfig:
+        """Get browser context driver mode configuration with environment overrides"""
+        return BrowserContextConfig(
+            mode=os.getenv("DRIVER_MODE", BrowserContextConstants.DEFAULT_MODE).lower(),
+            max_contexts=int(os.getenv("BROWSER_CONTEXT_MAX", str(BrowserContextConstants.DEFAULT_MAX_CONTEXTS))),
+        )
+
+    @classmethod
+    def get_network_idle_config(cls) -> NetworkIdleConfig:
+        """Get network idle tracking configuration with environment overrides"""
+        ignored = os.getenv("NETWORK_IDLE_IGNORE")
+        return NetworkIdleConfig(
+            idle_time=float(os.getenv("NETWORK_IDLE_TIME", str(NetworkIdleConstants.DEFAULT_IDLE_TIME))),
+            ignored_url_patterns=(
+                [pattern.strip() for pattern in ignored.split(",") if pattern.strip()]
+                if ignored is not None
+                else list(NetworkIdleConstants.DEFAULT_IGNORED_URL_PATTERNS)
+            ),
+        )
+
+    @classmethod
+    def get_capture_storage_config(cls) -> CaptureStorageConfig:
+        """Get captured request storage configuration with environment overrides"""
+        scopes = os.getenv("CAPTURE_SCOPES", ",".join(CaptureStorageConstants.DEFAULT_SCOPES))
+        return CaptureStorageConfig(
+            storage=os.getenv("CAPTURE_STORAGE", CaptureStorageConstants.DEFAULT_STORAGE).lower(),
+            scopes=[scope.strip() for scope in scopes.split(",") if scope.strip()],
+            max_entries=int(os.getenv("CAPTURE_MAX_ENTRIES", str(CaptureStorageConstants.DEFAULT_MAX_ENTRIES))),
+            max_mb=float(os.getenv("CAPTURE_MAX_MB", str(CaptureStorageConstants.DEFAULT_MAX_MB))),
+            max_body_kb=int(os.getenv("CAPTURE_MAX_BODY_KB", str(CaptureStorageConstants.DEFAULT_MAX_BODY_KB))),
+        )
+
+    @classmethod
+    def get_har_config(cls) -> HarConfig:
+        """Get HAR export configuration with environment overrides"""
+        report_dir = os.getenv("REPORT_DIR", ReportConstants.DEFAULT_REPORT_DIR)
+        return HarConfig(
+            enabled=os.getenv("HAR_EXPORT", str(HarConstants.DEFAULT_ENABLED)).lower() == "true",
+            har_dir=os.getenv("HAR_DIR", os.path.join(report_dir, HarConstants.HAR_DIR)),
+            max_text_kb=int(os.getenv("HAR_MAX_TEXT_KB", str(HarConstants.DEFAULT_MAX_TEXT_KB))),
+        )
+
+    @classmethod
+    def get_network_metrics_config(cls) -> NetworkMetricsConfig:
+        """Get per-test network metrics configuration with environment overrides"""
+        return NetworkMetricsConfig(
+            enabled=os.getenv("NETWORK_METRICS", str(NetworkMetricsConstants.DEFAULT_ENABLED)).lower() == "true",
+            max_hosts=int(os.getenv("NETWORK_METRICS_MAX_HOSTS", str(NetworkMetricsConstants.DEFAULT_MAX_HOSTS))),
+        )
+
+    @classmethod
+    def get_cassette_config(cls) -> CassetteConfig:
+        """Get GraphQL cassette configuration with environment overrides"""
+        return CassetteConfig(
+            mode=os.getenv("CASSETTE_MODE", CassetteConstants.DEFAULT_MODE).lower(),
+            cassette_dir=os.getenv("CASSETTE_DIR", CassetteConstants.DEFAULT_DIR),
+            latency_ms=float(os.getenv("CASSETTE_LATENCY_MS", str(CassetteConstants.DEFAULT_LATENCY_MS))),
+        )
+
+    @classmethod
+    def get_locator_config(cls) -> LocatorConfig:
+        """Get element wait configuration with environment overrides"""
+        return LocatorConfig(
+            wait_engine=os.getenv("WAIT_ENGINE", LocatorConstants.DEFAULT_WAIT_ENGINE).lower(),
+        )
+
+    @classmethod
+    def get_locator_stats_config(cls) -> LocatorStatsConfig:
+        """Get locator statistics configuration with environment overrides"""
+        return LocatorStatsConfig(
+            enabled=os.getenv("LOCATOR_STATS", str(LocatorStatsConstants.DEFAULT_ENABLED)).lower() == "true",
+            stats_file=os.getenv("LOCATOR_STATS_FILE") or None,
+        )
+
+    @classmethod
+    def get_asset_cache_config(cls) -> AssetCacheConfig:
+        """Get static asset cache configuration with environment overrides"""
+        return AssetCacheConfig(
+            enabled=os.getenv("ASSET_CACHE", str(AssetCacheConstants.DEFAULT_ENABLED)).lower() == "true",
+            cache_dir=os.getenv("ASSET_CACHE_DIR") or None,
+            max_mb=float(os.getenv("ASSET_CACHE_MAX_MB", str(AssetCacheConstants.DEFAULT_MAX_MB))),
         )
 
     @classmethod
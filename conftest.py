@@ -8,6 +8,7 @@ This module provides:
 - Parallel execution support with worker management
 """
 
+import json
 import os
 import subprocess
 import threading
@@ -16,6 +17,13 @@ from pathlib import Path
 
 import pytest
 
+# Metrics snapshots received from xdist workers (controller process only)
+_worker_metrics = []
+
+# Start of the run, locator lists used since then are reported at session end
+_session_started = time.time()
+
+
 def pytest_addoption(parser):
     """Add custom command line options to pytest"""
 
@@ -36,6 +44,32 @@ def pytest_addoption(parser):
         help="Run tests in headless mode",
     )
 
+    parser.addoption(
+        "--launch-profile",
+        action="store",
+        default=None,
+        choices=["default", "gui", "headless", "headless-shell", "lean"],
+        help="Chrome launch profile: default (honours --headless), gui, headless (new headless), "
+        "headless-shell (chrome-headless-shell binary) or lean (headless with fewer processes and background services off)",
+    )
+
+    parser.addoption(
+        "--performance-profile",
+        action="store",
+        default=None,
+        choices=["none", "3g", "slow-4g", "low-end-mobile"],
+        help="Network and CPU throttling applied over DevTools: none, 3g, slow-4g or low-end-mobile "
+        "(slow 4G with a 4x CPU slowdown) (default: none, or the environment's profile)",
+    )
+
+    parser.addoption(
+        "--devices",
+        action="store",
+        default=None,
+        help="Comma-separated device catalog names to run each test against by switching emulation at runtime "
+        "(e.g. \"iPhone SE,Pixel 7,iPad Mini\")",
+    )
+
     parser.addoption(
         "--test-timeout",
         action="store",
@@ -45,6 +79,212 @@ def pytest_addoption(parser):
     )
 
 
+    # Driver pool options
+    parser.addoption(
+        "--no-driver-pool",
+        action="store_true",
+        default=False,
+        help="Disable the WebDriver pool and launch a fresh driver for every test",
+    )
+
+    parser.addoption(
+        "--driver-pool-min",
+        action="store",
+        type=int,
+        default=None,
+        help="Number of warm drivers kept per worker and driver configuration (default: 1)",
+    )
+
+    parser.addoption(
+        "--driver-pool-max",
+        action="store",
+        type=int,
+        default=None,
+        help="Maximum number of drivers per worker and driver configuration (default: 4)",
+    )
+
+    parser.addoption(
+        "--driver-pool-idle-timeout",
+        action="store",
+        type=float,
+        default=None,
+        help="Seconds before idle drivers above the minimum are quit (default: 300)",
+    )
+
+    parser.addoption(
+        "--driver-prefetch",
+        action="store",
+        type=int,
+        default=None,
+        help="Drivers kept ready for the next checkout, launched in the background when no returning driver will serve it (default: 1, 0 disables)",
+    )
+
+    parser.addoption(
+        "--recycle-max-rss",
+        action="store",
+        type=float,
+        default=None,
+        help="Recycle a pooled driver whose Chrome process tree exceeds this RSS in MB (default: 1500, 0 disables)",
+    )
+
+    parser.addoption(
+        "--recycle-max-age",
+        action="store",
+        type=float,
+        default=None,
+        help="Recycle a pooled driver older than this many seconds (default: 1800, 0 disables)",
+    )
+
+    parser.addoption(
+        "--recycle-max-tests",
+        action="store",
+        type=int,
+        default=None,
+        help="Recycle a pooled driver after it served this many tests (default: 50, 0 disables)",
+    )
+
+    # Network capture options
+    parser.addoption(
+        "--network-capture",
+        action="store",
+        default=None,
+        choices=["wire", "cdp", "none"],
+        help="Network capture backend: selenium-wire proxy, Chrome DevTools Network events or none (default: wire)",
+    )
+
+    # Captured request storage options (selenium-wire)
+    parser.addoption(
+        "--capture-scope",
+        action="store",
+        default=None,
+        help="Comma-separated URL patterns of requests to store, e.g. gql.twitch.tv (default: everything)",
+    )
+
+    parser.addoption(
+        "--capture-storage",
+        action="store",
+        default=None,
+        choices=["memory", "disk"],
+        help="Keep captured requests in memory or in a temp directory (default: memory)",
+    )
+
+    parser.addoption(
+        "--capture-max-entries",
+        action="store",
+        type=int,
+        default=None,
+        help="Captured requests kept per driver, oldest evicted first (default: 1000, 0 disables)",
+    )
+
+    parser.addoption(
+        "--capture-max-mb",
+        action="store",
+        type=float,
+        default=None,
+        help="Megabytes of captured requests kept per driver, oldest evicted first (default: 64, 0 disables)",
+    )
+
+    parser.addoption(
+        "--capture-max-body-kb",
+        action="store",
+        type=int,
+        default=None,
+        help="Captured request and response bodies are stored truncated to this size (default: 1024, 0 disables)",
+    )
+
+    parser.addoption(
+        "--asset-cache",
+        action="store_true",
+        default=False,
+        help="Serve immutable static assets (JS bundles, fonts, images) from a disk cache shared by all workers (selenium-wire only)",
+    )
+
+    parser.addoption(
+        "--asset-cache-max-mb",
+        action="store",
+        type=float,
+        default=None,
+        help="Size cap of the static asset cache, least recently used assets are evicted first (default: 512, 0 disables)",
+    )
+
+    parser.addoption(
+        "--har",
+        action="store_true",
+        default=False,
+        help="Stream each test's captured traffic to a HAR file in reports/har (attached to Allure on failure)",
+    )
+
+    parser.addoption(
+        "--network-metrics",
+        action="store_true",
+        default=False,
+        help="Attach per-test network timing percentiles (per phase, host and GraphQL operation) to the Allure report",
+    )
+
+    parser.addoption(
+        "--cassette",
+        action="store",
+        default=None,
+        choices=["off", "record", "replay"],
+        help="Record each test's GraphQL traffic to tests/cassettes or replay it from there (selenium-wire capture only, default: off)",
+    )
+
+    parser.addoption(
+        "--cassette-latency",
+        action="store",
+        type=float,
+        default=None,
+        help="Milliseconds added before each replayed GraphQL response; concurrent responses are delayed in parallel (default: 0)",
+    )
+
+    # Browser context options
+    parser.addoption(
+        "--driver-mode",
+        action="store",
+        default=None,
+        choices=["process", "context"],
+        help="process: pooled Chrome per test driver; context: one Chrome per worker with an isolated browser context per test (default: process)",
+    )
+
+    parser.addoption(
+        "--max-browser-contexts",
+        action="store",
+        type=int,
+        default=None,
+        help="Browser contexts open at the same time in one Chrome process in context mode (default: 4)",
+    )
+
+    # Locator options
+    parser.addoption(
+        "--wait-engine",
+        action="store",
+        default=None,
+        choices=["poll", "observer"],
+        help="Element waits: poll the page every 200 ms or observe DOM mutations in the browser (default: poll)",
+    )
+
+    parser.addoption(
+        "--no-locator-stats",
+        action="store_true",
+        default=False,
+        help="Neither record which fallback locators match nor reorder fallback locators by their recorded wins",
+    )
+
+    # Chrome profile options
+    parser.addoption(
+        "--no-profile-template",
+        action="store_true",
+        default=False,
+        help="Start every Chrome instance with an empty profile instead of cloning the warmed template profile",
+    )
+
+    parser.addoption(
+        "--profile-tmpfs",
+        action="store_true",
+        default=False,
+        help="Keep per-driver Chrome profiles on tmpfs (/dev/shm) when available",
+    )
+
     # Reporting options
 
     parser.addoption(
@@ -83,6 +323,19 @@ def test_config(request) -> dict:
         "allure_report": request.config.getoption("--allure-report"),
         "open_allure": request.config.getoption("--open-allure"),
         "screenshot_on_failure": request.config.getoption("--screenshot-on-failure"),
+        "driver_pool": not request.config.getoption("--no-driver-pool"),
+        "network_capture": os.getenv("NETWORK_CAPTURE", "wire"),
+        "driver_mode": os.getenv("DRIVER_MODE", "process"),
+        "launch_profile": os.getenv("LAUNCH_PROFILE", "default"),
+        "performance_profile": os.getenv("PERFORMANCE_PROFILE", "none"),
+        "capture_storage": os.getenv("CAPTURE_STORAGE", "memory"),
+        "capture_scopes": os.getenv("CAPTURE_SCOPES", ""),
+        "wait_engine": os.getenv("WAIT_ENGINE", "poll"),
+        "locator_stats": not request.config.getoption("--no-locator-stats"),
+        "har": request.config.getoption("--har"),
+        "network_metrics": request.config.getoption("--network-metrics"),
+        "asset_cache": request.config.getoption("--asset-cache"),
+        "cassette_mode": os.getenv("CASSETTE_MODE", "off"),
     }
 
 
@@ -121,22 +374,212 @@ def parallel_session_setup(request):
 
 
 @pytest.fixture(scope="function")
-def driver():
-    """Provides a WebDriver instance with selenium-wire for network monitoring
-
-    This fixture ensures complete test isolation in parallel execution
-    and handles automatic cleanup. Uses selenium-wire for GraphQL request monitoring.
+def driver(request):
+    """Provides a WebDriver instance with network monitoring
+
+    The driver is borrowed from the per-worker driver pool and returned after the test,
+    where it is reset over DevTools (windows, cookies, storage, cache and captured
+    requests) so consecutive tests reuse a warm browser with per-test isolation.
+    Captured requests for GraphQL monitoring come from the --network-capture backend
+    (selenium-wire by default). With --devices the test runs once per device, each
+    run switching the emulation of the same warm browser.
     """
     from core.driver_manager import DriverManager
 
-    # Get worker-specific driver with selenium-wire support for GraphQL monitoring
+    # Borrow worker-specific driver with network capture for GraphQL monitoring
     driver = DriverManager.get_mobile_wire_driver()
-    print("\n🧪 New WebDriver instance created for test (with selenium-wire for GraphQL monitoring)")
+    print(f"\n🧪 WebDriver instance checked out for test (network capture: {DriverManager.get_network_capture().value})")
+
+    device = getattr(request, "param", None)
+    if device:
+        try:
+            DriverManager.switch_device(device)
+        except Exception:
+            DriverManager.release_driver()
+            raise
+        print(f"📱 Emulating {device}")
+
+    har_recorder = None
+    network_metrics = None
+    try:
+        # Stream the test's captured traffic to a HAR file as requests complete
+        har_recorder = _start_har_recording(driver, request.node)
+
+        # Aggregate the test's request timings as requests complete
+        network_metrics = _start_network_metrics(driver)
+
+        # Record or replay the test's GraphQL traffic
+        cassette = _start_cassette(driver, request.node)
+    except Exception:
+        if har_recorder is not None:
+            har_recorder.stop()
+        if network_metrics is not None:
+            driver.har_recorder.remove_listener(network_metrics.add_entry)
+        DriverManager.release_driver()
+        raise
 
     yield driver
 
-    # Cleanup is handled automatically by DriverManager per worker
-    DriverManager.quit_driver()
+    cassette_error = None
+    try:
+        # Fail the test on requests missing from a replayed cassette, after the driver is back in the pool
+        if cassette is not None:
+            from core.exceptions.framework_exceptions import CassetteException
+
+            try:
+                cassette_summary = cassette.stop()
+                request.node.user_properties.append(("cassette", cassette_summary))
+                print(
+                    f"📼 Cassette {cassette_summary['mode']}: {cassette_summary['recorded'] or cassette_summary['replayed']} "
+                    f"GraphQL exchanges ({cassette_summary['path']})"
+                )
+            except CassetteException as e:
+                cassette_error = e
+
+        if network_metrics is not None:
+            driver.har_recorder.remove_listener(network_metrics.add_entry)
+            metrics_summary = network_metrics.summary()
+            request.node.user_properties.append(("network_metrics", metrics_summary))
+            _attach_network_metrics(metrics_summary)
+            total = metrics_summary["timings_ms"].get("total", {})
+            print(
+                f"📶 {metrics_summary['requests']} requests ({metrics_summary['failed']} failed), "
+                f"{metrics_summary['transfer_bytes'] / 1024:.0f} KB transferred, "
+                f"p95 {total.get('p95', 0):.0f} ms, max {total.get('max', 0):.0f} ms"
+            )
+
+        if har_recorder is not None:
+            har_path = har_recorder.stop()
+            request.node.user_properties.append(("har", har_path))
+            if getattr(request.node, "call_failed", False):
+                _attach_har(har_path)
+
+        # Report what the test's captured request storage held and evicted
+        capture_stats = DriverManager.get_capture_stats()
+        if capture_stats:
+            request.node.user_properties.append(("capture_storage", capture_stats))
+            if capture_stats["evicted_entries"] or capture_stats["evicted_bytes"] or capture_stats["truncated_bodies"]:
+                print(
+                    f"📦 Captured {capture_stats['stored']} requests: evicted {capture_stats['evicted_entries']} by count, "
+                    f"{capture_stats['evicted_bytes']} by size, truncated {capture_stats['truncated_bodies']} bodies, "
+                    f"peak {capture_stats['peak_bytes'] / (1024 * 1024):.1f} MB"
+                )
+    finally:
+        # Return the driver to the pool (quit when pooling is disabled), even when an artifact step fails
+        DriverManager.release_driver()
+
+    if cassette_error is not None:
+        raise cassette_error
+
+
+def _start_har_recording(driver, item):
+    """Start a HAR recording for a test when --har is set
+
+    Returns:
+        The driver's HarRecorder, or None if HAR export is off or the driver captures no traffic
+    """
+    from config.settings import Settings
+
+    har_config = Settings.get_har_config()
+    har_recorder = getattr(driver, "har_recorder", None)
+    if not har_config.enabled or har_recorder is None:
+        return None
+
+    worker_id = os.getenv("PYTEST_XDIST_WORKER", "main")
+    test_name = "".join(char if char.isalnum() or char in "-_." else "_" for char in item.nodeid)
+    har_recorder.start(os.path.join(har_config.har_dir, f"{test_name}_{worker_id}_{int(time.time() * 1000)}.har"))
+    return har_recorder
+
+
+def _start_network_metrics(driver):
+    """Start aggregating the test's request timings when --network-metrics is set
+
+    Returns:
+        NetworkMetrics listening to the driver's HarRecorder, or None if metrics are off or the driver captures no traffic
+    """
+    from config.settings import Settings
+    from core.network_metrics import NetworkMetrics
+
+    har_recorder = getattr(driver, "har_recorder", None)
+    if not Settings.get_network_metrics_config().enabled or har_recorder is None:
+        return None
+
+    network_metrics = NetworkMetrics.from_settings()
+    har_recorder.add_listener(network_metrics.add_entry)
+    return network_metrics
+
+
+def _start_cassette(driver, item):
+    """Start recording or replaying the test's GraphQL cassette when --cassette is set
+
+    Returns:
+        The driver's Cassette, or None if cassettes are off
+
+    Raises:
+        ConfigurationException: If the driver does not capture traffic through selenium-wire
+        CassetteException: If the cassette to replay is missing
+    """
+    from config.constants import CassetteConstants
+    from config.settings import Settings
+    from core.exceptions.framework_exceptions import ConfigurationException
+
+    cassette_config = Settings.get_cassette_config()
+    if cassette_config.mode == CassetteConstants.OFF:
+        return None
+
+    cassette = getattr(driver, "cassette", None)
+    if cassette is None:
+        raise ConfigurationException(
+            "GraphQL cassettes need the 'wire' network capture backend", {"cassette_mode": cassette_config.mode}
+        )
+
+    # Named after the test id (device included), so every worker and run uses the same cassette
+    test_name = "".join(char if char.isalnum() or char in "-_." else "_" for char in item.nodeid)
+    cassette.start(
+        cassette_config.mode,
+        os.path.join(cassette_config.cassette_dir, f"{test_name}{CassetteConstants.FILE_SUFFIX}"),
+    )
+    return cassette
+
+
+def _attach_har(har_path):
+    """Attach a finished HAR file to the Allure report if available"""
+    try:
+        import allure
+
+        allure.attach.file(har_path, name="Network Traffic (HAR)", attachment_type="application/json", extension="har")
+        print(f"🌐 HAR attached for failed test: {har_path}")
+    except ImportError:
+        pass  # Allure not available, skip attachment
+
+
+def _attach_network_metrics(metrics_summary):
+    """Attach a test's network metrics summary to the Allure report if available"""
+    try:
+        import allure
+
+        allure.attach(
+            json.dumps(metrics_summary, indent=2),
+            name="Network Metrics",
+            attachment_type=allure.attachment_type.JSON,
+        )
+    except ImportError:
+        pass  # Allure not available, skip attachment
+
+
+def pytest_generate_tests(metafunc):
+    """Run every test using the driver fixture once per device given with --devices"""
+    devices_option = metafunc.config.getoption("--devices")
+    if not devices_option or "driver" not in metafunc.fixturenames:
+        return
+
+    from core.device_emulation import DeviceCatalog
+
+    devices = [name.strip() for name in devices_option.split(",") if name.strip()]
+    for device in devices:
+        # Fail at collection time for devices missing from the catalog
+        DeviceCatalog.get(device)
+    metafunc.parametrize("driver", devices, indirect=True, ids=devices)
 
 
 def pytest_configure(config):
@@ -201,6 +644,100 @@ def pytest_configure(config):
     ):
         os.environ["SCREENSHOT_ON_FAILURE"] = "true"
 
+    # Driver pool settings
+    if hasattr(config.option, "no_driver_pool") and config.getoption("--no-driver-pool"):
+        os.environ["DRIVER_POOL"] = "false"
+
+    if getattr(config.option, "driver_pool_min", None) is not None:
+        os.environ["DRIVER_POOL_MIN_SIZE"] = str(config.getoption("--driver-pool-min"))
+
+    if getattr(config.option, "driver_pool_max", None) is not None:
+        os.environ["DRIVER_POOL_MAX_SIZE"] = str(config.getoption("--driver-pool-max"))
+
+    if getattr(config.option, "driver_pool_idle_timeout", None) is not None:
+        os.environ["DRIVER_POOL_IDLE_TIMEOUT"] = str(config.getoption("--driver-pool-idle-timeout"))
+
+    if getattr(config.option, "driver_prefetch", None) is not None:
+        os.environ["DRIVER_POOL_PREFETCH_DEPTH"] = str(config.getoption("--driver-prefetch"))
+
+    # Driver recycling thresholds
+    if getattr(config.option, "recycle_max_rss", None) is not None:
+        os.environ["DRIVER_RECYCLE_MAX_RSS_MB"] = str(config.getoption("--recycle-max-rss"))
+
+    if getattr(config.option, "recycle_max_age", None) is not None:
+        os.environ["DRIVER_RECYCLE_MAX_AGE"] = str(config.getoption("--recycle-max-age"))
+
+    if getattr(config.option, "recycle_max_tests", None) is not None:
+        os.environ["DRIVER_RECYCLE_MAX_TESTS"] = str(config.getoption("--recycle-max-tests"))
+
+    # Launch profile settings
+    if getattr(config.option, "launch_profile", None) is not None:
+        os.environ["LAUNCH_PROFILE"] = config.getoption("--launch-profile")
+
+    # Performance profile settings
+    if getattr(config.option, "performance_profile", None) is not None:
+        os.environ["PERFORMANCE_PROFILE"] = config.getoption("--performance-profile")
+
+    # Network capture settings
+    if getattr(config.option, "network_capture", None) is not None:
+        os.environ["NETWORK_CAPTURE"] = config.getoption("--network-capture")
+
+    # Captured request storage settings
+    if getattr(config.option, "capture_scope", None) is not None:
+        os.environ["CAPTURE_SCOPES"] = config.getoption("--capture-scope")
+
+    if getattr(config.option, "capture_storage", None) is not None:
+        os.environ["CAPTURE_STORAGE"] = config.getoption("--capture-storage")
+
+    if getattr(config.option, "capture_max_entries", None) is not None:
+        os.environ["CAPTURE_MAX_ENTRIES"] = str(config.getoption("--capture-max-entries"))
+
+    if getattr(config.option, "capture_max_mb", None) is not None:
+        os.environ["CAPTURE_MAX_MB"] = str(config.getoption("--capture-max-mb"))
+
+    if getattr(config.option, "capture_max_body_kb", None) is not None:
+        os.environ["CAPTURE_MAX_BODY_KB"] = str(config.getoption("--capture-max-body-kb"))
+
+    if hasattr(config.option, "asset_cache") and config.getoption("--asset-cache"):
+        os.environ["ASSET_CACHE"] = "true"
+
+    if getattr(config.option, "asset_cache_max_mb", None) is not None:
+        os.environ["ASSET_CACHE_MAX_MB"] = str(config.getoption("--asset-cache-max-mb"))
+
+    if hasattr(config.option, "har") and config.getoption("--har"):
+        os.environ["HAR_EXPORT"] = "true"
+
+    if hasattr(config.option, "network_metrics") and config.getoption("--network-metrics"):
+        os.environ["NETWORK_METRICS"] = "true"
+
+    # GraphQL cassette settings
+    if getattr(config.option, "cassette", None) is not None:
+        os.environ["CASSETTE_MODE"] = config.getoption("--cassette")
+
+    if getattr(config.option, "cassette_latency", None) is not None:
+        os.environ["CASSETTE_LATENCY_MS"] = str(config.getoption("--cassette-latency"))
+
+    # Browser context settings
+    if getattr(config.option, "driver_mode", None) is not None:
+        os.environ["DRIVER_MODE"] = config.getoption("--driver-mode")
+
+    if getattr(config.option, "max_browser_contexts", None) is not None:
+        os.environ["BROWSER_CONTEXT_MAX"] = str(config.getoption("--max-browser-contexts"))
+
+    # Locator settings
+    if getattr(config.option, "wait_engine", None) is not None:
+        os.environ["WAIT_ENGINE"] = config.getoption("--wait-engine")
+
+    if hasattr(config.option, "no_locator_stats") and config.getoption("--no-locator-stats"):
+        os.environ["LOCATOR_STATS"] = "false"
+
+    # Chrome profile settings
+    if hasattr(config.option, "no_profile_template") and config.getoption("--no-profile-template"):
+        os.environ["CHROME_PROFILE_TEMPLATE"] = "false"
+
+    if hasattr(config.option, "profile_tmpfs") and config.getoption("--profile-tmpfs"):
+        os.environ["CHROME_PROFILE_TMPFS"] = "true"
+
     # Set test timeout
     timeout = config.getoption("--test-timeout")
     os.environ["TEST_TIMEOUT"] = str(timeout)
@@ -210,6 +747,13 @@ def pytest_report_header(config):
     """Add custom header to pytest report"""
     environment = config.getoption("--env")
     headless = "Yes" if config.getoption("--headless") else "No"
+    driver_pool = "No" if config.getoption("--no-driver-pool") else "Yes"
+    network_capture = config.getoption("--network-capture") or os.getenv("NETWORK_CAPTURE", "wire")
+    driver_mode = config.getoption("--driver-mode") or os.getenv("DRIVER_MODE", "process")
+    launch_profile = config.getoption("--launch-profile") or os.getenv("LAUNCH_PROFILE", "default")
+    performance_profile = config.getoption("--performance-profile") or os.getenv("PERFORMANCE_PROFILE", "none")
+    cassette = config.getoption("--cassette") or os.getenv("CASSETTE_MODE", "off")
+    wait_engine = config.getoption("--wait-engine") or os.getenv("WAIT_ENGINE", "poll")
     timeout = config.getoption("--test-timeout")
 
     # Get environment info if available
@@ -224,6 +768,13 @@ def pytest_report_header(config):
         f"Environment: {environment}",
         f"Base URL: {base_url}",
         f"Headless Mode: {headless}",
+        f"Driver Pool: {driver_pool}",
+        f"Network Capture: {network_capture}",
+        f"Driver Mode: {driver_mode}",
+        f"Launch Profile: {launch_profile}",
+        f"Performance Profile: {performance_profile}",
+        f"GraphQL Cassette: {cassette}",
+        f"Wait Engine: {wait_engine}",
         f"Test Timeout: {timeout}s",
         f"Framework: Sporty Web Assignment Testing Framework",
     ]
@@ -232,6 +783,9 @@ def pytest_report_header(config):
 def pytest_runtest_makereport(item, call):
     """Hook to capture screenshots on test failure"""
     if call.when == "call" and call.excinfo is not None:
+        # Lets fixtures attach failure artifacts (HAR) during teardown
+        item.call_failed = True
+
         # Test failed, try to capture screenshot
         try:
             from core.driver_manager import DriverManager
@@ -275,6 +829,14 @@ def pytest_runtest_makereport(item, call):
             print(f"\n⚠️  Failed to capture screenshot on failure: {e}")
 
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Collect metrics snapshots sent by xdist workers when they shut down"""
+    metrics = getattr(node, "workeroutput", {}).get("sporty_metrics")
+    if metrics:
+        _worker_metrics.append(json.loads(metrics))
+
+
 def pytest_sessionfinish(session, exitstatus):
     """Called after whole test run finished, right before returning the exit status to the system"""
 
@@ -287,6 +849,36 @@ def pytest_sessionfinish(session, exitstatus):
     except Exception as e:
         print(f"\n⚠️  Warning: Error during driver cleanup: {e}")
 
+    # Report framework metrics (xdist workers hand theirs to the controller)
+    try:
+        from config.settings import Settings
+        from utils.reporters.metrics_reporter import MetricsReporter
+
+        if hasattr(session.config, "workeroutput"):
+            session.config.workeroutput["sporty_metrics"] = json.dumps(MetricsReporter.export())
+        else:
+            exports = _worker_metrics or [MetricsReporter.export()]
+            for line in MetricsReporter.summarize(exports):
+                print(line)
+
+            records_file = MetricsReporter.write_startup_records(exports, Settings.get_report_config().report_dir)
+            if records_file:
+                print(f"📄 Driver startup records: {records_file}")
+    except Exception as e:
+        print(f"\n⚠️  Warning: Error reporting session metrics: {e}")
+
+    # Persist which fallback locators matched; the controller reports lists needing attention
+    try:
+        from core.locator_stats import LocatorStats
+
+        if LocatorStats.is_enabled():
+            LocatorStats.flush()
+            if not hasattr(session.config, "workeroutput"):
+                for line in LocatorStats.summarize(since=_session_started):
+                    print(line)
+    except Exception as e:
+        print(f"\n⚠️  Warning: Error saving locator statistics: {e}")
+
     config = session.config
 
     # Check if both --allure-report and --open-allure flags are set
@@ -0,0 +1,274 @@
+"""
+Asset Cache - Disk cache of immutable static assets shared by all workers
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from seleniumwire.utils import decode
+
+from config.constants import AssetCacheConstants
+from core.interceptors import InterceptorChain
+from utils.locks.file_lock import FileLock
+
+
+@dataclass
+class AssetCacheStats:
+    """Counters of static asset lookups and cache maintenance"""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    bytes_saved: int = 0  # Bytes served from disk instead of the network
+    bytes_stored: int = 0
+    evictions: int = 0
+    evicted_bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of asset requests answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary"""
+        return asdict(self)
+
+
+class AssetCache:
+    """Serves content-hashed static assets (JS bundles, fonts, images) from a shared disk cache
+
+    A fresh Chrome profile downloads Twitch's bundles again for every driver.
+    Assets whose URL marks them immutable are stored once, in a directory shared
+    by all workers, and answered from disk in the selenium-wire request hook
+    afterwards, so they never leave the proxy. Each asset is one file holding a
+    JSON header line (status and headers) followed by the decoded body; the
+    proxy encodes the body of a created response according to its
+    Content-Encoding header, so assets are stored and served without one.
+    Files are written atomically and their modification time is bumped on
+    every hit. When the cache outgrows its cap,
+    the least recently used files are evicted under a cross-process lock.
+    """
+
+    _stats_lock = threading.Lock()
+    _totals = AssetCacheStats()
+
+    def __init__(self, cache_dir: str, max_mb: float, url_patterns: List[str] = AssetCacheConstants.ASSET_URL_PATTERNS):
+        """Initialize the cache
+
+        Args:
+            cache_dir: Directory shared by all workers (created if missing)
+            max_mb: Size cap of the cache in MB (0 disables eviction)
+            url_patterns: Regular expressions of immutable asset URLs
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._patterns = [re.compile(pattern) for pattern in url_patterns]
+        self._unchecked_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls) -> "AssetCache":
+        """Create a cache in the directory and with the size cap configured for this run"""
+        from config.settings import Settings
+        from core.chromedriver_cache import ChromeDriverCache
+
+        cache_config = Settings.get_asset_cache_config()
+        cache_dir = cache_config.cache_dir or os.path.join(
+            ChromeDriverCache.get_cache_dir(), AssetCacheConstants.CACHE_DIR_NAME
+        )
+        return cls(os.path.expanduser(cache_dir), cache_config.max_mb)
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "AssetCache":
+        """Serve and store a selenium-wire driver's static assets through its interceptor chain
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            AssetCache: Cache exposed as driver.asset_cache
+        """
+        cache = cls.from_settings()
+        chain = InterceptorChain.install(driver)
+        chain.add_request_hook(cache._on_request)
+        chain.add_response_hook(cache._on_response)
+        driver.asset_cache = cache
+        return cache
+
+    @classmethod
+    def get_totals(cls) -> Dict[str, Any]:
+        """Get this process's cache counters"""
+        with cls._stats_lock:
+            return cls._totals.as_dict()
+
+    def is_asset_url(self, url: str) -> bool:
+        """Check whether a URL names an immutable static asset"""
+        return any(pattern.search(url) for pattern in self._patterns)
+
+    def lookup(self, url: str) -> Optional[Tuple[int, List[Tuple[str, str]], bytes]]:
+        """Read a cached asset
+
+        Args:
+            url: Asset URL
+
+        Returns:
+            Status code, headers and body, or None if the asset is not cached
+        """
+        path = self._path(url)
+        try:
+            with open(path, "rb") as asset_file:
+                header = json.loads(asset_file.readline())
+                body = asset_file.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            # Unreadable entry: drop it and fetch the asset again
+            self._remove(path)
+            return None
+
+        if header.get("version") != AssetCacheConstants.FORMAT_VERSION:
+            # Written in an older layout: drop it and fetch the asset again
+            self._remove(path)
+            return None
+        if header.get("url") != url or len(body) != header.get("size"):
+            return None
+        try:
+            # Least recently used order follows the modification time
+            os.utime(path)
+        except OSError:
+            pass
+        return header["status"], [tuple(pair) for pair in header["headers"]], body
+
+    def store(self, url: str, status_code: int, headers: List[Tuple[str, str]], body: bytes) -> None:
+        """Write an asset to the cache, evicting old assets when the cache outgrew its cap
+
+        Args:
+            url: Asset URL
+            status_code: HTTP status code
+            headers: Response headers; encoding and length headers are not stored
+            body: Decoded response body
+        """
+        path = self._path(url)
+        header = {
+            "version": AssetCacheConstants.FORMAT_VERSION,
+            "url": url,
+            "status": status_code,
+            "headers": [
+                [name, value] for name, value in headers if name.lower() not in AssetCacheConstants.SKIPPED_HEADERS
+            ],
+            "size": len(body),
+        }
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, "wb") as asset_file:
+                asset_file.write(json.dumps(header).encode("utf-8") + b"\n")
+                asset_file.write(body)
+            os.replace(temp_path, path)
+        except OSError as e:
+            self._remove(temp_path)
+            print(f"Warning: Failed to cache asset {url}: {e}")
+            return
+
+        with self._stats_lock:
+            self._totals.stores += 1
+            self._totals.bytes_stored += len(body)
+
+        with self._lock:
+            self._unchecked_bytes += len(body)
+            check = self.max_bytes and self._unchecked_bytes >= self.max_bytes * AssetCacheConstants.EVICTION_CHECK_RATIO
+            if check:
+                self._unchecked_bytes = 0
+        if check:
+            self.evict()
+
+    def evict(self) -> int:
+        """Evict least recently used assets until the cache is back under its cap
+
+        Returns:
+            int: Number of evicted assets
+        """
+        if not self.max_bytes:
+            return 0
+
+        lock_file = os.path.join(self.cache_dir, AssetCacheConstants.LOCK_FILE)
+        with FileLock(lock_file, timeout=AssetCacheConstants.LOCK_TIMEOUT):
+            entries = []
+            with os.scandir(self.cache_dir) as scan:
+                for entry in scan:
+                    if entry.name.endswith(AssetCacheConstants.FILE_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return 0
+
+            target = self.max_bytes * AssetCacheConstants.EVICT_TO_RATIO
+            evicted = evicted_bytes = 0
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                if self._remove(path):
+                    total -= size
+                    evicted += 1
+                    evicted_bytes += size
+
+        with self._stats_lock:
+            self._totals.evictions += evicted
+            self._totals.evicted_bytes += evicted_bytes
+        return evicted
+
+    def _on_request(self, request) -> None:
+        if request.method != "GET" or not self.is_asset_url(request.url):
+            return
+
+        cached = self.lookup(request.url)
+        with self._stats_lock:
+            if cached is None:
+                self._totals.misses += 1
+            else:
+                self._totals.hits += 1
+                self._totals.bytes_saved += len(cached[2])
+        if cached is not None:
+            status_code, headers, body = cached
+            request.create_response(
+                status_code=status_code, headers=headers + [(AssetCacheConstants.HIT_HEADER, "hit")], body=body
+            )
+
+    def _on_response(self, request, response) -> None:
+        if request.method != "GET" or response.status_code != 200 or not self.is_asset_url(request.url):
+            return
+        if AssetCacheConstants.HIT_HEADER in response.headers:
+            # Served from the cache
+            return
+
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return
+        try:
+            body = decode(response.body, response.headers.get("Content-Encoding", "identity"))
+        except ValueError:
+            return
+        self.store(request.url, response.status_code, list(response.headers.items()), body)
+
+    def _path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}{AssetCacheConstants.FILE_SUFFIX}")
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -3,18 +3,23 @@ Base page class for Web automation using Page Object Model
 """
 
 import time
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 from selenium.common.exceptions import (NoSuchElementException,
+                                        StaleElementReferenceException,
                                         TimeoutException, WebDriverException)
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from config.settings import Settings
-from config.constants import ReportConstants
-from core.exceptions.framework_exceptions import (ElementNotFoundException,
+from config.constants import GraphQLConstants, LocatorConstants, ReportConstants
+from core.exceptions.framework_exceptions import (ConfigurationException,
+                                                  ElementNotFoundException,
                                                   PageNotFoundException)
+from core.element_query import ElementQuery, ElementSnapshot
+from core.graphql_index import GraphQLExchange
+from core.locator_race import LocatorMatch, LocatorRace
+from core.locator_stats import LocatorStats
 from utils.loggers.logger import Logger
 
 
@@ -25,6 +30,7 @@ class BasePage:
         self.driver = driver
         self.wait = WebDriverWait(self.driver, Settings.BROWSER.explicit_wait)
         self.logger = Logger.get_logger(self.__class__.__name__)
+        self.last_locator_match: Optional[LocatorMatch] = None
 
     def navigate_to(self, url: str) -> None:
         """Navigate to a specific URL
@@ -57,11 +63,11 @@ class BasePage:
         """Find a single element with explicit wait
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Optional timeout override
 
         Returns:
-            WebElement: The first element found
+            WebElement: The first element of the first locator found
 
         Raises:
             ElementNotFoundException: If no element is found with any of the provided locators
@@ -73,18 +79,10 @@ class BasePage:
             raise ElementNotFoundException([], "No locators provided")
 
         wait_time = timeout or Settings.BROWSER.explicit_wait
-        wait = WebDriverWait(self.driver, wait_time)
-
-        for i, loc in enumerate(locators):
-            try:
-                return wait.until(EC.presence_of_element_located(loc))
-            except TimeoutException:
-                # If this is not the last locator, continue trying
-                if i < len(locators) - 1:
-                    continue
-
-        # If we get here, all locators failed
-        raise ElementNotFoundException(locators, timeout=wait_time)
+        match = self.race_locators(locators, LocatorConstants.PRESENT, wait_time)
+        if match is None:
+            raise ElementNotFoundException(locators, timeout=wait_time)
+        return match.element
 
     def find_elements(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]], timeout: int = 5
@@ -92,11 +90,11 @@ class BasePage:
         """Find multiple elements
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Optional timeout override
 
         Returns:
-            List[WebElement]: List of elements found (empty if none found)
+            List[WebElement]: Elements of the first locator found (empty if none found)
         """
         # Convert single locator to list for uniform handling
         locators = [locator] if isinstance(locator, tuple) else locator
@@ -105,16 +103,8 @@ class BasePage:
             return []
 
         wait_time = timeout or Settings.BROWSER.explicit_wait
-        wait = WebDriverWait(self.driver, wait_time)
-
-        for loc in locators:
-            try:
-                wait.until(EC.presence_of_element_located(loc))
-                return self.driver.find_elements(*loc)
-            except TimeoutException:
-                continue
-
-        return []
+        match = self.race_locators(locators, LocatorConstants.PRESENT, wait_time)
+        return match.elements if match is not None else []
 
     def click_element(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]], timeout: int = 5
@@ -122,7 +112,7 @@ class BasePage:
         """Click an element with explicit wait
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Optional timeout override
 
         Raises:
@@ -137,22 +127,128 @@ class BasePage:
             )
 
         wait_time = timeout or Settings.BROWSER.explicit_wait
-        wait = WebDriverWait(self.driver, wait_time)
-
-        for i, loc in enumerate(locators):
-            try:
-                element = wait.until(EC.element_to_be_clickable(loc))
-                element.click()
-                return
-            except TimeoutException:
-                # If this is not the last locator, continue trying
-                if i < len(locators) - 1:
-                    continue
-
-        # If we get here, all locators failed
-        raise ElementNotFoundException(
-            locators, "Clickable element not found", wait_time
+        match = self.race_locators(locators, LocatorConstants.CLICKABLE, wait_time)
+        if match is None:
+            raise ElementNotFoundException(
+                locators, "Clickable element not found", wait_time
+            )
+        match.element.click()
+
+    def race_locators(
+        self,
+        locators: List[Tuple[str, str]],
+        condition: str,
+        timeout: float,
+        text: str = "",
+    ) -> Optional[LocatorMatch]:
+        """Wait until any fallback locator meets a condition, checking all of them on every poll
+
+        All locators are evaluated in one script call per poll and the first one
+        in list order that meets the condition wins, so a stale primary locator
+        no longer costs a full timeout before its fallbacks are tried. The
+        winner is kept in last_locator_match and logged when it is not the
+        preferred locator. With locator statistics enabled, every outcome is
+        recorded and lists with enough history are tried in the order of their
+        recent matches instead of their declared order. The WAIT_ENGINE setting
+        selects polling or an in-browser MutationObserver.
+
+        Args:
+            locators: Locator tuples (strategy, value) in order of preference
+            condition: One of LocatorConstants.CONDITIONS (present, visible, clickable, invisible, text)
+            timeout: Maximum seconds to wait
+            text: Text the first element must contain (text condition)
+
+        Returns:
+            Optional[LocatorMatch]: The winning locator, or None if the timeout expired
+        """
+        page = self.__class__.__name__
+        # Waits for elements to disappear say nothing about which locator is current
+        tracked = condition != LocatorConstants.INVISIBLE and LocatorStats.is_enabled()
+        order = LocatorStats.order(page, locators) if tracked else list(range(len(locators)))
+
+        result = LocatorRace.wait(
+            self.driver,
+            [locators[index] for index in order],
+            condition,
+            timeout,
+            text=text,
+            engine=Settings.get_locator_config().wait_engine,
+        )
+        match = result.match
+        if match is not None:
+            # Report positions in the declared list, not in the tried order
+            match.index = order[match.index]
+            match.matched = [order[index] for index in match.matched]
+        self.last_locator_match = match
+        if tracked:
+            LocatorStats.record(
+                page,
+                locators,
+                match.index if match else None,
+                match.elapsed if match else timeout,
+                matched=match.matched if match else None,
+            )
+
+        for index, error in result.errors.items():
+            self.logger.warning(f"[Locator] Could not evaluate {locators[order[index]]}: {error}")
+        if match is not None and match.index != order[0]:
+            self.logger.info(
+                f"[Locator] Fallback #{match.index} {match.locator} was {condition} after {match.elapsed:.2f}s; "
+                f"preferred locator {locators[order[0]]} was not"
+            )
+        return match
+
+    def query_elements(
+        self,
+        locator: Union[Tuple[str, str], List[Tuple[str, str]]],
+        attributes: Optional[List[str]] = None,
+        timeout: int = 5,
+    ) -> List[ElementSnapshot]:
+        """Get all matching elements with their geometry, visibility, text and attributes in one round trip
+
+        Use instead of per-element WebElement calls (is_displayed, location,
+        is_element_within_viewport, get_attribute) when filtering or ranking a
+        list of elements: every property of every element is read by one
+        in-browser script. Waits until the locator matches any element.
+
+        Args:
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples
+            attributes: Attribute names to read from every element, e.g. ["href", "aria-label"]
+            timeout: Maximum seconds to wait for a matching element
+
+        Returns:
+            List[ElementSnapshot]: Snapshots in document order (empty if nothing matched in time)
+
+        Example:
+            links = [link for link in self.query_elements(self.STREAMER_LINK, ["href"]) if link.topmost]
+        """
+        # Convert single locator to list for uniform handling
+        locators = [locator] if isinstance(locator, tuple) else locator
+
+        if not locators:
+            return []
+
+        errors = {}
+
+        def query(_driver):
+            _, snapshots, query_errors = ElementQuery.query(self.driver, locators, attributes)
+            errors.update(query_errors)
+            return snapshots or False
+
+        wait = WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=LocatorConstants.POLL_FREQUENCY,
+            ignored_exceptions=(StaleElementReferenceException,),
         )
+        try:
+            snapshots = wait.until(query)
+        except TimeoutException:
+            snapshots = []
+
+        for index, error in errors.items():
+            self.logger.warning(f"[Locator] Could not evaluate {locators[index]}: {error}")
+        return snapshots
 
     def send_keys(
         self,
@@ -163,7 +259,7 @@ class BasePage:
         """Send keys to an element
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples
             text: Text to send to the element
             clear_first: Whether to clear the element before sending keys
         """
@@ -176,7 +272,7 @@ class BasePage:
         """Get text from an element
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples
 
         Returns:
             str: Text content of the element
@@ -190,7 +286,7 @@ class BasePage:
         """Get attribute value from an element
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples
             attribute: Name of the attribute to get
 
         Returns:
@@ -205,7 +301,7 @@ class BasePage:
         """Check if element is present
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Timeout for the check
 
         Returns:
@@ -217,16 +313,7 @@ class BasePage:
         if not locators:
             return False
 
-        wait = WebDriverWait(self.driver, timeout)
-
-        for loc in locators:
-            try:
-                wait.until(EC.presence_of_element_located(loc))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.PRESENT, timeout) is not None
 
     def is_element_not_present(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]], timeout: int = 5
@@ -234,7 +321,7 @@ class BasePage:
         """Check if element is not present
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Timeout for the check
 
         Returns:
@@ -246,16 +333,7 @@ class BasePage:
         if not locators:
             return True
 
-        wait = WebDriverWait(self.driver, timeout)
-
-        for loc in locators:
-            try:
-                wait.until(EC.invisibility_of_element_located(loc))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.INVISIBLE, timeout) is not None
 
     def is_element_visible(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]], timeout: int = 5
@@ -263,7 +341,7 @@ class BasePage:
         """Check if element is visible
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Timeout for the check
 
         Returns:
@@ -275,16 +353,7 @@ class BasePage:
         if not locators:
             return False
 
-        wait = WebDriverWait(self.driver, timeout)
-
-        for loc in locators:
-            try:
-                wait.until(EC.visibility_of_element_located(loc))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.VISIBLE, timeout) is not None
 
     def is_element_clickable(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]], timeout: int = 5
@@ -292,7 +361,7 @@ class BasePage:
         """Check if element is clickable
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Timeout for the check
 
         Returns:
@@ -304,16 +373,7 @@ class BasePage:
         if not locators:
             return False
 
-        wait = WebDriverWait(self.driver, timeout)
-
-        for loc in locators:
-            try:
-                wait.until(EC.element_to_be_clickable(loc))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.CLICKABLE, timeout) is not None
 
     def wait_for_text(
         self,
@@ -324,7 +384,7 @@ class BasePage:
         """Wait for specific text in element
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             text: Text to wait for
             timeout: Timeout for the wait
 
@@ -338,16 +398,7 @@ class BasePage:
             return False
 
         wait_time = timeout or Settings.BROWSER.explicit_wait
-        wait = WebDriverWait(self.driver, wait_time)
-
-        for loc in locators:
-            try:
-                wait.until(EC.text_to_be_present_in_element(loc, text))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.TEXT, wait_time, text=text) is not None
 
     def wait_for_element_to_disappear(
         self,
@@ -357,7 +408,7 @@ class BasePage:
         """Wait for element to disappear
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples, raced in one wait
             timeout: Timeout for the wait
 
         Returns:
@@ -370,16 +421,7 @@ class BasePage:
             return False
 
         wait_time = timeout or Settings.BROWSER.explicit_wait
-        wait = WebDriverWait(self.driver, wait_time)
-
-        for loc in locators:
-            try:
-                wait.until(EC.invisibility_of_element_located(loc))
-                return True
-            except TimeoutException:
-                continue
-
-        return False
+        return self.race_locators(locators, LocatorConstants.INVISIBLE, wait_time) is not None
 
     def scroll_to_element(
         self, locator: Union[Tuple[str, str], List[Tuple[str, str]]]
@@ -387,7 +429,7 @@ class BasePage:
         """Scroll to an element
 
         Args:
-            locator: Single locator tuple (strategy, value) or list of locator tuples to try in sequence
+            locator: Single locator tuple (strategy, value) or list of fallback locator tuples
         """
         element = self.find_element(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
@@ -538,66 +580,94 @@ class BasePage:
         except TimeoutException:
             return False
 
-    def wait_for_network_idle(self, timeout: int = 7, idle_time: float = 1.5) -> bool:
-        """Wait for network activity to become idle (no new requests)
+    def wait_for_network_idle(self, timeout: int = 7, idle_time: Optional[float] = None) -> bool:
+        """Wait for network activity to become idle (no requests in flight)
 
-        This method waits for network requests to stop, which is much more efficient
-        than continuously polling for specific data. Requires selenium-wire for network monitoring.
+        Requests are tracked as they start and finish, so the wait returns as
+        soon as the last outstanding request completes and the network stays
+        quiet for idle_time. Long-polling and streaming URLs matching
+        NETWORK_IDLE_IGNORE never block idle. Requires a network capture backend
+        (selenium-wire or DevTools); without one only the idle window is waited.
 
         Args:
             timeout: Maximum time to wait for network to become idle
-            idle_time: How long the network must be idle before considering it settled
+            idle_time: How long no request may be in flight before considering the network settled
+                (defaults to NETWORK_IDLE_TIME)
 
         Returns:
             bool: True if network became idle, False if timeout occurred
 
         Example:
             # Wait for API requests to complete before proceeding
-            if self.wait_for_network_idle(timeout=10, idle_time=2.0):
+            if self.wait_for_network_idle(timeout=10, idle_time=0.5):
                 # Now process the results or continue with test
                 self.process_search_results()
         """
-        def log(message: str):
-            self.logger.info(f"[Network Idle] {message}")
-
-        start_time = time.time()
-        last_request_count = 0
-        idle_start_time = None
-
-        log(f"Starting network idle monitoring (timeout={timeout}s, idle_time={idle_time}s)")
-
-        while time.time() - start_time < timeout:
-            try:
-                # Get current number of requests
-                current_requests = len(getattr(self.driver, 'requests', []))
-                current_time = time.time()
-                elapsed_time = current_time - start_time
-
-                if current_requests > last_request_count:
-                    # New requests detected, reset idle timer
-                    new_requests = current_requests - last_request_count
-                    log(f"[{elapsed_time:.1f}s] New requests detected: {new_requests} new, total: {current_requests}")
-                    idle_start_time = None
-                elif current_requests == last_request_count:
-                    # No new requests, start or continue idle timer
-                    if idle_start_time is None:
-                        idle_start_time = current_time
-                        log(f"[{elapsed_time:.1f}s] Network became stable, starting idle timer (current requests: {current_requests})")
-                    elif current_time - idle_start_time >= idle_time:
-                        # Network has been idle for the required time
-                        log(f"[{elapsed_time:.1f}s] Network idle for {idle_time}s - considering settled (total requests: {current_requests})")
-                        return True
-                    else:
-                        idle_duration = current_time - idle_start_time
-                        log(f"[{elapsed_time:.1f}s] Network stable for {idle_duration:.1f}s (need {idle_time}s total, requests: {current_requests})")
-
-                last_request_count = current_requests
-                time.sleep(0.5)
-
-            except Exception as e:
-                log(f"Error during network monitoring: {e}")
-                time.sleep(0.5)
-
-        total_time = time.time() - start_time
-        log(f"[{total_time:.1f}s] Network idle monitoring timed out after {timeout}s (final requests: {last_request_count})")
-        return False
+        if idle_time is None:
+            idle_time = Settings.get_network_idle_config().idle_time
+
+        activity = getattr(self.driver, "network_activity", None)
+        if activity is None:
+            self.logger.info(f"[Network Idle] No network capture on this driver, waiting {idle_time}s")
+            time.sleep(idle_time)
+            return True
+
+        start_time = time.monotonic()
+        settled = activity.wait_for_idle(timeout, idle_time)
+        elapsed = time.monotonic() - start_time
+
+        summary = (
+            f"{activity.started} started, {activity.finished} finished, "
+            f"{activity.in_flight} in flight, {activity.ignored} ignored"
+        )
+        if settled:
+            self.logger.info(f"[Network Idle] Settled after {elapsed:.2f}s ({summary})")
+        else:
+            self.logger.info(f"[Network Idle] Timed out after {timeout}s ({summary})")
+        return settled
+
+    def wait_for_graphql(
+        self,
+        operation_name: str,
+        predicate: Optional[Callable[[GraphQLExchange], bool]] = None,
+        timeout: float = GraphQLConstants.DEFAULT_TIMEOUT,
+    ) -> Any:
+        """Wait for a GraphQL operation to complete and return its parsed response
+
+        Returns as soon as a matching exchange is captured (including one that
+        completed before the call), instead of waiting for the network to go idle.
+        Batched requests are split per operation. Requires a network capture
+        backend (selenium-wire or DevTools).
+
+        Args:
+            operation_name: GraphQL operationName, e.g. "SearchTray_SearchSuggestions"
+            predicate: Optional check on the GraphQLExchange, e.g. on its variables
+            timeout: Maximum seconds to wait
+
+        Returns:
+            Any: Parsed JSON response of the operation ({"data": ..., "errors": ...})
+
+        Raises:
+            core.exceptions.TimeoutException: If the operation does not complete within the timeout
+            ConfigurationException: If the driver has no network capture
+
+        Example:
+            results = self.wait_for_graphql(
+                "SearchTray_SearchSuggestions",
+                predicate=lambda exchange: exchange.variables.get("queryFragment") == "Starcraft II",
+            )
+        """
+        index = getattr(self.driver, "graphql", None)
+        if index is None:
+            raise ConfigurationException(
+                "Waiting for GraphQL operations needs the 'wire' or 'cdp' network capture backend",
+                {"operation": operation_name},
+            )
+
+        start_time = time.monotonic()
+        exchange = index.wait_for(operation_name, predicate, timeout)
+        self.logger.info(
+            f"[GraphQL] {operation_name} completed after {time.monotonic() - start_time:.2f}s "
+            f"(HTTP {exchange.status_code}, {len(exchange.errors)} errors)"
+        )
+        return exchange.response
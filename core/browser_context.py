@@ -0,0 +1,166 @@
+"""
+Browser Context Host - Isolated CDP browser contexts sharing one Chrome process
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+from selenium.webdriver.remote.command import Command
+
+from core.cdp_network import CdpCaptureMixin
+from core.driver_timing import StartupTimer
+from core.exceptions.framework_exceptions import DriverException
+
+
+class ContextDriver(webdriver.Remote):
+    """WebDriver session attached to a Chrome process already owned by a host driver
+
+    Quitting the session leaves the browser running; the browser context it drives
+    is disposed by the BrowserContextHost.
+    """
+
+    def __init__(self, service_url: str, options):
+        super().__init__(
+            command_executor=ChromiumRemoteConnection(service_url, "goog", "chrome"),
+            options=options,
+        )
+
+    def get_log(self, log_type: str) -> List[Dict[str, Any]]:
+        """Gets the log for a given log type"""
+        return self.execute(Command.GET_LOG, {"type": log_type})["value"]
+
+    def execute_cdp_cmd(self, cmd: str, cmd_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a DevTools command on the session's page target (emulation, throttling)"""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class CdpCaptureContextDriver(CdpCaptureMixin, ContextDriver):
+    """Context driver exposing captured requests from DevTools Network events"""
+
+
+@dataclass
+class BrowserContext:
+    """An isolated browser context and the WebDriver session driving its page"""
+
+    context_id: str
+    target_id: str
+    driver: Any
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class BrowserContextHost:
+    """Runs every test in its own browser context inside one shared Chrome process
+
+    A browser context has its own cookies, storage, cache and service workers, like
+    an incognito window, so disposing it gives the next test a clean slate without
+    relaunching Chrome or resetting state. Each context gets a page target and a
+    WebDriver session attached to that target.
+    """
+
+    def __init__(self, driver, attach: Callable[[Any, str], Any], max_contexts: int, label: str = "context"):
+        """Initialize the host
+
+        Args:
+            driver: Host WebDriver owning the Chrome process
+            attach: Callable returning a WebDriver session attached to a target id of the host browser
+            max_contexts: Maximum number of contexts open at the same time
+            label: Label used for context startup timing records
+        """
+        self.driver = driver
+        self.max_contexts = max_contexts
+        self._attach = attach
+        self._label = label
+        self._contexts: Dict[str, BrowserContext] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @property
+    def open_contexts(self) -> int:
+        """Number of contexts currently open"""
+        with self._lock:
+            return len(self._contexts)
+
+    def open(self) -> BrowserContext:
+        """Create a browser context with a blank page and attach a WebDriver session to it
+
+        Returns:
+            BrowserContext: Newly created context
+
+        Raises:
+            DriverException: If the host is closed, full or the context cannot be created
+        """
+        timer = StartupTimer(self._label)
+
+        with self._lock:
+            if self._closed:
+                raise DriverException("Browser context host is closed")
+            if len(self._contexts) >= self.max_contexts:
+                raise DriverException(
+                    f"Browser context limit of {self.max_contexts} reached",
+                    {"max_contexts": self.max_contexts},
+                )
+
+            with timer.phase("context_creation"):
+                context_id = self.driver.execute_cdp_cmd("Target.createBrowserContext", {})["browserContextId"]
+            with timer.phase("target_creation"):
+                try:
+                    target_id = self.driver.execute_cdp_cmd(
+                        "Target.createTarget", {"url": "about:blank", "browserContextId": context_id}
+                    )["targetId"]
+                except Exception:
+                    self._dispose(context_id)
+                    raise
+
+            # Reserve the slot before attaching, attaching runs outside the lock
+            context = BrowserContext(context_id=context_id, target_id=target_id, driver=None)
+            self._contexts[context_id] = context
+
+        try:
+            with timer.phase("session_attach"):
+                context.driver = self._attach(self.driver, target_id)
+        except Exception as e:
+            with self._lock:
+                self._contexts.pop(context_id, None)
+                self._dispose(context_id)
+            raise DriverException(f"Failed to attach to browser context: {e}", {"context_id": context_id})
+
+        timer.finish()
+        return context
+
+    def close_context(self, context: BrowserContext) -> None:
+        """End a context's WebDriver session and dispose the context with all its state
+
+        Args:
+            context: Context previously returned by open()
+        """
+        if context.driver is not None:
+            try:
+                context.driver.quit()
+            except Exception as e:
+                print(f"Warning: Error ending browser context session '{context.context_id}': {e}")
+
+        with self._lock:
+            if self._contexts.pop(context.context_id, None) is not None and not self._closed:
+                self._dispose(context.context_id)
+
+    def close(self) -> None:
+        """Dispose all open contexts; the host driver itself is left to its owner"""
+        with self._lock:
+            contexts = list(self._contexts.values())
+
+        for context in contexts:
+            self.close_context(context)
+
+        with self._lock:
+            self._closed = True
+
+    def _dispose(self, context_id: str) -> None:
+        """Dispose a browser context, closing its pages (caller holds the lock)"""
+        try:
+            self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception as e:
+            print(f"Warning: Error disposing browser context '{context_id}': {e}")
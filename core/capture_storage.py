@@ -0,0 +1,246 @@
+"""
+Capture Storage - Bounded, scoped request storage for selenium-wire drivers
+"""
+
+import os
+import re
+import shutil
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from seleniumwire.storage import InMemoryRequestStorage, RequestStorage
+
+from config.constants import CaptureStorageConstants
+from core.exceptions.framework_exceptions import ConfigurationException
+
+
+@dataclass
+class CaptureStats:
+    """Storage counters of captured requests"""
+
+    stored: int = 0
+    evicted_entries: int = 0  # Oldest requests dropped to stay under the entry limit
+    evicted_bytes: int = 0  # Oldest requests dropped to stay under the byte limit
+    truncated_bodies: int = 0
+    stored_bytes: int = 0  # Bytes currently held
+    peak_bytes: int = 0
+
+    @property
+    def evicted(self) -> int:
+        """Requests evicted for any reason"""
+        return self.evicted_entries + self.evicted_bytes
+
+    def merge(self, other: "CaptureStats") -> None:
+        """Add another set of counters to this one (peaks are maxed)"""
+        self.stored += other.stored
+        self.evicted_entries += other.evicted_entries
+        self.evicted_bytes += other.evicted_bytes
+        self.truncated_bodies += other.truncated_bodies
+        self.stored_bytes = other.stored_bytes
+        self.peak_bytes = max(self.peak_bytes, other.peak_bytes)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary"""
+        return asdict(self)
+
+
+class _BoundedStorageMixin(ABC):
+    """Ring buffer bookkeeping shared by the memory and disk storages
+
+    Sizes are tracked per request id in arrival order. After every save the
+    oldest requests are evicted until the entry and byte limits hold again;
+    the newest request is always kept. selenium-wire saves the response of a
+    mocked request twice, so a saved response replaces the size of the previous
+    one instead of adding to it. Bodies above the body cap are stored truncated
+    (after selenium-wire has already forwarded the full body).
+
+    Capture scopes are applied here rather than through driver.scopes, which
+    would also hide out-of-scope traffic from the interceptors (network idle
+    tracking, asset cache, HAR, metrics). Out-of-scope requests still get an id,
+    so selenium-wire runs the response interceptors for them, but neither they
+    nor their responses are stored.
+    """
+
+    def _init_bounds(self, max_entries: int, max_bytes: int, max_body_bytes: int, scopes: List[str] = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_body_bytes = max_body_bytes
+        self.scopes = [re.compile(scope) for scope in scopes or []]
+        self.capture_stats = CaptureStats()
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._response_sizes: Dict[str, int] = {}
+        self._bounds_lock = threading.Lock()
+
+    def in_scope(self, url: str) -> bool:
+        """Check whether a URL matches the capture scopes (no scopes matches everything)"""
+        return not self.scopes or any(scope.search(url) for scope in self.scopes)
+
+    def save_request(self, request) -> None:
+        if not self.in_scope(request.url):
+            # selenium-wire only runs the response interceptors for requests with an id
+            request.id = str(uuid.uuid4())
+            return
+        request.body = self._cap_body(request.body)
+        super().save_request(request)
+        self._account(request.id, len(request.url) + len(request.body), new=True)
+
+    def save_response(self, request_id: str, response) -> None:
+        if not self._is_stored(request_id):
+            # Out of scope or already evicted, nothing to attach the response to
+            return
+        response.body = self._cap_body(response.body)
+        super().save_response(request_id, response)
+        self._account(request_id, len(response.body), response=True)
+
+    def save_ws_message(self, request_id: str, message) -> None:
+        if self._is_stored(request_id):
+            super().save_ws_message(request_id, message)
+
+    def clear_requests(self) -> None:
+        super().clear_requests()
+        with self._bounds_lock:
+            self._sizes.clear()
+            self._response_sizes.clear()
+            self.capture_stats.stored_bytes = 0
+
+    def take_stats(self) -> CaptureStats:
+        """Get the counters collected since the last call and start new ones"""
+        with self._bounds_lock:
+            stats = self.capture_stats
+            self.capture_stats = CaptureStats(stored_bytes=stats.stored_bytes, peak_bytes=stats.stored_bytes)
+        return stats
+
+    def _is_stored(self, request_id: str) -> bool:
+        with self._bounds_lock:
+            return request_id in self._sizes
+
+    def _cap_body(self, body: bytes) -> bytes:
+        if self.max_body_bytes and len(body) > self.max_body_bytes:
+            with self._bounds_lock:
+                self.capture_stats.truncated_bodies += 1
+            return body[: self.max_body_bytes]
+        return body
+
+    def _account(self, request_id: str, size: int, new: bool = False, response: bool = False) -> None:
+        evicted = []
+        with self._bounds_lock:
+            stats = self.capture_stats
+            if response:
+                previous = self._response_sizes.get(request_id, 0)
+                self._response_sizes[request_id] = size
+                size -= previous
+            self._sizes[request_id] = self._sizes.get(request_id, 0) + size
+            stats.stored_bytes += size
+            if new:
+                stats.stored += 1
+
+            while len(self._sizes) > 1:
+                if self.max_entries and len(self._sizes) > self.max_entries:
+                    stats.evicted_entries += 1
+                elif self.max_bytes and stats.stored_bytes > self.max_bytes:
+                    stats.evicted_bytes += 1
+                else:
+                    break
+                oldest, oldest_size = self._sizes.popitem(last=False)
+                self._response_sizes.pop(oldest, None)
+                stats.stored_bytes -= oldest_size
+                evicted.append(oldest)
+            stats.peak_bytes = max(stats.peak_bytes, stats.stored_bytes)
+
+        for oldest in evicted:
+            self._evict(oldest)
+
+    @abstractmethod
+    def _evict(self, request_id: str) -> None:
+        """Delete an evicted request from the underlying storage"""
+        pass
+
+
+class BoundedMemoryStorage(_BoundedStorageMixin, InMemoryRequestStorage):
+    """selenium-wire in-memory storage bounded by entries, bytes and body size"""
+
+    def __init__(
+        self, base_dir: Optional[str], max_entries: int, max_bytes: int, max_body_bytes: int, scopes: List[str] = None
+    ):
+        super().__init__(base_dir=base_dir)
+        self._init_bounds(max_entries, max_bytes, max_body_bytes, scopes)
+
+    def _evict(self, request_id: str) -> None:
+        with self._lock:
+            self._requests.pop(request_id, None)
+
+
+class BoundedDiskStorage(_BoundedStorageMixin, RequestStorage):
+    """selenium-wire on-disk storage bounded by entries, bytes and body size"""
+
+    def __init__(
+        self, base_dir: Optional[str], max_entries: int, max_bytes: int, max_body_bytes: int, scopes: List[str] = None
+    ):
+        super().__init__(base_dir=base_dir)
+        self._init_bounds(max_entries, max_bytes, max_body_bytes, scopes)
+
+    def _evict(self, request_id: str) -> None:
+        with self._lock:
+            # Evicted requests are the oldest, normally at the front of the index
+            self._index = [indexed for indexed in self._index if indexed.id != request_id]
+            self._ws_messages.pop(request_id, None)
+        shutil.rmtree(self._get_request_dir(request_id), ignore_errors=True)
+
+
+class CaptureStorage:
+    """Applies the configured capture scopes and storage bounds to selenium-wire drivers"""
+
+    @staticmethod
+    def install(driver, storage: str, scopes: List[str], max_entries: int, max_mb: float, max_body_kb: int):
+        """Replace a selenium-wire driver's request storage with a bounded, scoped one
+
+        driver.scopes is left unset so the interceptors still see every request.
+
+        Args:
+            driver: selenium-wire WebDriver instance (nothing is captured yet)
+            storage: "memory" or "disk"
+            scopes: URL patterns (regular expressions) of requests to store (empty stores everything)
+            max_entries: Maximum stored requests (0 disables)
+            max_mb: Maximum stored bytes in MB (0 disables)
+            max_body_kb: Maximum stored body size in KB (0 disables)
+
+        Returns:
+            The driver's new storage
+
+        Raises:
+            ConfigurationException: If the storage type is unknown
+        """
+        storage_classes = {
+            CaptureStorageConstants.MEMORY: BoundedMemoryStorage,
+            CaptureStorageConstants.DISK: BoundedDiskStorage,
+        }
+        if storage not in storage_classes:
+            raise ConfigurationException(
+                f"Unknown capture storage '{storage}'",
+                {"capture_storage": storage, "supported": CaptureStorageConstants.STORAGES},
+            )
+
+        backend = driver.backend
+        previous = backend.storage
+        bounded = storage_classes[storage](
+            base_dir=os.path.dirname(previous.home_dir),
+            max_entries=max_entries,
+            max_bytes=int(max_mb * 1024 * 1024),
+            max_body_bytes=max_body_kb * 1024,
+            scopes=scopes,
+        )
+        backend.storage = bounded
+        previous.cleanup()
+        return bounded
+
+    @staticmethod
+    def take_stats(driver) -> Optional[CaptureStats]:
+        """Get a driver's storage counters since the last call, or None if its storage is not bounded"""
+        storage = getattr(getattr(driver, "backend", None), "storage", None)
+        if not isinstance(storage, _BoundedStorageMixin):
+            return None
+        return storage.take_stats()
@@ -0,0 +1,322 @@
+"""
+Cassette - Record and replay of GraphQL traffic through selenium-wire interceptors
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+from seleniumwire.utils import decode
+
+from config.constants import CassetteConstants
+from core.exceptions.framework_exceptions import CassetteException, ConfigurationException
+from core.graphql_index import GraphQLIndex
+from core.interceptors import InterceptorChain
+
+
+class Cassette:
+    """Records GraphQL exchanges of a test to a cassette file and serves them back
+
+    Requests are matched by a normalized key: the operation names plus a hash
+    of their variables with volatile members (request and session ids)
+    removed, so persisted query hashes, headers and ids that change on every
+    page load do not break matching. A request seen several times replays its
+    recorded responses in order, the last one repeating. In replay mode the
+    answer is created in the request hook, so the request never leaves the
+    proxy; GraphQL requests missing from the cassette get a placeholder error
+    response and fail the test when the cassette is stopped. The replay latency
+    is added by a proxy addon that holds the answered flow without blocking
+    the proxy's event loop, so concurrent requests are delayed in parallel.
+    """
+
+    def __init__(self, latency_ms: float = CassetteConstants.DEFAULT_LATENCY_MS):
+        """Initialize an idle cassette
+
+        Args:
+            latency_ms: Milliseconds added before each replayed response
+        """
+        self.latency_ms = latency_ms
+        self.mode = CassetteConstants.OFF
+        self.path: Optional[str] = None
+        self.unmatched: List[str] = []
+        self._interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self._positions: Dict[str, int] = {}
+        self._delayed: List[Any] = []  # Replayed requests still waiting for their latency
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "Cassette":
+        """Create a cassette with the replay latency configured for this run"""
+        from config.settings import Settings
+
+        return cls(latency_ms=Settings.get_cassette_config().latency_ms)
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "Cassette":
+        """Record and replay a selenium-wire driver's GraphQL traffic through its interceptor chain
+
+        Attach after the other hooks: a replayed answer ends the request chain.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            Cassette: Cassette exposed as driver.cassette
+        """
+        cassette = cls.from_settings()
+        chain = InterceptorChain.install(driver)
+        chain.add_request_hook(cassette._on_request)
+        chain.add_response_hook(cassette._on_response)
+        if cassette.latency_ms:
+            # Runs after selenium-wire's handler has turned the replayed answer into the flow's response
+            driver.backend.master.addons.add(ReplayLatency(cassette))
+        driver.cassette = cassette
+        return cassette
+
+    @staticmethod
+    def request_key(body: bytes) -> Optional[str]:
+        """Normalized matching key of a GraphQL request payload, or None if it is not JSON"""
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError:
+            return None
+
+        operations = [operation for operation in (payload if isinstance(payload, list) else [payload])
+                      if isinstance(operation, dict)]
+        if not operations:
+            return None
+
+        names = [operation.get("operationName") or "" for operation in operations]
+        normalized = [
+            {
+                "operationName": operation.get("operationName"),
+                # Raw queries (no operation name) are matched by their text
+                "query": None if operation.get("operationName") else operation.get("query"),
+                "variables": Cassette._strip_volatile(operation.get("variables") or {}),
+            }
+            for operation in operations
+        ]
+        digest = hashlib.sha1(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+        return f"{'+'.join(names)}:{digest}"
+
+    @property
+    def active(self) -> bool:
+        """Whether the cassette is recording or replaying"""
+        return self.mode != CassetteConstants.OFF
+
+    def start(self, mode: str, path: str) -> None:
+        """Start recording to or replaying from a cassette file
+
+        Args:
+            mode: "record" or "replay"
+            path: Cassette file path
+
+        Raises:
+            ConfigurationException: If the mode is unknown
+            CassetteException: If the cassette to replay does not exist or cannot be read
+        """
+        if mode not in (CassetteConstants.RECORD, CassetteConstants.REPLAY):
+            raise ConfigurationException(
+                f"Unknown cassette mode '{mode}'", {"cassette_mode": mode, "supported": CassetteConstants.MODES}
+            )
+
+        interactions: Dict[str, List[Dict[str, Any]]] = {}
+        if mode == CassetteConstants.REPLAY:
+            interactions = self._load(path)
+
+        with self._lock:
+            self.mode = mode
+            self.path = path
+            self.unmatched = []
+            self._interactions = interactions
+            self._positions = {}
+            self._delayed = []
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop the cassette, writing it when recording
+
+        Returns:
+            dict: Mode, path and number of recorded or replayed interactions
+
+        Raises:
+            CassetteException: If requests were missing from the replayed cassette
+        """
+        with self._lock:
+            mode, path = self.mode, self.path
+            interactions, unmatched = self._interactions, self.unmatched
+            replayed = sum(self._positions.values())
+            self.mode = CassetteConstants.OFF
+            self._interactions = {}
+            self._positions = {}
+
+        recorded = 0
+        if mode == CassetteConstants.RECORD:
+            self._save(path, interactions)
+            recorded = sum(len(responses) for responses in interactions.values())
+        summary = {"mode": mode, "path": path, "recorded": recorded, "replayed": replayed}
+
+        if unmatched:
+            raise CassetteException(
+                f"{len(unmatched)} GraphQL requests were missing from cassette {path}; re-record it with --cassette record",
+                unmatched=sorted(set(unmatched)),
+            )
+        return summary
+
+    def _on_request(self, request) -> None:
+        if self.mode != CassetteConstants.REPLAY or not GraphQLIndex.is_graphql_url(request.url):
+            return
+
+        if request.method == "OPTIONS":
+            # CORS preflight of a replayed request, answered so it never reaches the network either
+            request.create_response(
+                status_code=204,
+                headers={
+                    "Access-Control-Allow-Origin": request.headers.get("Origin", "*"),
+                    "Access-Control-Allow-Credentials": "true",
+                    "Access-Control-Allow-Methods": "POST, OPTIONS",
+                    "Access-Control-Allow-Headers": request.headers.get("Access-Control-Request-Headers", "*"),
+                },
+            )
+            return
+        if request.method != "POST":
+            return
+
+        key = self.request_key(request.body)
+        with self._lock:
+            responses = self._interactions.get(key) if key else None
+            if not responses:
+                self.unmatched.append(key or request.url)
+                response = None
+            else:
+                position = self._positions.get(key, 0)
+                response = responses[min(position, len(responses) - 1)]
+                self._positions[key] = position + 1
+
+        if response is None:
+            request.create_response(
+                status_code=CassetteConstants.UNMATCHED_STATUS,
+                headers={"Content-Type": "application/json",
+                         "Access-Control-Allow-Origin": request.headers.get("Origin", "*"),
+                         "Access-Control-Allow-Credentials": "true"},
+                body=json.dumps({"errors": [{"message": f"No recorded response for {key}"}]}).encode("utf-8"),
+            )
+            return
+
+        request.create_response(
+            status_code=response["status"], headers=response["headers"], body=response["body"].encode("utf-8")
+        )
+        if self.latency_ms:
+            with self._lock:
+                self._delayed.append(request)
+
+    def take_delayed(self, request_id: Optional[str]) -> bool:
+        """Check whether a replayed request still waits for its latency, and stop tracking it
+
+        Args:
+            request_id: Storage id of the request (assigned after the request hooks ran)
+
+        Returns:
+            bool: True if the request's answer has to be held for the replay latency
+        """
+        if request_id is None:
+            return False
+        with self._lock:
+            for position, request in enumerate(self._delayed):
+                if request.id == request_id:
+                    del self._delayed[position]
+                    return True
+        return False
+
+    def _on_response(self, request, response) -> None:
+        if self.mode != CassetteConstants.RECORD or request.method != "POST":
+            return
+        if not GraphQLIndex.is_graphql_url(request.url):
+            return
+
+        key = self.request_key(request.body)
+        if key is None:
+            return
+        body = decode(response.body, response.headers.get("Content-Encoding", "identity"))
+        recorded = {
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name] for name in CassetteConstants.RECORDED_HEADERS if name in response.headers
+            },
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        with self._lock:
+            self._interactions.setdefault(key, []).append(recorded)
+
+    @staticmethod
+    def _strip_volatile(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                name: Cassette._strip_volatile(member)
+                for name, member in value.items()
+                if name not in CassetteConstants.VOLATILE_VARIABLES
+            }
+        if isinstance(value, list):
+            return [Cassette._strip_volatile(member) for member in value]
+        return value
+
+    @staticmethod
+    def _load(path: str) -> Dict[str, List[Dict[str, Any]]]:
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as cassette_file:
+                data = json.load(cassette_file)
+        except FileNotFoundError:
+            raise CassetteException(
+                f"No cassette to replay at {path}; record it first with --cassette record", details={"path": path}
+            )
+        except (OSError, ValueError) as e:
+            raise CassetteException(f"Cannot read cassette {path}: {e}", details={"path": path})
+
+        if data.get("version") != CassetteConstants.FORMAT_VERSION:
+            raise CassetteException(
+                f"Cassette {path} has an unsupported format version; re-record it with --cassette record",
+                details={"path": path, "version": data.get("version")},
+            )
+        return data.get("interactions", {})
+
+    @staticmethod
+    def _save(path: str, interactions: Dict[str, List[Dict[str, Any]]]) -> None:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Written next to the target and moved in place so an interrupted run never leaves a half cassette
+        temp_path = f"{path}.tmp"
+        with gzip.open(temp_path, "wt", encoding="utf-8") as cassette_file:
+            json.dump(
+                {"version": CassetteConstants.FORMAT_VERSION, "interactions": interactions},
+                cassette_file,
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+        os.replace(temp_path, path)
+
+
+class ReplayLatency:
+    """mitmproxy addon holding replayed answers for the cassette latency
+
+    selenium-wire runs its interceptors on the proxy's event loop, so sleeping
+    there would delay every other flow as well. The addon intercepts the
+    answered flow instead, which only keeps that flow's connection waiting,
+    and resumes it from the event loop once the latency has passed.
+    """
+
+    def __init__(self, cassette: Cassette):
+        """Initialize the addon
+
+        Args:
+            cassette: Cassette whose replayed requests are delayed
+        """
+        self.cassette = cassette
+
+    def request(self, flow) -> None:
+        """mitmproxy request hook, called after selenium-wire's handler"""
+        if flow.response is None or not self.cassette.take_delayed(getattr(flow.request, "id", None)):
+            return
+        flow.intercept()
+        asyncio.get_running_loop().call_later(self.cassette.latency_ms / 1000, flow.resume)
@@ -0,0 +1,332 @@
+"""
+CDP Network Capture - Request capture from Chrome DevTools Network events instead of a proxy
+"""
+
+import base64
+import json
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from config.constants import NetworkCaptureConstants, SessionResetConstants
+from core.exceptions.framework_exceptions import DriverException
+from core.graphql_index import GraphQLIndex
+from core.har_recorder import HarRecorder
+from core.network_activity import NetworkActivityTracker
+from core.visited_origins import VisitedOrigins
+
+
+class CapturedHeaders(dict):
+    """Header mapping with case-insensitive lookups, like selenium-wire's headers"""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None):
+        super().__init__({name.lower(): value for name, value in (headers or {}).items()})
+
+    def __getitem__(self, name: str) -> str:
+        return super().__getitem__(name.lower())
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and super().__contains__(name.lower())
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return super().get(name.lower(), default)
+
+
+class CapturedResponse:
+    """Response of a captured request
+
+    The body is fetched from Chrome on first access and is already decoded
+    (no Content-Encoding left to undo, unlike selenium-wire response bodies).
+    """
+
+    def __init__(self, capture: "CdpNetworkCapture", request_id: Optional[str], data: Dict[str, Any]):
+        self.status_code: int = data.get("status", 0)
+        self.reason: str = data.get("statusText", "")
+        self.headers = CapturedHeaders(data.get("headers"))
+        self.mime_type: str = data.get("mimeType", "")
+        self.protocol: str = data.get("protocol", "")
+        self.remote_ip: str = data.get("remoteIPAddress", "")
+        self.timing: Optional[Dict[str, float]] = data.get("timing")
+        self.date = datetime.now()
+        self._capture = capture
+        self._request_id = request_id
+        self._body: Optional[bytes] = None
+
+    @property
+    def fetchable(self) -> bool:
+        """Whether the body can be fetched from Chrome (redirect responses have none)"""
+        return self._request_id is not None
+
+    @property
+    def body(self) -> bytes:
+        """Response body (empty if Chrome no longer holds it)"""
+        if self._body is None:
+            self._body = self._capture.get_response_body(self._request_id) if self._request_id else b""
+        return self._body
+
+    def __repr__(self) -> str:
+        return f"CapturedResponse({self.status_code}, {self.reason!r})"
+
+
+class CapturedRequest:
+    """Request seen on the DevTools Network domain, exposing the selenium-wire request attributes tests use"""
+
+    def __init__(
+        self,
+        request_id: str,
+        data: Dict[str, Any],
+        wall_time: Optional[float],
+        resource_type: str,
+        timestamp: Optional[float] = None,
+    ):
+        self.id = request_id
+        self.method: str = data.get("method", "GET")
+        self.url: str = data.get("url", "")
+        self.headers = CapturedHeaders(data.get("headers"))
+        self.body: bytes = (data.get("postData") or "").encode("utf-8")
+        self.date = datetime.fromtimestamp(wall_time) if wall_time else datetime.now()
+        self.timestamp = timestamp  # Monotonic Network event time, in seconds
+        self.resource_type = resource_type
+        self.response: Optional[CapturedResponse] = None
+        self.finished = False
+        self.error: Optional[str] = None
+
+    @property
+    def host(self) -> str:
+        """Host name of the request URL"""
+        return urlsplit(self.url).hostname or ""
+
+    @property
+    def path(self) -> str:
+        """Path of the request URL"""
+        return urlsplit(self.url).path
+
+    @property
+    def querystring(self) -> str:
+        """Query string of the request URL"""
+        return urlsplit(self.url).query
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        """Query parameters, single values unwrapped like selenium-wire does"""
+        return {
+            name: values[0] if len(values) == 1 else values
+            for name, values in parse_qs(self.querystring, keep_blank_values=True).items()
+        }
+
+    def __repr__(self) -> str:
+        return f"CapturedRequest({self.method!r}, {self.url!r})"
+
+    def __str__(self) -> str:
+        return self.url
+
+
+class CdpNetworkCapture:
+    """Builds a request list from the Network events chromedriver writes to the performance log
+
+    Chrome reports traffic itself (requestWillBeSent, responseReceived,
+    loadingFinished, loadingFailed), so no proxy sits between the browser and the
+    site. Events are drained from the log whenever the request list is read,
+    and by the activity tracker while a network idle wait is running.
+    """
+
+    def __init__(self, driver):
+        self._driver = driver
+        self._lock = threading.RLock()
+        self._requests: List[CapturedRequest] = []
+        self._by_id: Dict[str, CapturedRequest] = {}
+        self.activity = NetworkActivityTracker.from_settings(pump=self.poll)
+        self.graphql = GraphQLIndex(pump=self.poll)
+        self.har = HarRecorder.from_settings(pump=self.poll)
+        self.origins = VisitedOrigins(pump=self.poll)
+
+    @property
+    def requests(self) -> List[CapturedRequest]:
+        """Captured requests in the order they were sent"""
+        with self._lock:
+            self.poll()
+            return list(self._requests)
+
+    @property
+    def last_request(self) -> Optional[CapturedRequest]:
+        """Most recently sent request, or None"""
+        with self._lock:
+            self.poll()
+            return self._requests[-1] if self._requests else None
+
+    def clear(self) -> None:
+        """Forget all captured requests, including events still waiting in the log"""
+        with self._lock:
+            self.poll()
+            self._requests.clear()
+            self._by_id.clear()
+            self.activity.clear()
+            self.graphql.clear()
+
+    def wait_for_request(self, pat: str, timeout: float = 10) -> CapturedRequest:
+        """Wait for a request whose URL matches a regular expression
+
+        Args:
+            pat: Regular expression searched in request URLs
+            timeout: Seconds to wait
+
+        Returns:
+            CapturedRequest: First matching request that has a response
+
+        Raises:
+            TimeoutException: If no matching request completes within the timeout
+        """
+        pattern = re.compile(pat)
+        deadline = time.monotonic() + timeout
+        while True:
+            for request in self.requests:
+                if request.response is not None and pattern.search(request.url):
+                    return request
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timed out after {timeout}s waiting for request matching {pat}")
+            time.sleep(NetworkCaptureConstants.POLL_INTERVAL)
+
+    def poll(self) -> None:
+        """Drain the performance log and apply its Network events"""
+        with self._lock:
+            try:
+                entries = self._driver.get_log(NetworkCaptureConstants.PERFORMANCE_LOG)
+            except (WebDriverException, DriverException):
+                # DeadSessionException from the session guard once the session died
+                return
+
+            for entry in entries:
+                try:
+                    message = json.loads(entry["message"])["message"]
+                except (KeyError, TypeError, ValueError):
+                    continue
+                handler = self._HANDLERS.get(message.get("method"))
+                if handler:
+                    handler(self, message.get("params", {}))
+
+    def get_response_body(self, request_id: str) -> bytes:
+        """Fetch a response body from Chrome"""
+        try:
+            result = self._driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except (WebDriverException, DriverException):
+            return b""
+        if result.get("base64Encoded"):
+            return base64.b64decode(result.get("body", ""))
+        return result.get("body", "").encode("utf-8")
+
+    def _on_request_will_be_sent(self, params: Dict[str, Any]) -> None:
+        request_id = params.get("requestId")
+        previous = self._by_id.get(request_id)
+
+        # Redirects reuse the request id; close the previous hop with the redirect response
+        if previous is not None and params.get("redirectResponse"):
+            previous.response = CapturedResponse(self, None, params["redirectResponse"])
+            previous.finished = True
+            self.activity.request_finished(request_id)
+            self.har.record_devtools_request(previous, params.get("timestamp"), -1)
+
+        request = CapturedRequest(
+            request_id, params.get("request", {}), params.get("wallTime"), params.get("type", ""), params.get("timestamp")
+        )
+        self._requests.append(request)
+        self._by_id[request_id] = request
+        self.activity.request_started(request_id, request.url)
+        if request.resource_type == SessionResetConstants.DOCUMENT_RESOURCE_TYPE:
+            self.origins.add(request.url)
+
+    def _on_response_received(self, params: Dict[str, Any]) -> None:
+        request = self._by_id.get(params.get("requestId"))
+        if request is not None:
+            request.response = CapturedResponse(self, request.id, params.get("response", {}))
+
+    def _on_loading_finished(self, params: Dict[str, Any]) -> None:
+        request = self._by_id.get(params.get("requestId"))
+        if request is not None:
+            request.finished = True
+            self.activity.request_finished(request.id)
+            if request.method == "POST" and GraphQLIndex.is_graphql_url(request.url) and request.response is not None:
+                self.graphql.add_exchange(
+                    request.url, request.body, request.response.status_code, request.response.body
+                )
+            self.har.record_devtools_request(request, params.get("timestamp"), params.get("encodedDataLength", -1))
+
+    def _on_loading_failed(self, params: Dict[str, Any]) -> None:
+        request = self._by_id.get(params.get("requestId"))
+        if request is not None:
+            request.finished = True
+            request.error = params.get("errorText")
+            self.activity.request_finished(request.id)
+            self.har.record_devtools_request(request, params.get("timestamp"), -1)
+
+    _HANDLERS = {
+        "Network.requestWillBeSent": _on_request_will_be_sent,
+        "Network.responseReceived": _on_response_received,
+        "Network.loadingFinished": _on_loading_finished,
+        "Network.loadingFailed": _on_loading_failed,
+    }
+
+
+class CdpCaptureMixin:
+    """Adds the selenium-wire request API, backed by DevTools Network events, to a Chrome driver class
+
+    The driver must be started with the performance log enabled, see
+    enable_performance_log().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.network_capture = CdpNetworkCapture(self)
+
+    @staticmethod
+    def enable_performance_log(options) -> None:
+        """Ask chromedriver to log Network events for the capture"""
+        options.set_capability("goog:loggingPrefs", {NetworkCaptureConstants.PERFORMANCE_LOG: "ALL"})
+        options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    @property
+    def requests(self) -> List[CapturedRequest]:
+        """Captured requests in the order they were sent"""
+        return self.network_capture.requests
+
+    @requests.deleter
+    def requests(self) -> None:
+        self.network_capture.clear()
+
+    @property
+    def last_request(self) -> Optional[CapturedRequest]:
+        """Most recently sent request, or None"""
+        return self.network_capture.last_request
+
+    @property
+    def network_activity(self) -> NetworkActivityTracker:
+        """In-flight request tracker fed by the captured Network events"""
+        return self.network_capture.activity
+
+    @property
+    def graphql(self) -> GraphQLIndex:
+        """Index of captured GraphQL exchanges by operation name"""
+        return self.network_capture.graphql
+
+    @property
+    def har_recorder(self) -> HarRecorder:
+        """HAR recorder fed by the captured Network events"""
+        return self.network_capture.har
+
+    @property
+    def visited_origins(self) -> VisitedOrigins:
+        """Origins of the documents loaded, fed by the captured Network events"""
+        return self.network_capture.origins
+
+    def wait_for_request(self, pat: str, timeout: float = 10) -> CapturedRequest:
+        """Wait for a request whose URL matches a regular expression"""
+        return self.network_capture.wait_for_request(pat, timeout)
+
+
+class CdpCaptureChrome(CdpCaptureMixin, webdriver.Chrome):
+    """Chrome driver exposing captured requests from DevTools Network events instead of a proxy"""
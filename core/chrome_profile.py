@@ -0,0 +1,197 @@
+"""
+Chrome Profile Manager - Per-driver Chrome profiles cloned from a pre-seeded template
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from config.constants import ChromeProfileConstants
+from core.chromedriver_cache import ChromeDriverCache
+from utils.locks.file_lock import FileLock
+
+if sys.platform.startswith("linux"):
+    import fcntl
+
+# ioctl request cloning one file's extents into another (Linux btrfs/xfs/bcachefs)
+_FICLONE = 0x40049409
+
+
+class ChromeProfileManager:
+    """Gives every Chrome instance its own user data directory
+
+    Profiles are cloned from a template profile that is warmed once (consent cookie,
+    HTTP cache, service worker) and shared by all workers. Files are cloned with
+    reflinks where the filesystem supports them and copied otherwise; Chrome
+    rewrites cache entries in place, so profiles never share files with the
+    template. The per-test session reset clears cookies, cache and service
+    workers, so the warmed state only speeds up a driver's first test.
+    """
+
+    _lock = threading.Lock()  # Guards the profile registry only
+    _template_lock = threading.Lock()  # Held while the template is checked and warmed, which takes seconds
+    _profiles: Dict[int, str] = {}
+    _reflink_supported: Optional[bool] = None
+    _template_checked = False
+
+    @classmethod
+    def allocate(cls, warm_template: Optional[Callable[[str], None]] = None) -> str:
+        """Create a fresh profile directory for a new Chrome instance
+
+        Args:
+            warm_template: Optional callable that seeds the template profile directory it is given
+
+        Returns:
+            str: Path of the new user data directory
+        """
+        template_dir = cls._ensure_template(warm_template) if warm_template else None
+
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        profile_dir = tempfile.mkdtemp(prefix=f"chrome_{worker}_", dir=cls._profiles_root())
+
+        if template_dir:
+            try:
+                cls._clone_tree(template_dir, profile_dir)
+            except OSError as e:
+                print(f"Warning: Failed to clone Chrome template profile, using an empty profile: {e}")
+                shutil.rmtree(profile_dir, ignore_errors=True)
+                os.makedirs(profile_dir)
+
+        return profile_dir
+
+    @classmethod
+    def register(cls, driver, profile_dir: str) -> None:
+        """Associate a profile directory with the driver using it"""
+        with cls._lock:
+            cls._profiles[id(driver)] = profile_dir
+
+    @classmethod
+    def release(cls, driver) -> None:
+        """Delete the profile directory of a driver that has been quit"""
+        with cls._lock:
+            profile_dir = cls._profiles.pop(id(driver), None)
+        if profile_dir:
+            cls.remove(profile_dir)
+
+    @staticmethod
+    def remove(profile_dir: str) -> None:
+        """Delete a profile directory"""
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+    @classmethod
+    def get_template_dir(cls) -> str:
+        """Get the shared template profile directory"""
+        return os.path.join(ChromeDriverCache.get_cache_dir(), ChromeProfileConstants.TEMPLATE_DIR_NAME)
+
+    @classmethod
+    def _ensure_template(cls, warm_template: Callable[[str], None]) -> Optional[str]:
+        """Warm the template profile if it is missing or stale
+
+        Returns:
+            str: Template directory, or None if no usable template exists
+        """
+        template_dir = cls.get_template_dir()
+
+        with cls._template_lock:
+            if cls._template_checked:
+                return template_dir if os.path.isdir(template_dir) else None
+
+            lock_file = os.path.join(ChromeDriverCache.get_cache_dir(), ChromeProfileConstants.TEMPLATE_LOCK_FILE)
+            with FileLock(lock_file, timeout=ChromeProfileConstants.TEMPLATE_LOCK_TIMEOUT):
+                if not cls._is_template_fresh(template_dir):
+                    cls._warm(template_dir, warm_template)
+            cls._template_checked = True
+
+        return template_dir if os.path.isdir(template_dir) else None
+
+    @classmethod
+    def _warm(cls, template_dir: str, warm_template: Callable[[str], None]) -> None:
+        """Rebuild the template profile (caller holds the template file lock)"""
+        staging_dir = f"{template_dir}.{os.getpid()}.tmp"
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        os.makedirs(staging_dir)
+
+        start_time = time.time()
+        try:
+            warm_template(staging_dir)
+        except Exception as e:
+            print(f"Warning: Failed to warm Chrome template profile, profiles start empty: {e}")
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return
+
+        marker = {
+            "chrome_major_version": ChromeDriverCache.get_chrome_major_version(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "warm_seconds": round(time.time() - start_time, 2),
+        }
+        with open(os.path.join(staging_dir, ChromeProfileConstants.TEMPLATE_MARKER_FILE), "w", encoding="utf-8") as f:
+            json.dump(marker, f)
+
+        shutil.rmtree(template_dir, ignore_errors=True)
+        os.replace(staging_dir, template_dir)
+        print(f"\n🔥 Chrome template profile warmed in {marker['warm_seconds']}s: {template_dir}")
+
+    @classmethod
+    def _is_template_fresh(cls, template_dir: str) -> bool:
+        """Check the template marker for age and Chrome major version"""
+        try:
+            with open(os.path.join(template_dir, ChromeProfileConstants.TEMPLATE_MARKER_FILE), encoding="utf-8") as f:
+                marker = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        max_age_hours = float(os.getenv("CHROME_PROFILE_TEMPLATE_MAX_AGE", str(ChromeProfileConstants.TEMPLATE_MAX_AGE_HOURS)))
+        age_hours = (datetime.now() - datetime.fromisoformat(marker["created_at"])).total_seconds() / 3600
+        return (
+            age_hours < max_age_hours
+            and marker.get("chrome_major_version") == ChromeDriverCache.get_chrome_major_version()
+        )
+
+    @classmethod
+    def _profiles_root(cls) -> str:
+        """Get the directory holding working profiles (tmpfs when requested and available)"""
+        use_tmpfs = os.getenv("CHROME_PROFILE_TMPFS", "false").lower() == "true"
+        if use_tmpfs and os.path.isdir(ChromeProfileConstants.TMPFS_DIR):
+            base_dir = ChromeProfileConstants.TMPFS_DIR
+        else:
+            base_dir = tempfile.gettempdir()
+
+        root = os.path.join(base_dir, ChromeProfileConstants.PROFILE_DIR_NAME)
+        os.makedirs(root, exist_ok=True)
+        return root
+
+    @classmethod
+    def _clone_tree(cls, source_dir: str, target_dir: str) -> None:
+        """Clone a profile directory tree into an existing empty directory"""
+        for root, dirs, files in os.walk(source_dir):
+            relative_root = os.path.relpath(root, source_dir)
+            destination_root = os.path.join(target_dir, relative_root) if relative_root != "." else target_dir
+            os.makedirs(destination_root, exist_ok=True)
+
+            for name in files:
+                if name in ChromeProfileConstants.SKIPPED_FILES or name == ChromeProfileConstants.TEMPLATE_MARKER_FILE:
+                    continue
+                cls._clone_file(os.path.join(root, name), os.path.join(destination_root, name))
+
+    @classmethod
+    def _clone_file(cls, source: str, target: str) -> None:
+        """Clone one file by reflink, or copy it where reflinks are unsupported"""
+        if cls._reflink_supported is not False and sys.platform.startswith("linux"):
+            try:
+                with open(source, "rb") as src, open(target, "wb") as dst:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                shutil.copystat(source, target)
+                cls._reflink_supported = True
+                return
+            except OSError:
+                cls._reflink_supported = False
+                if os.path.exists(target):
+                    os.remove(target)
+
+        shutil.copy2(source, target)
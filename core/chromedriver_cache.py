@@ -0,0 +1,171 @@
+"""
+ChromeDriver Cache - Offline, cross-worker cache of the resolved chromedriver binary
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from webdriver_manager.chrome import ChromeDriverManager
+
+from config.constants import DriverCacheConstants
+from core.exceptions.framework_exceptions import DriverException
+from utils.locks.file_lock import FileLock
+
+
+class ChromeDriverCache:
+    """Resolves the chromedriver binary once and shares the path between workers
+
+    The resolved path is stored in a JSON file keyed by the installed Chrome major
+    version. Workers read the file without touching webdriver_manager; only a cache
+    miss (first run or Chrome upgrade) resolves the binary, under a file lock so
+    parallel workers never race on the download.
+    """
+
+    _lock = threading.Lock()
+    _driver_path: Optional[str] = None
+    _chrome_major_version: Optional[str] = None
+
+    @classmethod
+    def get_driver_path(cls) -> str:
+        """Get the chromedriver binary path for the installed Chrome
+
+        Returns:
+            str: Path to the chromedriver executable
+
+        Raises:
+            DriverException: If the binary cannot be resolved
+        """
+        # Explicit override skips resolution entirely
+        override = os.getenv("CHROMEDRIVER_PATH")
+        if override:
+            return override
+
+        with cls._lock:
+            if cls._driver_path and cls._is_executable(cls._driver_path):
+                return cls._driver_path
+
+            major_version = cls.get_chrome_major_version()
+            if major_version is None:
+                # Without a version key a cached path could silently go stale after a Chrome upgrade
+                cls._driver_path = cls._resolve_with_lock(None)
+            else:
+                cls._driver_path = cls._read_cache().get(major_version, {}).get("path")
+                if not cls._driver_path or not cls._is_executable(cls._driver_path):
+                    cls._driver_path = cls._resolve_with_lock(major_version)
+
+            return cls._driver_path
+
+    @classmethod
+    def get_chrome_major_version(cls) -> Optional[str]:
+        """Detect the installed Chrome major version without network access
+
+        Returns:
+            str: Major version (e.g. "126") or None if Chrome could not be found
+        """
+        if cls._chrome_major_version is not None:
+            return cls._chrome_major_version
+
+        candidates = [os.getenv("CHROME_BINARY")] + DriverCacheConstants.CHROME_BINARY_CANDIDATES
+        for candidate in filter(None, candidates):
+            binary = shutil.which(candidate) or (candidate if os.path.isfile(candidate) else None)
+            if not binary:
+                continue
+
+            try:
+                output = subprocess.run(
+                    [binary, "--version"],
+                    capture_output=True,
+                    text=True,
+                    timeout=DriverCacheConstants.VERSION_COMMAND_TIMEOUT,
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+
+            match = re.search(r"(\d+)\.\d+\.\d+", output)
+            if match:
+                cls._chrome_major_version = match.group(1)
+                return cls._chrome_major_version
+
+        return None
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the in-process path and remove the on-disk cache"""
+        with cls._lock:
+            cls._driver_path = None
+            cls._chrome_major_version = None
+            with FileLock(cls._lock_file(), timeout=DriverCacheConstants.LOCK_TIMEOUT):
+                if os.path.exists(cls._cache_file()):
+                    os.remove(cls._cache_file())
+
+    @classmethod
+    def _resolve_with_lock(cls, major_version: Optional[str]) -> str:
+        """Resolve the binary via webdriver_manager while holding the cross-worker lock"""
+        with FileLock(cls._lock_file(), timeout=DriverCacheConstants.LOCK_TIMEOUT):
+            cache = cls._read_cache()
+
+            # Another worker may have resolved it while we waited for the lock
+            if major_version is not None:
+                cached_path = cache.get(major_version, {}).get("path")
+                if cached_path and cls._is_executable(cached_path):
+                    return cached_path
+
+            try:
+                driver_path = ChromeDriverManager().install()
+            except Exception as e:
+                raise DriverException(
+                    "Failed to resolve chromedriver binary",
+                    {"chrome_major_version": major_version, "error": str(e)},
+                )
+
+            if major_version is not None:
+                cache[major_version] = {
+                    "path": driver_path,
+                    "resolved_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                cls._write_cache(cache)
+
+            return driver_path
+
+    @classmethod
+    def _read_cache(cls) -> Dict[str, Dict[str, str]]:
+        """Read the on-disk cache, treating a missing or corrupt file as empty"""
+        try:
+            with open(cls._cache_file(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _write_cache(cls, cache: Dict[str, Dict[str, str]]) -> None:
+        """Atomically replace the on-disk cache (caller holds the file lock)"""
+        cache_file = cls._cache_file()
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(temp_file, cache_file)
+
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        """Get the directory shared by workers for cached driver artifacts, creating it if needed"""
+        cache_dir = os.path.expanduser(os.getenv("DRIVER_CACHE_DIR", DriverCacheConstants.DEFAULT_CACHE_DIR))
+        os.makedirs(cache_dir, exist_ok=True)
+        return cache_dir
+
+    @classmethod
+    def _cache_file(cls) -> str:
+        return os.path.join(cls.get_cache_dir(), DriverCacheConstants.CACHE_FILE)
+
+    @classmethod
+    def _lock_file(cls) -> str:
+        return os.path.join(cls.get_cache_dir(), DriverCacheConstants.LOCK_FILE)
+
+    @staticmethod
+    def _is_executable(path: str) -> bool:
+        return os.path.isfile(path) and os.access(path, os.X_OK)
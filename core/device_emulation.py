@@ -0,0 +1,125 @@
+"""
+Device Emulation - Device catalog and runtime emulation switching on a live driver
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from config.constants import DeviceCatalogConstants
+from core.exceptions.framework_exceptions import ConfigurationException, UnsupportedDeviceException
+
+
+@dataclass(frozen=True)
+class DeviceProfile:
+    """Screen metrics, user agent and touch support of an emulated device"""
+
+    name: str
+    width: int
+    height: int
+    device_scale_factor: float
+    user_agent: str
+    platform: str = ""
+    mobile: bool = True
+    touch: bool = True
+
+
+class DeviceCatalog:
+    """Catalog of devices available for emulation
+
+    Built from DeviceCatalogConstants.DEVICES, extended or overridden by the JSON
+    file named in DEVICE_CATALOG, and loaded once per process.
+    """
+
+    _lock = threading.Lock()
+    _devices: Optional[Dict[str, DeviceProfile]] = None
+
+    @classmethod
+    def get(cls, name: str) -> DeviceProfile:
+        """Get a device from the catalog
+
+        Args:
+            name: Device name (e.g. "iPhone SE")
+
+        Returns:
+            DeviceProfile: The device
+
+        Raises:
+            UnsupportedDeviceException: If the device is not in the catalog
+        """
+        devices = cls._load()
+        if name not in devices:
+            raise UnsupportedDeviceException(name, sorted(devices))
+        return devices[name]
+
+    @classmethod
+    def names(cls) -> List[str]:
+        """Get the names of all devices in the catalog"""
+        return sorted(cls._load())
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the loaded catalog so it is read again on next use"""
+        with cls._lock:
+            cls._devices = None
+
+    @classmethod
+    def _load(cls) -> Dict[str, DeviceProfile]:
+        """Load the catalog on first use"""
+        with cls._lock:
+            if cls._devices is None:
+                entries = dict(DeviceCatalogConstants.DEVICES)
+                entries.update(cls._read_catalog_file())
+                cls._devices = {name: DeviceProfile(name=name, **entry) for name, entry in entries.items()}
+            return cls._devices
+
+    @staticmethod
+    def _read_catalog_file() -> Dict[str, dict]:
+        """Read extra devices from the DEVICE_CATALOG JSON file, if configured"""
+        path = os.getenv("DEVICE_CATALOG")
+        if not path:
+            return {}
+
+        try:
+            with open(os.path.expanduser(path), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            raise ConfigurationException(f"Failed to read device catalog '{path}': {e}", {"path": path})
+
+
+class DeviceEmulator:
+    """Switches device emulation of a running Chrome over DevTools
+
+    Changing metrics, user agent and touch support takes effect on the next
+    navigation, so covering another device costs a page load instead of a
+    browser launch.
+    """
+
+    @staticmethod
+    def apply(driver, device: DeviceProfile) -> None:
+        """Emulate a device on the driver's current page target
+
+        Args:
+            driver: Chrome WebDriver instance
+            device: Device to emulate
+        """
+        driver.execute_cdp_cmd(
+            "Emulation.setDeviceMetricsOverride",
+            {
+                "width": device.width,
+                "height": device.height,
+                "deviceScaleFactor": device.device_scale_factor,
+                "mobile": device.mobile,
+                "screenWidth": device.width,
+                "screenHeight": device.height,
+            },
+        )
+        driver.execute_cdp_cmd(
+            "Emulation.setUserAgentOverride", {"userAgent": device.user_agent, "platform": device.platform}
+        )
+        driver.execute_cdp_cmd(
+            "Emulation.setTouchEmulationEnabled",
+            {"enabled": device.touch, "maxTouchPoints": DeviceCatalogConstants.MAX_TOUCH_POINTS if device.touch else 0},
+        )
@@ -0,0 +1,107 @@
+"""
+Driver Health - Recycling of long-lived drivers by memory, age and tests served
+"""
+
+import threading
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from core.driver_pool import PooledDriver
+from core.process_monitor import ProcessTreeUsage
+from utils.loggers.logger import Logger
+
+
+@dataclass
+class RecycleStats:
+    """Health check outcomes for a session"""
+
+    checks: int = 0
+    recycled_memory: int = 0
+    recycled_age: int = 0
+    recycled_tests: int = 0
+    peak_rss_mb: float = 0.0
+    peak_cpu_seconds: float = 0.0
+    dead_sessions: int = 0  # Drivers whose Chrome or chromedriver died, replaced by fresh ones
+
+    @property
+    def recycled(self) -> int:
+        """Drivers recycled for any reason"""
+        return self.recycled_memory + self.recycled_age + self.recycled_tests
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary"""
+        return asdict(self)
+
+
+class DriverHealthMonitor:
+    """Decides whether a returned driver is healthy enough to serve another test
+
+    A driver is recycled (quit and later replaced by a fresh one) once its Chrome
+    process tree RSS, its age or the number of tests it served crosses the
+    configured threshold. Every decision is logged and counted.
+    """
+
+    def __init__(self, max_rss_mb: float, max_age: float, max_tests: int, stats: Optional[RecycleStats] = None):
+        """Initialize the monitor
+
+        Args:
+            max_rss_mb: RSS threshold in MB (0 disables)
+            max_age: Age threshold in seconds (0 disables)
+            max_tests: Tests served threshold (0 disables)
+            stats: Optional counters object to update
+        """
+        self.max_rss_mb = max_rss_mb
+        self.max_age = max_age
+        self.max_tests = max_tests
+        self.recycle_stats = stats or RecycleStats()
+        self._lock = threading.Lock()
+        self._logger = Logger.get_logger(self.__class__.__name__)
+
+    def check(self, entry: PooledDriver, usage: Optional[ProcessTreeUsage]) -> Optional[str]:
+        """Check a returned driver against the thresholds
+
+        Args:
+            entry: Pooled driver being returned
+            usage: Latest process tree usage of the driver, if it could be measured
+
+        Returns:
+            Optional[str]: Reason to recycle the driver, or None if it can be reused
+        """
+        reason, counter = None, None
+        if usage and self.max_rss_mb and usage.rss_mb > self.max_rss_mb:
+            reason, counter = f"RSS {usage.rss_mb:.0f} MB > {self.max_rss_mb:.0f} MB", "recycled_memory"
+        elif self.max_age and entry.age > self.max_age:
+            reason, counter = f"age {entry.age:.0f}s > {self.max_age:.0f}s", "recycled_age"
+        elif self.max_tests and entry.checkouts >= self.max_tests:
+            reason, counter = f"served {entry.checkouts} tests (limit {self.max_tests})", "recycled_tests"
+
+        with self._lock:
+            stats = self.recycle_stats
+            stats.checks += 1
+            if usage:
+                stats.peak_rss_mb = max(stats.peak_rss_mb, usage.rss_mb)
+                stats.peak_cpu_seconds = max(stats.peak_cpu_seconds, usage.cpu_seconds)
+            if counter:
+                setattr(stats, counter, getattr(stats, counter) + 1)
+
+        sample = (
+            f"RSS {usage.rss_mb:.0f} MB, CPU {usage.cpu_seconds:.1f}s, {usage.process_count} processes"
+            if usage
+            else "usage unavailable"
+        )
+        if reason:
+            self._logger.info(f"Recycling driver '{entry.key}' after {entry.checkouts} tests: {reason} ({sample})")
+        else:
+            self._logger.debug(f"Keeping driver '{entry.key}' after {entry.checkouts} tests ({sample})")
+        return reason
+
+    def record_dead_session(self, key: Any, reason: str) -> None:
+        """Count and log a driver whose session was found dead
+
+        Args:
+            key: Driver configuration or worker the driver belonged to
+            reason: Why the session is dead
+        """
+        with self._lock:
+            self.recycle_stats.dead_sessions += 1
+        self._logger.warning(f"Replacing dead driver '{key}': {reason}")
@@ -3,21 +3,48 @@ Driver Manager - Thread-safe implementation for parallel execution with multi-br
 """
 
 import os
+import shutil
 import threading
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, NamedTuple, Optional, Tuple, Union
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.common.by import By
 
 from seleniumwire import webdriver as wire_webdriver
-from core.exceptions.framework_exceptions import DriverException
+from core.asset_cache import AssetCache
+from core.chrome_profile import ChromeProfileManager
+from core.browser_context import BrowserContext, BrowserContextHost, CdpCaptureContextDriver, ContextDriver
+from core.cassette import Cassette
+from core.capture_storage import CaptureStats, CaptureStorage
+from core.cdp_network import CdpCaptureChrome
+from core.chromedriver_cache import ChromeDriverCache
+from core.device_emulation import DeviceCatalog, DeviceEmulator, DeviceProfile
+from core.driver_health import DriverHealthMonitor, RecycleStats
+from core.driver_pool import DriverPool, PooledDriver, PoolStats
+from core.driver_timing import DriverStartupMetrics, StartupTimer
+from core.graphql_index import GraphQLIndex
+from core.har_recorder import HarRecorder
+from core.network_activity import NetworkActivityTracker
+from core.performance_profile import PerformanceProfile, PerformanceThrottler
+from core.process_monitor import ProcessMonitor
+from core.session_probe import SessionGuard, SessionProbe
+from core.session_reset import SessionReset
+from core.visited_origins import VisitedOrigins
+from core.exceptions.framework_exceptions import ConfigurationException, DeadSessionException, DriverException
 from config.constants import (
     BrowserConstants,
+    BrowserContextConstants,
     ChromeOptionsConstants,
+    ChromeProfileConstants,
+    DriverTimingConstants,
+    LaunchProfileConstants,
+    NetworkCaptureConstants,
+    SessionResetConstants,
 )
 
 
@@ -26,41 +53,72 @@ class BrowserType(Enum):
     CHROME = "chrome"
 
 
+class NetworkCapture(Enum):
+    """Network capture backends for recording browser traffic"""
+    WIRE = NetworkCaptureConstants.WIRE  # selenium-wire MITM proxy
+    CDP = NetworkCaptureConstants.CDP  # Chrome DevTools Network events, no proxy
+    NONE = NetworkCaptureConstants.NONE  # No capture
+
+
+class DriverMode(Enum):
+    """How tests are given a browser"""
+    PROCESS = BrowserContextConstants.PROCESS  # A pooled Chrome process per test driver
+    CONTEXT = BrowserContextConstants.CONTEXT  # A browser context per test inside one Chrome per worker
+
+
+class DriverKey(NamedTuple):
+    """Driver configuration used to key pooled WebDriver instances"""
+    browser: BrowserType
+    device: str
+    capture: NetworkCapture = NetworkCapture.WIRE
+
+    def __str__(self) -> str:
+        return f"{self.browser.value}/{self.device}/{self.capture.value}"
+
+
 class BrowserFactory(ABC):
     """Abstract factory for creating browser-specific WebDriver instances"""
 
     @abstractmethod
-    def create_mobile_wire_driver(self, device: str):
-        """Create a mobile WebDriver instance with selenium-wire for the specific browser"""
+    def create_mobile_wire_driver(self, device: str, capture: NetworkCapture = NetworkCapture.WIRE):
+        """Create a mobile WebDriver instance with network monitoring for the specific browser"""
+        pass
+
+    @abstractmethod
+    def attach_context_driver(self, host_driver, target_id: str, device: str, capture: NetworkCapture):
+        """Attach a WebDriver session to a page target of a browser launched by host_driver"""
         pass
 
 
 class ChromeDriverFactory(BrowserFactory):
-    """Factory for creating Chrome WebDriver instances with selenium-wire"""
+    """Factory for creating Chrome WebDriver instances with network monitoring"""
 
-    def create_mobile_wire_driver(self, device: str):
-        """Create a Chrome mobile WebDriver instance with selenium-wire for network monitoring"""
-        return self._create_chrome_mobile_driver(device, use_wire=True)
+    def create_mobile_wire_driver(self, device: str, capture: NetworkCapture = NetworkCapture.WIRE):
+        """Create a Chrome mobile WebDriver instance with the given network capture backend"""
+        return self._create_chrome_mobile_driver(device, capture=capture)
     
-    def _create_chrome_mobile_driver(self, device_name: str, use_wire: bool = False) -> webdriver.Chrome:
-        """Create Chrome mobile driver with optional selenium-wire support
+    def _create_chrome_mobile_driver(
+        self, device_name: str, capture: NetworkCapture = NetworkCapture.NONE, profile_dir: Optional[str] = None
+    ) -> webdriver.Chrome:
+        """Create Chrome mobile driver with optional network capture
 
         Args:
             device_name: Name of device to emulate
-            use_wire: Whether to use selenium-wire for network monitoring
+            capture: Network capture backend (selenium-wire proxy, DevTools Network events or none)
+            profile_dir: Explicit user data directory (a per-driver profile is cloned from the template if None)
 
         Returns:
             webdriver.Chrome: Configured Chrome driver instance
         """
+        profile_name, launch_profile = self.get_launch_profile()
+        allocated_profile = None
+        driver = None
+        timer = StartupTimer(f"{device_name}/{capture.value}", launch_profile=profile_name)
         try:
             chrome_options = ChromeOptions()
 
-            # Use Chrome's built-in device emulation
-            mobile_emulation = {"deviceName": device_name}
-            chrome_options.add_experimental_option("mobileEmulation", mobile_emulation)
-
-            # Check for headless mode from pytest configuration
-            if os.getenv("HEADLESS", "false").lower() == "true":
+            # Check for headless mode from pytest configuration (unless the launch profile decides)
+            if launch_profile["headless"] is None and os.getenv("HEADLESS", "false").lower() == "true":
                 chrome_options.add_argument("--headless")
 
             # Add Chrome arguments from constants
@@ -70,29 +128,217 @@ class ChromeDriverFactory(BrowserFactory):
             for arg in ChromeOptionsConstants.MOBILE_EMULATION_ARGS:
                 chrome_options.add_argument(arg)
 
+            # Launch profile arguments and binary (e.g. chrome-headless-shell)
+            for arg in launch_profile["args"]:
+                chrome_options.add_argument(arg)
+
+            if launch_profile["binary"]:
+                chrome_options.binary_location = self._resolve_profile_binary(launch_profile["binary"])
+
+            # Every Chrome instance gets its own profile so parallel workers never contend for one
+            if profile_dir is None:
+                use_template = os.getenv("CHROME_PROFILE_TEMPLATE", "true").lower() == "true"
+                with timer.phase("profile_clone"):
+                    allocated_profile = ChromeProfileManager.allocate(self._warm_template if use_template else None)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir or allocated_profile}")
+
             # Mobile-specific preferences from constants
             chrome_options.add_experimental_option("prefs", ChromeOptionsConstants.CHROME_PREFS)
 
-            # Create driver with or without selenium-wire
-            service = ChromeService(ChromeDriverManager().install())
-            if use_wire:
-                driver = wire_webdriver.Chrome(service=service, options=chrome_options)
-            else:
-                driver = webdriver.Chrome(service=service, options=chrome_options)
+            if capture is NetworkCapture.CDP:
+                CdpCaptureChrome.enable_performance_log(chrome_options)
+
+            # Binary path resolved once and cached across workers
+            with timer.phase("binary_resolution"):
+                service = ChromeService(ChromeDriverCache.get_driver_path())
+
+            # Create driver for the capture backend (proxy setup, chromedriver spawn and session timed separately)
+            driver_class = {
+                NetworkCapture.WIRE: wire_webdriver.Chrome,
+                NetworkCapture.CDP: CdpCaptureChrome,
+                NetworkCapture.NONE: webdriver.Chrome,
+            }[capture]
+            driver_kwargs = {"service": service, "options": chrome_options}
+            if capture is NetworkCapture.WIRE:
+                # Start on in-memory storage, replaced by the configured bounded storage below
+                driver_kwargs["seleniumwire_options"] = {"request_storage": "memory"}
+            driver = timer.time_driver_construction(
+                lambda: driver_class(**driver_kwargs), service, wire=capture is NetworkCapture.WIRE
+            )
+
+            if capture is NetworkCapture.WIRE:
+                # Bounded, scoped request storage, in-flight request tracking for network idle waits,
+                # the visited document origins cleared on reset, the GraphQL operation index and the HAR
+                # recorder (DevTools drivers track their own events), then the GraphQL cassette and static
+                # asset cache, whose answers end the request hook chain
+                self._configure_capture_storage(driver)
+                NetworkActivityTracker.attach_to_wire_driver(driver)
+                VisitedOrigins.attach_to_wire_driver(driver)
+                GraphQLIndex.attach_to_wire_driver(driver)
+                HarRecorder.attach_to_wire_driver(driver)
+                Cassette.attach_to_wire_driver(driver)
+                self._configure_asset_cache(driver)
 
             # Configure timeouts for mobile from constants
-            driver.implicitly_wait(BrowserConstants.CHROME_IMPLICIT_WAIT)
-            driver.set_page_load_timeout(BrowserConstants.CHROME_PAGE_LOAD_TIMEOUT)
-            driver.set_script_timeout(BrowserConstants.CHROME_SCRIPT_TIMEOUT)
+            with timer.phase("timeout_configuration"):
+                driver.implicitly_wait(BrowserConstants.CHROME_IMPLICIT_WAIT)
+                driver.set_page_load_timeout(BrowserConstants.CHROME_PAGE_LOAD_TIMEOUT)
+                driver.set_script_timeout(BrowserConstants.CHROME_SCRIPT_TIMEOUT)
+
+            # Device emulation from the catalog, the same profile switch_device() and the pool restore apply
+            with timer.phase("device_emulation"):
+                DeviceEmulator.apply(driver, DeviceCatalog.get(device_name))
+
+            # First navigation proves the session is usable before it is handed out
+            with timer.phase("first_navigation"):
+                driver.get(DriverTimingConstants.FIRST_NAVIGATION_URL)
+
+            if allocated_profile:
+                ChromeProfileManager.register(driver, allocated_profile)
 
+            usage = ProcessMonitor.get_driver_usage(driver)
+            timer.finish(memory_mb=round(usage.rss_mb, 1) if usage else None)
             return driver
 
         except Exception as e:
-            driver_type = "with selenium-wire" if use_wire else ""
+            if driver is not None:
+                # Chrome, chromedriver and the selenium-wire proxy would outlive the failed setup
+                try:
+                    driver.quit()
+                except Exception:
+                    pass
+                ChromeProfileManager.release(driver)
+            if allocated_profile:
+                ChromeProfileManager.remove(allocated_profile)
+            driver_type = f"with {capture.value} network capture" if capture is not NetworkCapture.NONE else ""
             raise DriverException(
                 f"Failed to create mobile WebDriver {driver_type} for device '{device_name}'".strip(),
-                {"device": device_name, "use_wire": use_wire, "error": str(e)},
+                {"device": device_name, "network_capture": capture.value, "error": str(e)},
+            )
+
+    @staticmethod
+    def get_launch_profile() -> Tuple[str, Dict]:
+        """Get the launch profile selected for this run
+
+        Returns:
+            Tuple[str, Dict]: Profile name and its headless flag, binary and arguments
+
+        Raises:
+            ConfigurationException: If the configured profile is unknown
+        """
+        from config.settings import Settings
+
+        name = Settings.get_browser_config().launch_profile
+        if name not in LaunchProfileConstants.PROFILES:
+            raise ConfigurationException(
+                f"Unknown launch profile '{name}'",
+                {"launch_profile": name, "supported": list(LaunchProfileConstants.PROFILES)},
             )
+        return name, LaunchProfileConstants.PROFILES[name]
+
+    @staticmethod
+    def _configure_capture_storage(driver) -> None:
+        """Apply the configured capture scopes and storage bounds to a selenium-wire driver"""
+        from config.settings import Settings
+
+        storage_config = Settings.get_capture_storage_config()
+        CaptureStorage.install(
+            driver,
+            storage=storage_config.storage,
+            scopes=storage_config.scopes,
+            max_entries=storage_config.max_entries,
+            max_mb=storage_config.max_mb,
+            max_body_kb=storage_config.max_body_kb,
+        )
+
+    @staticmethod
+    def _configure_asset_cache(driver) -> None:
+        """Serve a selenium-wire driver's immutable static assets from the shared disk cache, if enabled"""
+        from config.settings import Settings
+
+        if Settings.get_asset_cache_config().enabled:
+            AssetCache.attach_to_wire_driver(driver)
+
+    @staticmethod
+    def _resolve_profile_binary(binary: str) -> str:
+        """Find the browser binary a launch profile asks for
+
+        Raises:
+            ConfigurationException: If the binary is not installed
+        """
+        override = os.getenv(LaunchProfileConstants.BINARY_ENV_OVERRIDES.get(binary, ""), "")
+        path = override or shutil.which(binary)
+        if not path or not os.path.isfile(path):
+            raise ConfigurationException(
+                f"Browser binary '{binary}' required by the launch profile was not found",
+                {"binary": binary, "env_override": LaunchProfileConstants.BINARY_ENV_OVERRIDES.get(binary)},
+            )
+        return path
+
+    def attach_context_driver(self, host_driver, target_id: str, device: str, capture: NetworkCapture):
+        """Attach a WebDriver session to a page in one of the host Chrome's browser contexts
+
+        Args:
+            host_driver: Driver that launched the Chrome process
+            target_id: DevTools target id of the page to drive
+            device: Name of device to emulate
+            capture: Network capture backend (DevTools events or none)
+
+        Returns:
+            ContextDriver: Session driving the page
+        """
+        chrome_options = ChromeOptions()
+        chrome_options.debugger_address = host_driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+
+        driver_class = ContextDriver
+        if capture is NetworkCapture.CDP:
+            CdpCaptureChrome.enable_performance_log(chrome_options)
+            driver_class = CdpCaptureContextDriver
+
+        driver = driver_class(host_driver.service.service_url, chrome_options)
+        try:
+            # chromedriver window handles are DevTools target ids
+            driver.switch_to.window(target_id)
+            driver.implicitly_wait(BrowserConstants.CHROME_IMPLICIT_WAIT)
+            driver.set_page_load_timeout(BrowserConstants.CHROME_PAGE_LOAD_TIMEOUT)
+            driver.set_script_timeout(BrowserConstants.CHROME_SCRIPT_TIMEOUT)
+            DeviceEmulator.apply(driver, DeviceCatalog.get(device))
+        except Exception:
+            driver.quit()
+            raise
+        return driver
+
+    def _warm_template(self, template_dir: str) -> None:
+        """Seed a template profile with the consent cookie, HTTP cache and service worker
+
+        Args:
+            template_dir: Empty user data directory to warm
+        """
+        from config.settings import Settings
+
+        driver = self._create_chrome_mobile_driver(BrowserConstants.DEFAULT_DEVICE, profile_dir=template_dir)
+        try:
+            driver.implicitly_wait(0)
+            for url in Settings.get_environment_config().get_test_urls().values():
+                driver.get(url)
+
+                # Accept the consent dialog so its cookie is persisted in the template
+                for button in driver.find_elements(By.XPATH, ChromeProfileConstants.CONSENT_BUTTON_XPATH)[:1]:
+                    button.click()
+
+                # Let the app-shell service worker install and cache its assets
+                driver.execute_async_script(
+                    """
+                    var done = arguments[arguments.length - 1];
+                    if (!('serviceWorker' in navigator)) { done(false); return; }
+                    var timer = setTimeout(function () { done(false); }, arguments[0]);
+                    navigator.serviceWorker.ready.then(function () { clearTimeout(timer); done(true); });
+                    """,
+                    ChromeProfileConstants.SERVICE_WORKER_TIMEOUT * 1000,
+                )
+        finally:
+            # A clean quit flushes cookies and cache to disk
+            driver.quit()
 
 
 # Note: Future browser support (Firefox, Safari, Edge) can be added when needed
@@ -105,7 +351,27 @@ class DriverManager:
     # Thread-safe storage for multiple driver instances (now supports any WebDriver type)
     _drivers: Dict[str, webdriver.Remote] = {}
     _browser_configs: Dict[str, Dict] = {}
-    _lock = threading.Lock()
+    _leases: Dict[str, PooledDriver] = {}
+
+    # Registry lock, held only for bookkeeping; slow work runs under per-key locks
+    _lock = threading.RLock()
+    _key_locks: Dict[Hashable, threading.Lock] = {}
+
+    # Browser context mode: one host Chrome per driver configuration, one context per worker key
+    _context_hosts: Dict[DriverKey, BrowserContextHost] = {}
+    _contexts: Dict[str, Tuple[BrowserContextHost, BrowserContext]] = {}
+
+    # Per-worker pool of warm drivers (created lazily from settings)
+    _pool: Optional[DriverPool] = None
+    _pool_stats = PoolStats()
+
+    # Captured request storage counters: session totals and the last finished test per worker
+    _capture_stats = CaptureStats()
+    _test_capture_stats: Dict[str, CaptureStats] = {}
+
+    # Recycling of pooled drivers that grew too large, too old or served too many tests
+    _health_monitor: Optional[DriverHealthMonitor] = None
+    _recycle_stats = RecycleStats()
 
     # Browser factory registry
     _browser_factories = {
@@ -121,44 +387,100 @@ class DriverManager:
         cls,
         worker_id: Optional[str] = None,
         device: Optional[str] = None,
-        browser: BrowserType = None
+        browser: BrowserType = None,
+        capture: Optional[NetworkCapture] = None,
     ):
-        """Get or create a thread-safe mobile WebDriver instance with selenium-wire for network monitoring
+        """Get or create a thread-safe mobile WebDriver instance with network monitoring
+
+        Drivers are borrowed from the driver pool, so a warm driver returned by a
+        previous test is reused when one is available for the same configuration.
+        In browser context mode the driver is a session on a fresh browser context
+        inside the worker's shared Chrome process instead.
+
+        Drivers are probed before they are handed out and a dead one is replaced
+        transparently. Commands that later fail because Chrome or chromedriver died
+        raise DeadSessionException right away and a replacement is launched.
 
         Args:
             worker_id: Optional worker ID for parallel execution (auto-detected if None)
             device: Device to emulate (defaults to iPhone SE)
             browser: Browser type to use (defaults to Chrome)
+            capture: Network capture backend (defaults to the NETWORK_CAPTURE setting)
 
         Returns:
-            WebDriver instance with mobile emulation and network monitoring (selenium-wire Chrome if available, regular Chrome otherwise)
+            WebDriver instance with mobile emulation and network monitoring (selenium-wire or DevTools
+            capture exposing driver.requests, or a regular Chrome driver when capture is disabled)
 
         Raises:
             DriverException: If driver creation fails
+            DeadSessionException: If the checked-out driver's session died while it was prepared
         """
         # Use default browser (Chrome)
         browser_type = browser or cls._default_browser
         device_name = device or cls._default_device
+        capture_backend = capture or cls.get_network_capture()
+        mode = cls.get_driver_mode()
         worker_key = cls._get_worker_key(worker_id)
 
-        with cls._lock:
+        # Only calls for the same worker key serialize, distinct workers launch browsers in parallel
+        with DriverStartupMetrics.acquire(cls._get_key_lock(worker_key), "worker"):
             try:
-                # Check if driver already exists for this worker
-                if worker_key not in cls._drivers:
-                    # Store configuration for this worker
-                    cls._browser_configs[worker_key] = {
-                        "browser": browser_type,
-                        "device": device_name,
-                        "mobile": True,
-                        "wire": True
-                    }
-
-                    # Create driver using appropriate factory
-                    factory = cls._get_browser_factory(browser_type)
-                    cls._drivers[worker_key] = factory.create_mobile_wire_driver(device_name)
-
-                return cls._drivers[worker_key]
+                # Check if driver already exists for this worker (and is still alive)
+                existing = cls._drivers.get(worker_key)
+                if existing is not None:
+                    reason = SessionProbe.check(existing)
+                    if reason is None:
+                        return existing
+                    SessionGuard.install(existing, cls._on_dead_session).mark_dead(reason)
+
+                browser_config = {
+                    "browser": browser_type,
+                    "device": device_name,
+                    "launch_device": device_name,
+                    "mobile": True,
+                    "network_capture": capture_backend.value,
+                    "mode": mode.value,
+                    "launch_profile": ChromeDriverFactory.get_launch_profile()[0],
+                    "performance_profile": cls._get_performance_profile().name,
+                }
+
+                driver_key = DriverKey(browser_type, device_name, capture_backend)
+                checkout_start = time.perf_counter()
+                lease = context = None
+                if mode is DriverMode.CONTEXT:
+                    # Open an isolated browser context in the shared Chrome process
+                    host = cls._get_context_host(driver_key)
+                    context = (host, host.open())
+                    driver = context[1].driver
+                else:
+                    # Borrow a driver from the pool (created by the browser factory if none is idle)
+                    lease = cls._get_pool().checkout(driver_key)
+                    driver = lease.driver
+                DriverStartupMetrics.add_checkout(time.perf_counter() - checkout_start)
+
+                # Store configuration and driver for this worker right away, so a failure below
+                # (or a dead session) returns the lease or closes the context
+                with DriverStartupMetrics.acquire(cls._lock, "registry"):
+                    cls._test_capture_stats[worker_key] = CaptureStats()
+                    cls._browser_configs[worker_key] = browser_config
+                    if lease is not None:
+                        cls._leases[worker_key] = lease
+                    if context is not None:
+                        cls._contexts[worker_key] = context
+                    cls._drivers[worker_key] = driver
+                SessionGuard.install(driver, cls._on_dead_session)
+
+                # Slow network and CPU down to the configured performance profile
+                cls._apply_performance_profile(driver)
 
+                # Counters from a previous test on a reused driver belong to that test
+                CaptureStorage.take_stats(driver)
+                return driver
+
+            except DeadSessionException:
+                # The session died while being prepared; callers retry on a fresh driver
+                cls._cleanup_worker(worker_key)
+                raise
             except Exception as e:
                 # Clean up failed driver creation
                 cls._cleanup_worker(worker_key)
@@ -167,6 +489,476 @@ class DriverManager:
                     {"worker_id": worker_key, "browser": browser_type.value, "device": device_name, "error": str(e)},
                 )
 
+    @classmethod
+    def release_driver(cls, worker_id: Optional[str] = None) -> None:
+        """Return a worker's WebDriver instance to the driver pool
+
+        The driver is reset and kept warm for the next test, or quit when pooling
+        is disabled, the reset fails or the driver crossed a memory, age or
+        tests-served recycling threshold. In browser context mode the context is
+        disposed together with all of its state.
+
+        Args:
+            worker_id: Optional worker ID (auto-detected if None)
+
+        Raises:
+            SessionResetException: If the driver could not be reset (the driver is quit)
+        """
+        worker_key = cls._get_worker_key(worker_id)
+        lease = cls._leases.pop(worker_key, None)
+        context = cls._contexts.pop(worker_key, None)
+        driver = cls._drivers.pop(worker_key, None)
+        browser_config = cls._browser_configs.pop(worker_key, None) or {}
+
+        # Captured request storage counters of the test, before the reset clears the storage
+        if driver is not None:
+            cls._collect_capture_stats(worker_key, driver)
+
+        # Footprint after a real test, before the reset frees its pages
+        usage = None
+        if driver is not None and context is None:
+            usage = ProcessMonitor.get_driver_usage(driver)
+            if usage:
+                DriverStartupMetrics.add_memory_sample(browser_config.get("launch_profile", ""), usage.rss_mb)
+
+        if lease is not None:
+            # Dead drivers are not worth a reset, replace them right away
+            dead_reason = SessionProbe.check(lease.driver)
+            if dead_reason is not None:
+                cls._get_health_monitor().record_dead_session(lease.key, dead_reason)
+                SessionGuard.install(lease.driver, cls._on_dead_session).mark_dead(dead_reason, notify=False)
+                cls._get_pool().discard(lease)
+                cls._get_pool().replenish(lease.key)
+                return
+
+            # Unhealthy drivers are quit instead of reused, the pool launches a replacement
+            recycle_reason = cls._get_health_monitor().check(lease, usage)
+            if recycle_reason is None and cls._restore_launch_device(lease.driver, browser_config):
+                try:
+                    cls._get_pool().checkin(lease)
+                except Exception:
+                    # The pool quit the driver that failed to reset
+                    cls._get_pool().replenish(lease.key)
+                    raise
+            else:
+                cls._get_pool().discard(lease)
+                cls._get_pool().replenish(lease.key)
+        elif context is not None:
+            host, browser_context = context
+            host.close_context(browser_context)
+        elif driver is not None:
+            cls._quit_driver_instance(driver, worker_key)
+
+    @classmethod
+    def switch_device(cls, device: str, worker_id: Optional[str] = None) -> DeviceProfile:
+        """Switch the emulated device of a worker's live driver without relaunching Chrome
+
+        The new metrics apply immediately and the user agent from the next
+        navigation on. Pooled drivers are switched back to their launch device
+        when they are returned.
+
+        Args:
+            device: Catalog name of the device to emulate
+            worker_id: Optional worker ID (auto-detected if None)
+
+        Returns:
+            DeviceProfile: The emulated device
+
+        Raises:
+            UnsupportedDeviceException: If the device is not in the catalog
+            DriverException: If the worker has no driver or emulation fails
+        """
+        worker_key = cls._get_worker_key(worker_id)
+        driver = cls._drivers.get(worker_key)
+        if driver is None:
+            raise DriverException(f"No driver checked out for worker '{worker_key}'", {"worker_id": worker_key})
+
+        profile = DeviceCatalog.get(device)
+        try:
+            DeviceEmulator.apply(driver, profile)
+        except DeadSessionException:
+            raise
+        except Exception as e:
+            raise DriverException(
+                f"Failed to emulate device '{device}' for worker '{worker_key}': {e}",
+                {"worker_id": worker_key, "device": device, "error": str(e)},
+            )
+
+        cls._browser_configs[worker_key]["device"] = device
+        return profile
+
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, Dict[str, int]]:
+        """Get occupancy of the driver pool
+
+        Returns:
+            Dict[str, Dict[str, int]]: Total and idle driver counts per driver configuration
+        """
+        if cls._pool is None:
+            return {}
+        return cls._pool.stats()
+
+    @classmethod
+    def get_network_capture(cls) -> NetworkCapture:
+        """Get the network capture backend selected for this run
+
+        Returns:
+            NetworkCapture: Backend from the NETWORK_CAPTURE setting
+
+        Raises:
+            ConfigurationException: If the configured backend is unknown
+        """
+        from config.settings import Settings
+
+        backend = Settings.get_browser_config().network_capture
+        try:
+            return NetworkCapture(backend)
+        except ValueError:
+            raise ConfigurationException(
+                f"Unknown network capture backend '{backend}'",
+                {"network_capture": backend, "supported": NetworkCaptureConstants.BACKENDS},
+            )
+
+    @classmethod
+    def get_driver_mode(cls) -> DriverMode:
+        """Get the driver mode selected for this run
+
+        Returns:
+            DriverMode: Mode from the DRIVER_MODE setting
+
+        Raises:
+            ConfigurationException: If the configured mode is unknown
+        """
+        from config.settings import Settings
+
+        mode = Settings.get_browser_context_config().mode
+        try:
+            return DriverMode(mode)
+        except ValueError:
+            raise ConfigurationException(
+                f"Unknown driver mode '{mode}'",
+                {"driver_mode": mode, "supported": BrowserContextConstants.MODES},
+            )
+
+    @classmethod
+    def get_context_stats(cls) -> Dict[str, int]:
+        """Get the number of open browser contexts per host Chrome
+
+        Returns:
+            Dict[str, int]: Open context count per driver configuration
+        """
+        return {str(key): host.open_contexts for key, host in cls._context_hosts.items()}
+
+    @classmethod
+    def get_capture_stats(cls, worker_id: Optional[str] = None) -> Dict[str, int]:
+        """Get captured request storage counters of a worker's current test
+
+        Args:
+            worker_id: Optional worker ID (auto-detected if None)
+
+        Returns:
+            Dict[str, int]: Stored, evicted and truncated counts and stored bytes since the test started,
+            or the counters of the worker's last finished test if it holds no driver
+        """
+        worker_key = cls._get_worker_key(worker_id)
+        driver = cls._drivers.get(worker_key)
+        if driver is not None:
+            cls._collect_capture_stats(worker_key, driver)
+        stats = cls._test_capture_stats.get(worker_key)
+        return stats.as_dict() if stats else {}
+
+    @classmethod
+    def get_capture_totals(cls) -> Dict[str, int]:
+        """Get captured request storage counters summed over this worker's tests
+
+        Returns:
+            Dict[str, int]: Stored, evicted and truncated counts and peak stored bytes
+        """
+        return cls._capture_stats.as_dict()
+
+    @classmethod
+    def _collect_capture_stats(cls, worker_key: str, driver) -> None:
+        """Move a driver's storage counters into the worker's per-test and session counters"""
+        stats = CaptureStorage.take_stats(driver)
+        if stats is None:
+            return
+        with cls._lock:
+            test_stats = cls._test_capture_stats.setdefault(worker_key, CaptureStats())
+            test_stats.merge(stats)
+            cls._capture_stats.merge(stats)
+
+    @classmethod
+    def get_recycle_stats(cls) -> Dict[str, float]:
+        """Get driver health checks and recycling decisions for this worker
+
+        Returns:
+            Dict[str, float]: Recycling counters and peak process tree usage
+        """
+        return cls._recycle_stats.as_dict()
+
+    @classmethod
+    def get_prefetch_stats(cls) -> Dict[str, float]:
+        """Get driver checkout outcomes for this worker, including background prefetch hits and misses
+
+        Returns:
+            Dict[str, float]: Pool checkout counters accumulated over the session
+        """
+        return cls._pool_stats.as_dict()
+
+    @classmethod
+    def get_startup_timings(cls) -> Dict[str, Union[list, dict]]:
+        """Get per-phase startup records of drivers created by this worker, its checkout latencies,
+        end-of-test memory samples per launch profile and DriverManager lock waits
+
+        Returns:
+            Dict[str, Union[list, dict]]: Startup records, seconds each test waited for a driver and memory samples
+        """
+        return {
+            "records": DriverStartupMetrics.records(),
+            "checkout_seconds": DriverStartupMetrics.checkout_seconds(),
+            "memory_samples": DriverStartupMetrics.memory_samples(),
+            "lock_waits": DriverStartupMetrics.lock_waits(),
+        }
+
+    @classmethod
+    def _get_key_lock(cls, key: Hashable) -> threading.Lock:
+        """Get the lock serializing slow work (driver or host creation) for one key"""
+        with cls._lock:
+            lock = cls._key_locks.get(key)
+            if lock is None:
+                lock = cls._key_locks[key] = threading.Lock()
+            return lock
+
+    @classmethod
+    def _get_pool(cls) -> DriverPool:
+        """Get the driver pool, creating it from settings on first use"""
+        with cls._lock:
+            if cls._pool is None:
+                from config.settings import Settings
+
+                pool_config = Settings.get_driver_pool_config()
+                cls._pool = DriverPool(
+                    create=cls._create_pooled_driver,
+                    destroy=cls._quit_driver_instance,
+                    reset=cls._reset_driver,
+                    validate=cls._is_driver_alive,
+                    min_size=pool_config.min_size,
+                    max_size=pool_config.max_size,
+                    idle_timeout=pool_config.idle_timeout,
+                    checkout_timeout=pool_config.checkout_timeout,
+                    reuse=pool_config.enabled,
+                    prefetch_depth=pool_config.prefetch_depth,
+                    stats=cls._pool_stats,
+                )
+            return cls._pool
+
+    @classmethod
+    def _get_health_monitor(cls) -> DriverHealthMonitor:
+        """Get the driver health monitor, creating it from settings on first use"""
+        with cls._lock:
+            if cls._health_monitor is None:
+                from config.settings import Settings
+
+                health_config = Settings.get_driver_health_config()
+                cls._health_monitor = DriverHealthMonitor(
+                    max_rss_mb=health_config.max_rss_mb,
+                    max_age=health_config.max_age,
+                    max_tests=health_config.max_tests,
+                    stats=cls._recycle_stats,
+                )
+            return cls._health_monitor
+
+    @classmethod
+    def _get_context_host(cls, key: DriverKey) -> BrowserContextHost:
+        """Get the Chrome process hosting browser contexts for a driver configuration, launching it on first use
+
+        Args:
+            key: Driver configuration of the host
+
+        Returns:
+            BrowserContextHost: Host for the configuration
+
+        Raises:
+            ConfigurationException: If the network capture backend cannot be used with browser contexts
+        """
+        host = cls._context_hosts.get(key)
+        if host is not None and cls._is_driver_alive(host.driver, key):
+            return host
+
+        # Hosts for different configurations launch in parallel, the same one only once
+        with DriverStartupMetrics.acquire(cls._get_key_lock(("context_host", key)), "context_host"):
+            host = cls._context_hosts.get(key)
+            if host is not None:
+                if cls._is_driver_alive(host.driver, key):
+                    return host
+                cls._discard_context_host(host)
+
+            from config.settings import Settings
+
+            if key.capture is NetworkCapture.WIRE:
+                # The selenium-wire proxy is browser-wide, its captured requests would mix all contexts
+                raise ConfigurationException(
+                    "Browser context mode needs the 'cdp' or 'none' network capture backend",
+                    {"driver_mode": DriverMode.CONTEXT.value, "network_capture": key.capture.value},
+                )
+
+            factory = cls._get_browser_factory(key.browser)
+            host = BrowserContextHost(
+                cls._create_pooled_driver(key),
+                attach=lambda host_driver, target_id: factory.attach_context_driver(
+                    host_driver, target_id, key.device, key.capture
+                ),
+                max_contexts=Settings.get_browser_context_config().max_contexts,
+                label=f"{key}/context",
+            )
+            with cls._lock:
+                cls._context_hosts[key] = host
+            return host
+
+    @classmethod
+    def _is_driver_alive(cls, driver, key: Optional[Hashable] = None) -> bool:
+        """Probe a driver before it is handed out, marking it dead so quitting it does not hang
+
+        Args:
+            driver: WebDriver instance to probe
+            key: Optional driver configuration for the log message
+
+        Returns:
+            bool: True if the session is alive
+        """
+        reason = SessionProbe.check(driver)
+        if reason is None:
+            return True
+
+        cls._get_health_monitor().record_dead_session(key or "idle driver", reason)
+        SessionGuard.install(driver, cls._on_dead_session).mark_dead(reason, notify=False)
+        return False
+
+    @classmethod
+    def _on_dead_session(cls, driver, reason: str) -> None:
+        """Replace a checked-out driver whose session died
+
+        The worker's driver is dropped so its next request gets a new one; pooled
+        drivers get a replacement launched in the background right away, and a dead
+        host Chrome is discarded so the next browser context starts a new one.
+
+        Args:
+            driver: Driver whose session is dead
+            reason: Why the session is dead
+        """
+        with cls._lock:
+            worker_key = next((key for key, owned in cls._drivers.items() if owned is driver), None)
+            lease = cls._leases.get(worker_key)
+            context = cls._contexts.get(worker_key)
+
+        cls._get_health_monitor().record_dead_session(worker_key or "unowned driver", reason)
+        if worker_key is None:
+            return
+
+        # A context session can die with its host Chrome, mark the host first so disposing does not hang
+        host_dead = context is not None and not cls._is_driver_alive(context[0].driver, "context host")
+
+        cls._cleanup_worker(worker_key)
+
+        if lease is not None:
+            cls._get_pool().replenish(lease.key)
+        elif host_dead:
+            cls._discard_context_host(context[0])
+
+    @classmethod
+    def _discard_context_host(cls, host: BrowserContextHost) -> None:
+        """Forget a host Chrome whose session died, closing its contexts and quitting it"""
+        with cls._lock:
+            for key in [key for key, hosted in cls._context_hosts.items() if hosted is host]:
+                del cls._context_hosts[key]
+
+        host.close()
+        cls._quit_driver_instance(host.driver)
+
+    @classmethod
+    def _create_pooled_driver(cls, key: DriverKey):
+        """Create a new driver for a pool key using the appropriate factory
+
+        Args:
+            key: Driver configuration to create a driver for
+
+        Returns:
+            WebDriver instance
+        """
+        factory = cls._get_browser_factory(key.browser)
+        return factory.create_mobile_wire_driver(key.device, key.capture)
+
+    @classmethod
+    def _reset_driver(cls, driver) -> None:
+        """Bring a returned driver back to a clean state before it is reused
+
+        Args:
+            driver: WebDriver instance to reset
+
+        Raises:
+            SessionResetException: If the reset fails or state leaked into the driver
+        """
+        from config.settings import Settings
+
+        verify = os.getenv("SESSION_RESET_VERIFY", str(SessionResetConstants.VERIFY_RESET)).lower() == "true"
+        SessionReset.reset(driver, extra_origins=[Settings.get_base_url()], verify=verify)
+
+    @classmethod
+    def _get_performance_profile(cls) -> PerformanceProfile:
+        """Get the configured performance profile
+
+        Raises:
+            ConfigurationException: If the configured profile is unknown
+        """
+        from config.settings import Settings
+
+        return PerformanceThrottler.get(Settings.get_browser_config().performance_profile)
+
+    @classmethod
+    def _apply_performance_profile(cls, driver) -> None:
+        """Throttle a checked-out driver to the configured performance profile
+
+        Applied on every checkout, since context drivers start with a fresh page
+        target; drivers are left untouched when no profile is configured.
+        """
+        profile = cls._get_performance_profile()
+        if profile.throttled:
+            PerformanceThrottler.apply(driver, profile)
+
+    @classmethod
+    def _restore_launch_device(cls, driver, browser_config: Dict) -> bool:
+        """Switch a driver back to the device it was launched for before it returns to the pool
+
+        Returns:
+            bool: True if the driver emulates its launch device again, False if it should be discarded
+        """
+        launch_device = browser_config.get("launch_device")
+        if browser_config.get("device") == launch_device:
+            return True
+
+        try:
+            DeviceEmulator.apply(driver, DeviceCatalog.get(launch_device))
+            return True
+        except Exception as e:
+            print(f"Warning: Failed to restore device '{launch_device}', discarding driver: {e}")
+            return False
+
+    @classmethod
+    def _quit_driver_instance(cls, driver, worker_key: Optional[str] = None) -> None:
+        """Quit a WebDriver instance, logging instead of raising on failure
+
+        Args:
+            driver: WebDriver instance to quit
+            worker_key: Optional worker identifier for the warning message
+        """
+        try:
+            driver.quit()
+        except Exception as e:
+            # Log warning but don't raise exception during cleanup
+            owner = f" for worker '{worker_key}'" if worker_key else ""
+            print(f"Warning: Error quitting driver{owner}: {e}")
+        finally:
+            ChromeProfileManager.release(driver)
 
     @classmethod
     def _get_browser_factory(cls, browser_type: BrowserType) -> BrowserFactory:
@@ -231,12 +1023,21 @@ class DriverManager:
 
     @classmethod
     def quit_all_drivers(cls) -> None:
-        """Quit all mobile WebDriver instances (cleanup for test session end)"""
+        """Quit all mobile WebDriver instances, including idle pooled ones (cleanup for test session end)"""
         with cls._lock:
             worker_keys = list(cls._drivers.keys())
             for worker_key in worker_keys:
                 cls._cleanup_worker(worker_key)
 
+            for host in cls._context_hosts.values():
+                host.close()
+                cls._quit_driver_instance(host.driver)
+            cls._context_hosts.clear()
+
+            if cls._pool is not None:
+                cls._pool.close()
+                cls._pool = None
+
     @classmethod
     def _cleanup_worker(cls, worker_key: str) -> None:
         """Internal method to cleanup a specific worker's resources
@@ -244,17 +1045,19 @@ class DriverManager:
         Args:
             worker_key: Worker identifier to cleanup
         """
-        if worker_key in cls._drivers:
-            try:
-                cls._drivers[worker_key].quit()
-            except Exception as e:
-                # Log warning but don't raise exception during cleanup
-                print(
-                    f"Warning: Error quitting driver for worker '{worker_key}': {e}"
-                )
-            finally:
-                cls._drivers.pop(worker_key, None)
-                cls._browser_configs.pop(worker_key, None)
+        lease = cls._leases.pop(worker_key, None)
+        context = cls._contexts.pop(worker_key, None)
+        driver = cls._drivers.pop(worker_key, None)
+        cls._browser_configs.pop(worker_key, None)
+
+        if lease is not None:
+            # Quit the driver and free its pool slot
+            cls._get_pool().discard(lease)
+        elif context is not None:
+            host, browser_context = context
+            host.close_context(browser_context)
+        elif driver is not None:
+            cls._quit_driver_instance(driver, worker_key)
 
     @classmethod
     def get_current_device(cls, worker_id: Optional[str] = None) -> Optional[str]:
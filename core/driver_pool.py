@@ -0,0 +1,396 @@
+"""
+Driver Pool - Thread-safe pool of warm WebDriver instances with checkout/return semantics
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from core.exceptions.framework_exceptions import DriverException
+
+
+@dataclass
+class PooledDriver:
+    """A WebDriver instance owned by the pool"""
+
+    driver: Any
+    key: Hashable
+    prefetched: bool = False
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+    checkouts: int = 0
+
+    @property
+    def age(self) -> float:
+        """Seconds since the driver was created"""
+        return time.monotonic() - self.created_at
+
+    @property
+    def idle_time(self) -> float:
+        """Seconds since the driver was last checked out or returned"""
+        return time.monotonic() - self.last_used_at
+
+
+@dataclass
+class PoolStats:
+    """Checkout outcome counters for a pool"""
+
+    checkouts: int = 0
+    reuse_hits: int = 0  # Served by a driver returned by a previous test
+    prefetch_hits: int = 0  # Served by a prefetched driver that was already running
+    prefetch_waits: int = 0  # Waited for an in-flight prefetch to finish
+    misses: int = 0  # Driver created synchronously on the checkout path
+    prefetched: int = 0
+    prefetch_failures: int = 0
+    unused_prefetches: int = 0  # Prefetched drivers quit without ever being checked out
+    invalid_discards: int = 0  # Idle drivers found unusable on checkout and quit
+    prefetch_wait_seconds: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the counters as a dictionary"""
+        return asdict(self)
+
+
+class DriverPool:
+    """Pool of pre-launched WebDriver instances keyed by driver configuration
+
+    Drivers are borrowed with checkout() and handed back with checkin(). For every
+    key the pool keeps at least min_size drivers alive, never holds more than
+    max_size drivers (idle, checked out or being created) and quits idle drivers
+    above the minimum once they have been unused for idle_timeout seconds.
+
+    After every checkout the pool speculatively launches drivers on background
+    threads until prefetch_depth drivers are ready for the next checkout of that
+    key, so it normally finds a running driver instead of creating one. With reuse
+    a checked-out driver counts as ready, it comes back on checkin; background
+    launches then only replace drivers that were discarded or recycled.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[Hashable], Any],
+        destroy: Callable[[Any], None],
+        reset: Optional[Callable[[Any], None]] = None,
+        validate: Optional[Callable[[Any], bool]] = None,
+        min_size: int = 1,
+        max_size: int = 4,
+        idle_timeout: float = 300,
+        checkout_timeout: float = 60,
+        reuse: bool = True,
+        prefetch_depth: int = 0,
+        stats: Optional[PoolStats] = None,
+    ):
+        """Initialize the pool
+
+        Args:
+            create: Callable creating a new driver for a pool key
+            destroy: Callable quitting a driver
+            reset: Optional callable restoring a returned driver to a clean state
+            validate: Optional callable telling whether an idle driver is still usable before it is handed out
+            min_size: Number of drivers kept alive per key
+            max_size: Maximum number of drivers per key
+            idle_timeout: Seconds after which idle drivers above min_size are quit
+            checkout_timeout: Seconds a checkout waits when the pool is full
+            reuse: Whether returned drivers are kept for reuse (False quits them on return)
+            prefetch_depth: Number of drivers kept ready per key (idle, launching or, with reuse, checked out)
+            stats: Optional counters object to update (shared across pool instances)
+        """
+        if max_size < 1:
+            raise DriverException("Driver pool max_size must be at least 1", {"max_size": max_size})
+
+        self._create = create
+        self._destroy = destroy
+        self._reset = reset
+        self._validate = validate
+        self.min_size = max(0, min(min_size, max_size)) if reuse else 0
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.reuse = reuse
+        self.prefetch_depth = max(0, prefetch_depth)
+        self.pool_stats = stats or PoolStats()
+
+        self._idle: Dict[Hashable, List[PooledDriver]] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._pending: Dict[Hashable, int] = {}
+        self._prefetch_threads: List[threading.Thread] = []
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def checkout(self, key: Hashable) -> PooledDriver:
+        """Borrow a driver for the given key, creating one if none is idle or launching
+
+        Args:
+            key: Driver configuration key
+
+        Returns:
+            PooledDriver: Checked-out driver entry
+
+        Raises:
+            DriverException: If the pool is closed, exhausted past checkout_timeout or creation fails
+        """
+        deadline = time.monotonic() + self.checkout_timeout
+        wait_started = None
+
+        while True:
+            entry = None
+            expired = []
+
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise DriverException("Driver pool is closed", {"key": str(key)})
+
+                    expired.extend(self._collect_expired_locked())
+
+                    idle = self._idle.get(key)
+                    if idle:
+                        # Most recently returned driver first, it is the warmest
+                        entry = idle.pop()
+                        break
+
+                    if self._pending.get(key):
+                        # A background launch is already under way, waiting beats starting another one
+                        wait_started = wait_started or time.monotonic()
+                    elif self._sizes.get(key, 0) < self.max_size:
+                        self._sizes[key] = self._sizes.get(key, 0) + 1
+                        break
+
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise DriverException(
+                            f"Timed out after {self.checkout_timeout}s waiting for a pooled driver",
+                            {"key": str(key), "max_size": self.max_size},
+                        )
+                    self._condition.wait(remaining)
+
+            self._destroy_entries(expired)
+
+            # Idle drivers may have died since they were returned, validate outside the lock
+            if entry is not None and self._validate is not None and not self._validate(entry.driver):
+                with self._condition:
+                    self.pool_stats.invalid_discards += 1
+                self.discard(entry)
+                continue
+
+            with self._condition:
+                self._record_checkout_locked(entry, wait_started)
+            break
+
+        if entry is None:
+            entry = self._create_entry(key)
+
+        entry.checkouts += 1
+        entry.last_used_at = time.monotonic()
+
+        self._schedule_prefetch(key)
+        return entry
+
+    def checkin(self, entry: PooledDriver) -> None:
+        """Return a driver to the pool, resetting it for the next test
+
+        Drivers that fail to reset are quit instead of being reused and the reset
+        error is re-raised, so leaked state never reaches the next test silently.
+
+        Args:
+            entry: Driver entry previously returned by checkout()
+        """
+        if not self.reuse or self._closed:
+            self.discard(entry)
+            return
+
+        if self._reset is not None:
+            try:
+                self._reset(entry.driver)
+            except Exception:
+                self.discard(entry)
+                raise
+
+        entry.last_used_at = time.monotonic()
+        self._add_idle(entry)
+
+    def discard(self, entry: PooledDriver) -> None:
+        """Quit a driver and release its slot in the pool
+
+        Args:
+            entry: Driver entry to discard
+        """
+        try:
+            self._destroy(entry.driver)
+        finally:
+            with self._condition:
+                self._release_slot_locked(entry.key)
+
+    def replenish(self, key: Hashable) -> None:
+        """Launch replacement drivers in the background for a key that lost drivers
+
+        Args:
+            key: Driver configuration key
+        """
+        self._schedule_prefetch(key)
+
+    def close(self, prefetch_timeout: float = 60) -> None:
+        """Quit all idle drivers and refuse further checkouts
+
+        Args:
+            prefetch_timeout: Seconds to wait for in-flight background launches to finish
+        """
+        with self._condition:
+            self._closed = True
+            threads = list(self._prefetch_threads)
+            self._condition.notify_all()
+
+        # Drivers launched after the pool closed are quit by the prefetch thread itself
+        deadline = time.monotonic() + prefetch_timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+
+        with self._condition:
+            entries = [entry for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+            self.pool_stats.unused_prefetches += sum(
+                1 for entry in entries if entry.prefetched and entry.checkouts == 0
+            )
+
+        self._destroy_entries(entries)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Get per-key pool occupancy
+
+        Returns:
+            Dict[str, Dict[str, int]]: Total, idle and launching driver counts per key
+        """
+        with self._condition:
+            return {
+                str(key): {
+                    "total": size,
+                    "idle": len(self._idle.get(key, [])),
+                    "launching": self._pending.get(key, 0),
+                }
+                for key, size in self._sizes.items()
+            }
+
+    def _record_checkout_locked(self, entry: Optional[PooledDriver], wait_started: Optional[float]) -> None:
+        """Classify a checkout outcome in the pool statistics"""
+        stats = self.pool_stats
+        stats.checkouts += 1
+
+        if entry is None:
+            stats.misses += 1
+        elif not entry.prefetched or entry.checkouts:
+            # Also when a checkout waited on a launch but a returned driver came first
+            stats.reuse_hits += 1
+        elif wait_started is not None:
+            stats.prefetch_waits += 1
+            stats.prefetch_wait_seconds += time.monotonic() - wait_started
+        else:
+            stats.prefetch_hits += 1
+
+    def _schedule_prefetch(self, key: Hashable) -> None:
+        """Launch drivers in the background up to min_size and prefetch_depth for a key"""
+        with self._condition:
+            if self._closed:
+                return
+
+            size = self._sizes.get(key, 0)
+            ready = len(self._idle.get(key, [])) + self._pending.get(key, 0)
+            if self.reuse:
+                # Checked-out drivers return on checkin and serve the next checkout
+                ready = size
+            count = max(self.min_size - size, self.prefetch_depth - ready)
+            count = min(count, self.max_size - size)
+            if count <= 0:
+                return
+
+            self._sizes[key] = size + count
+            self._pending[key] = self._pending.get(key, 0) + count
+
+            # Forget finished threads so the list does not grow with every test
+            self._prefetch_threads = [thread for thread in self._prefetch_threads if thread.is_alive()]
+            for _ in range(count):
+                thread = threading.Thread(target=self._prefetch, args=(key,), name="driver-prefetch", daemon=True)
+                self._prefetch_threads.append(thread)
+                thread.start()
+
+    def _prefetch(self, key: Hashable) -> None:
+        """Background thread body creating one driver for a reserved slot"""
+        try:
+            entry = self._create_entry(key, prefetched=True)
+        except Exception as e:
+            print(f"Warning: Failed to prefetch driver for '{key}': {e}")
+            with self._condition:
+                self.pool_stats.prefetch_failures += 1
+                self._pending[key] -= 1
+                self._condition.notify_all()
+            return
+
+        with self._condition:
+            self.pool_stats.prefetched += 1
+            self._pending[key] -= 1
+        self._add_idle(entry)
+
+    def _create_entry(self, key: Hashable, prefetched: bool = False) -> PooledDriver:
+        """Create a driver for a slot already reserved in _sizes"""
+        try:
+            driver = self._create(key)
+        except Exception:
+            with self._condition:
+                self._release_slot_locked(key)
+            raise
+        return PooledDriver(driver=driver, key=key, prefetched=prefetched)
+
+    def _add_idle(self, entry: PooledDriver) -> None:
+        """Put a driver back on the idle list and wake up waiting checkouts"""
+        with self._condition:
+            if self._closed:
+                closed = True
+                if entry.prefetched and entry.checkouts == 0:
+                    self.pool_stats.unused_prefetches += 1
+            else:
+                closed = False
+                self._idle.setdefault(entry.key, []).append(entry)
+                self._condition.notify_all()
+
+        if closed:
+            self.discard(entry)
+
+    def _collect_expired_locked(self) -> List[PooledDriver]:
+        """Remove idle drivers past idle_timeout, keeping min_size drivers per key"""
+        expired = []
+        for key, idle in self._idle.items():
+            # Oldest idle drivers sit at the front of the list
+            while idle and self._sizes.get(key, 0) > self.min_size and idle[0].idle_time > self.idle_timeout:
+                entry = idle.pop(0)
+                if entry.prefetched and entry.checkouts == 0:
+                    self.pool_stats.unused_prefetches += 1
+                expired.append(entry)
+                self._sizes[key] -= 1
+
+        for key in [key for key, size in self._sizes.items() if size <= 0]:
+            self._sizes.pop(key, None)
+            self._idle.pop(key, None)
+        return expired
+
+    def _destroy_entries(self, entries: List[PooledDriver]) -> None:
+        """Quit drivers whose slots have already been released"""
+        for entry in entries:
+            try:
+                self._destroy(entry.driver)
+            except Exception as e:
+                print(f"Warning: Error quitting pooled driver for '{entry.key}': {e}")
+
+        if entries:
+            with self._condition:
+                self._condition.notify_all()
+
+    def _release_slot_locked(self, key: Hashable) -> None:
+        """Release one driver slot for a key and wake up waiting checkouts"""
+        size = self._sizes.get(key, 0) - 1
+        if size > 0:
+            self._sizes[key] = size
+        else:
+            self._sizes.pop(key, None)
+            if not self._idle.get(key):
+                self._idle.pop(key, None)
+        self._condition.notify_all()
@@ -0,0 +1,207 @@
+"""
+Driver Timing - Phase-by-phase timing of WebDriver startup
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from config.constants import DriverTimingConstants
+
+
+@dataclass
+class StartupRecord:
+    """Timing of one driver startup, in seconds per phase"""
+
+    worker: str
+    label: str
+    started_at: str
+    phases: Dict[str, float] = field(default_factory=dict)
+    total: float = 0.0
+    launch_profile: str = ""
+    memory_mb: Optional[float] = None  # Process tree RSS right after startup
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the record as a dictionary"""
+        return asdict(self)
+
+
+class StartupTimer:
+    """Measures the phases of a single driver startup
+
+    Example:
+        timer = StartupTimer("iPhone SE/wire")
+        with timer.phase("binary_resolution"):
+            path = resolve_driver()
+        driver = timer.time_driver_construction(lambda: Chrome(service=service), service, wire=True)
+        timer.finish()
+    """
+
+    def __init__(self, label: str, launch_profile: str = ""):
+        self.record = StartupRecord(
+            worker=os.getenv("PYTEST_XDIST_WORKER", "main"),
+            label=label,
+            started_at=datetime.now().isoformat(timespec="milliseconds"),
+            launch_profile=launch_profile,
+        )
+        self._start_time = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block of code as the given phase"""
+        phase_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - phase_start)
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a phase"""
+        self.record.phases[name] = self.record.phases.get(name, 0.0) + seconds
+
+    def time_driver_construction(self, construct: Callable[[], Any], service, wire: bool) -> Any:
+        """Construct a driver, splitting the constructor into proxy setup, chromedriver spawn and session creation
+
+        The driver constructor sets up the selenium-wire proxy, starts the chromedriver
+        service and creates the browser session in one call; wrapping service.start()
+        yields the boundaries between those phases.
+
+        Args:
+            construct: Callable creating the driver with the given service
+            service: Service instance passed to the driver
+            wire: Whether the driver is a selenium-wire driver
+
+        Returns:
+            The constructed driver
+        """
+        marks = {}
+        original_start = service.start
+
+        def timed_start(*args, **kwargs):
+            marks["spawn_start"] = time.perf_counter()
+            try:
+                return original_start(*args, **kwargs)
+            finally:
+                marks["spawn_end"] = time.perf_counter()
+
+        service.start = timed_start
+        construct_start = time.perf_counter()
+        try:
+            driver = construct()
+        finally:
+            del service.start
+        construct_end = time.perf_counter()
+
+        if "spawn_end" in marks:
+            before_spawn = marks["spawn_start"] - construct_start
+            self.add("proxy_setup" if wire else "session_creation", before_spawn)
+            self.add("chromedriver_spawn", marks["spawn_end"] - marks["spawn_start"])
+            self.add("session_creation", construct_end - marks["spawn_end"])
+        else:
+            self.add("session_creation", construct_end - construct_start)
+
+        return driver
+
+    def finish(self, memory_mb: Optional[float] = None) -> StartupRecord:
+        """Complete the measurement and store the record
+
+        Args:
+            memory_mb: Optional memory footprint of the started browser
+        """
+        self.record.total = time.perf_counter() - self._start_time
+        self.record.memory_mb = memory_mb
+        DriverStartupMetrics.add_record(self.record)
+        return self.record
+
+
+class DriverStartupMetrics:
+    """Per-worker store of driver startup records, checkout latencies, memory samples and lock waits"""
+
+    _lock = threading.Lock()
+    _records: List[StartupRecord] = []
+    _checkout_seconds: List[float] = []
+    _memory_samples: Dict[str, List[float]] = {}
+    _lock_waits: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def add_record(cls, record: StartupRecord) -> None:
+        """Store a completed startup record"""
+        with cls._lock:
+            cls._records.append(record)
+
+    @classmethod
+    def add_checkout(cls, seconds: float) -> None:
+        """Store how long a test waited for DriverManager to hand out a driver"""
+        with cls._lock:
+            cls._checkout_seconds.append(seconds)
+
+    @classmethod
+    def add_memory_sample(cls, launch_profile: str, memory_mb: float) -> None:
+        """Store the memory footprint of a browser measured when a test handed it back"""
+        with cls._lock:
+            cls._memory_samples.setdefault(launch_profile, []).append(memory_mb)
+
+    @classmethod
+    @contextmanager
+    def acquire(cls, lock, name: str) -> Iterator[None]:
+        """Hold a lock, recording how long acquiring it took under the given name
+
+        Args:
+            lock: Lock to acquire
+            name: Name the wait is recorded under (e.g. "worker", "registry")
+        """
+        wait_start = time.perf_counter()
+        lock.acquire()
+        try:
+            cls.add_lock_wait(name, time.perf_counter() - wait_start)
+            yield
+        finally:
+            lock.release()
+
+    @classmethod
+    def add_lock_wait(cls, name: str, seconds: float) -> None:
+        """Store one lock acquisition and the time spent waiting for it"""
+        with cls._lock:
+            waits = cls._lock_waits.setdefault(
+                name, {"acquisitions": 0, "contended": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            )
+            waits["acquisitions"] += 1
+            waits["wait_seconds"] += seconds
+            waits["max_wait_seconds"] = max(waits["max_wait_seconds"], seconds)
+            if seconds > DriverTimingConstants.LOCK_CONTENTION_THRESHOLD:
+                waits["contended"] += 1
+
+    @classmethod
+    def records(cls) -> List[Dict[str, Any]]:
+        """Get this worker's startup records as dictionaries"""
+        with cls._lock:
+            return [record.as_dict() for record in cls._records]
+
+    @classmethod
+    def checkout_seconds(cls) -> List[float]:
+        """Get this worker's driver checkout latencies"""
+        with cls._lock:
+            return list(cls._checkout_seconds)
+
+    @classmethod
+    def memory_samples(cls) -> Dict[str, List[float]]:
+        """Get this worker's end-of-test memory samples per launch profile"""
+        with cls._lock:
+            return {profile: list(samples) for profile, samples in cls._memory_samples.items()}
+
+    @classmethod
+    def lock_waits(cls) -> Dict[str, Dict[str, float]]:
+        """Get this worker's lock acquisition counts and wait times per lock name"""
+        with cls._lock:
+            return {name: dict(waits) for name, waits in cls._lock_waits.items()}
+
+    @staticmethod
+    def ordered_phases(records: List[Dict[str, Any]]) -> List[str]:
+        """Get the phases present in records, in startup order"""
+        seen = {name for record in records for name in record.get("phases", {})}
+        known = [name for name in DriverTimingConstants.PHASES if name in seen]
+        return known + sorted(seen - set(known))
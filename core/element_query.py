@@ -0,0 +1,110 @@
+"""
+Element Query - Geometry, visibility and content of all matching elements in one script call
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from selenium.webdriver.remote.webelement import WebElement
+
+from config.constants import LocatorConstants
+from core.locator_race import LOCATOR_FUNCTIONS
+
+# Describes every element of the first locator (in order) that matches anything.
+# The hit test at the element's center follows elementFromPoint, which only
+# sees points inside the viewport.
+QUERY_SCRIPT = LOCATOR_FUNCTIONS + """
+var locators = arguments[0], attributes = arguments[1], maxText = arguments[2];
+var viewportWidth = window.innerWidth, viewportHeight = window.innerHeight;
+
+function describe(element) {
+    var box = element.getBoundingClientRect();
+    var cx = box.left + box.width / 2, cy = box.top + box.height / 2;
+    var inViewport = cx >= 0 && cy >= 0 && cx < viewportWidth && cy < viewportHeight;
+    var topmost = false;
+    if (inViewport) {
+        for (var hit = document.elementFromPoint(cx, cy); hit; hit = hit.parentElement) {
+            if (hit === element) { topmost = true; break; }
+        }
+    }
+    var values = {};
+    attributes.forEach(function (name) { values[name] = element.getAttribute(name); });
+    return {
+        element: element,
+        tag: element.tagName.toLowerCase(),
+        text: (element.innerText || element.textContent || "").trim().slice(0, maxText),
+        rect: {x: box.left, y: box.top, width: box.width, height: box.height},
+        visible: visible(element),
+        in_viewport: inViewport,
+        topmost: topmost,
+        attributes: values
+    };
+}
+
+var errors = {};
+for (var index = 0; index < locators.length; index++) {
+    try {
+        var elements = find(locators[index][0], locators[index][1]);
+        if (elements.length) return {index: index, elements: elements.map(describe), errors: errors};
+    } catch (e) {
+        errors[index] = String(e.message || e);
+    }
+}
+return {index: null, elements: [], errors: errors};
+"""
+
+
+@dataclass
+class ElementSnapshot:
+    """State of one element at the time of a query"""
+
+    element: WebElement
+    tag: str
+    text: str  # Rendered text, trimmed and cut to QUERY_MAX_TEXT characters
+    rect: Dict[str, float]  # x, y, width and height relative to the viewport
+    visible: bool
+    in_viewport: bool  # The element's center lies inside the viewport
+    topmost: bool  # A hit test at the center reaches the element, nothing covers it
+    attributes: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @property
+    def interactable(self) -> bool:
+        """Whether the element is visible, inside the viewport and not covered"""
+        return self.visible and self.topmost
+
+
+class ElementQuery:
+    """Describes all elements matching a locator in a single execute_script round trip
+
+    Filtering or ranking a list of elements by visibility, position or
+    attributes through WebElement calls costs one WebDriver command per element
+    and property. A query collects bounding boxes, visibility, viewport and
+    hit-test flags, text and requested attributes of every matching element in
+    the browser and returns them together with the elements themselves.
+    """
+
+    @staticmethod
+    def query(
+        driver,
+        locators: List[Tuple[str, str]],
+        attributes: Optional[List[str]] = None,
+        max_text: int = LocatorConstants.QUERY_MAX_TEXT,
+    ) -> Tuple[Optional[int], List[ElementSnapshot], Dict[int, str]]:
+        """Describe the elements of the first locator that matches any
+
+        Args:
+            driver: WebDriver instance
+            locators: Locator tuples (strategy, value) in order of preference
+            attributes: Attribute names to read from every element
+            max_text: Characters of text kept per element
+
+        Returns:
+            Index of the matching locator (None if none matches), snapshots of its elements in
+            document order and the errors of locators that could not be evaluated
+        """
+        result = driver.execute_script(
+            QUERY_SCRIPT, [list(locator) for locator in locators], list(attributes or []), max_text
+        )
+        errors = {int(index): message for index, message in (result.get("errors") or {}).items()}
+        snapshots = [ElementSnapshot(**described) for described in result.get("elements") or []]
+        return result.get("index"), snapshots, errors
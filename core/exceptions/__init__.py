@@ -2,18 +2,25 @@
 Custom exceptions for the Sporty Web Assignment Testing Framework
 """
 
-from .framework_exceptions import (ConfigurationException, DriverException,
+from .framework_exceptions import (CassetteException, ConfigurationException,
+                                   DeadSessionException, DriverException,
                                    ElementNotFoundException,
                                    PageNotFoundException,
-                                   SportyFrameworkException, TestDataException)
+                                   SessionResetException,
+                                   SportyFrameworkException, TestDataException,
+                                   UnsupportedDeviceException)
 from .framework_exceptions import TimeoutException as SportyTimeoutException
 
 __all__ = [
     "SportyFrameworkException",
     "DriverException",
+    "SessionResetException",
+    "DeadSessionException",
     "ElementNotFoundException",
     "PageNotFoundException",
     "TestDataException",
     "ConfigurationException",
+    "CassetteException",
+    "UnsupportedDeviceException",
     "SportyTimeoutException",
 ]
@@ -23,6 +23,30 @@ class DriverException(SportyFrameworkException):
     pass
 
 
+class SessionResetException(DriverException):
+    """Exception raised when a reused WebDriver session cannot be reset to a clean state"""
+
+    def __init__(self, message: str, leaks: list = None, details: dict = None):
+        self.leaks = leaks or []
+
+        details = dict(details or {})
+        if self.leaks:
+            details["leaks"] = self.leaks
+        super().__init__(message, details)
+
+
+class DeadSessionException(DriverException):
+    """Exception raised when a WebDriver session died because Chrome or chromedriver is gone"""
+
+    def __init__(self, message: str, reason: str = None, details: dict = None):
+        self.reason = reason
+
+        details = dict(details or {})
+        if reason:
+            details["reason"] = reason
+        super().__init__(message, details)
+
+
 class ElementNotFoundException(SportyFrameworkException):
     """Exception raised when an element cannot be found on the page"""
 
@@ -70,6 +94,18 @@ class ConfigurationException(SportyFrameworkException):
     pass
 
 
+class CassetteException(SportyFrameworkException):
+    """Exception raised when recorded traffic cannot be replayed (missing cassette or unmatched requests)"""
+
+    def __init__(self, message: str, unmatched: list = None, details: dict = None):
+        self.unmatched = unmatched or []
+
+        details = dict(details or {})
+        if self.unmatched:
+            details["unmatched"] = self.unmatched
+        super().__init__(message, details)
+
+
 class TimeoutException(SportyFrameworkException):
     """Exception raised when operations timeout"""
 
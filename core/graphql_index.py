@@ -0,0 +1,203 @@
+"""
+GraphQL Index - Captured GraphQL exchanges keyed by operation name
+"""
+
+import json
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from seleniumwire.utils import decode
+
+from config.constants import GraphQLConstants
+from core.exceptions.framework_exceptions import TimeoutException
+from core.interceptors import InterceptorChain
+
+
+@dataclass
+class GraphQLExchange:
+    """One GraphQL operation and its result (a batched request yields one exchange per operation)"""
+
+    operation_name: str
+    variables: Dict[str, Any]
+    response: Any
+    status_code: int
+    url: str
+    completed_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def data(self) -> Any:
+        """The operation's "data" member, or None"""
+        return self.response.get("data") if isinstance(self.response, dict) else None
+
+    @property
+    def errors(self) -> List[Any]:
+        """The operation's "errors" member, empty if it succeeded"""
+        return (self.response.get("errors") if isinstance(self.response, dict) else None) or []
+
+
+class GraphQLIndex:
+    """Indexes GraphQL exchanges by operationName as their responses arrive
+
+    Capture backends hand every completed GraphQL request to add_exchange(),
+    which parses the request payload and response once, splitting batched
+    (array) payloads into one exchange per operation. Waiting for an operation
+    therefore returns as soon as its response is in, without re-scanning the
+    captured request list or waiting for the network to go quiet.
+    """
+
+    _endpoint = re.compile(GraphQLConstants.ENDPOINT_PATTERN)
+
+    def __init__(self, pump: Optional[Callable[[], None]] = None):
+        """Initialize the index
+
+        Args:
+            pump: Optional callable delivering pending captures, called while waiting (pull-based backends)
+        """
+        self._pump = pump
+        self._exchanges: Dict[str, Deque[GraphQLExchange]] = {}
+        self._condition = threading.Condition()
+
+    @classmethod
+    def is_graphql_url(cls, url: str) -> bool:
+        """Check whether a request URL is a GraphQL endpoint"""
+        return bool(cls._endpoint.search(url))
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "GraphQLIndex":
+        """Index a selenium-wire driver's GraphQL traffic through its interceptor chain
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            GraphQLIndex: Index exposed as driver.graphql
+        """
+        index = cls()
+
+        def on_response(request, response) -> None:
+            if request.method == "POST" and cls.is_graphql_url(request.url):
+                body = decode(response.body, response.headers.get("Content-Encoding", "identity"))
+                index.add_exchange(request.url, request.body, response.status_code, body)
+
+        InterceptorChain.install(driver).add_response_hook(on_response)
+        driver.graphql = index
+        return index
+
+    def add_exchange(self, url: str, request_body: bytes, status_code: int, response_body: bytes) -> None:
+        """Parse a completed GraphQL request and index each of its operations
+
+        Args:
+            url: Request URL
+            request_body: JSON payload, a single operation or a batch array
+            status_code: HTTP status of the response
+            response_body: Decoded JSON response, aligned with the payload for batches
+        """
+        try:
+            payload = json.loads(request_body or b"null")
+            result = json.loads(response_body or b"null")
+        except ValueError:
+            return
+
+        operations = payload if isinstance(payload, list) else [payload]
+        results = result if isinstance(result, list) else [result]
+
+        exchanges = [
+            GraphQLExchange(
+                operation_name=operation.get("operationName") or "",
+                variables=operation.get("variables") or {},
+                response=results[position] if position < len(results) else None,
+                status_code=status_code,
+                url=url,
+            )
+            for position, operation in enumerate(operations)
+            if isinstance(operation, dict)
+        ]
+
+        with self._condition:
+            for exchange in exchanges:
+                self._exchanges.setdefault(
+                    exchange.operation_name, deque(maxlen=GraphQLConstants.MAX_EXCHANGES_PER_OPERATION)
+                ).append(exchange)
+            self._condition.notify_all()
+
+    def exchanges(self, operation_name: Optional[str] = None) -> List[GraphQLExchange]:
+        """Get indexed exchanges, oldest first
+
+        Args:
+            operation_name: Only exchanges of this operation (all operations if None)
+        """
+        self._drain()
+        with self._condition:
+            if operation_name is not None:
+                return list(self._exchanges.get(operation_name, ()))
+            return sorted(
+                (exchange for exchanges in self._exchanges.values() for exchange in exchanges),
+                key=lambda exchange: exchange.completed_at,
+            )
+
+    def find(
+        self, operation_name: str, predicate: Optional[Callable[[GraphQLExchange], bool]] = None
+    ) -> Optional[GraphQLExchange]:
+        """Get the most recent exchange of an operation matching the predicate, or None"""
+        self._drain()
+        with self._condition:
+            return self._find_locked(operation_name, predicate)
+
+    def wait_for(
+        self,
+        operation_name: str,
+        predicate: Optional[Callable[[GraphQLExchange], bool]] = None,
+        timeout: float = GraphQLConstants.DEFAULT_TIMEOUT,
+    ) -> GraphQLExchange:
+        """Wait for an exchange of an operation matching the predicate
+
+        Exchanges that completed before the call count too, so the response can
+        be waited for after the action that triggered it.
+
+        Args:
+            operation_name: GraphQL operationName
+            predicate: Optional check on the exchange (e.g. its variables)
+            timeout: Seconds to wait
+
+        Returns:
+            GraphQLExchange: Most recent matching exchange
+
+        Raises:
+            TimeoutException: If no matching exchange completes within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._drain()
+            with self._condition:
+                exchange = self._find_locked(operation_name, predicate)
+                if exchange is not None:
+                    return exchange
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutException(f"GraphQL operation {operation_name}", timeout)
+                if self._pump is not None:
+                    remaining = min(remaining, GraphQLConstants.POLL_INTERVAL)
+                self._condition.wait(remaining)
+
+    def clear(self) -> None:
+        """Forget all indexed exchanges"""
+        with self._condition:
+            self._exchanges.clear()
+
+    def _drain(self) -> None:
+        """Let a pull-based backend deliver captures that are still pending"""
+        if self._pump is not None:
+            self._pump()
+
+    def _find_locked(
+        self, operation_name: str, predicate: Optional[Callable[[GraphQLExchange], bool]]
+    ) -> Optional[GraphQLExchange]:
+        for exchange in reversed(self._exchanges.get(operation_name, ())):
+            if predicate is None or predicate(exchange):
+                return exchange
+        return None
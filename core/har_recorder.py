@@ -0,0 +1,385 @@
+"""
+HAR Recorder - Streaming HAR 1.2 export of captured traffic
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from seleniumwire.utils import decode
+
+from config.constants import FrameworkConstants, HarConstants
+from core.interceptors import InterceptorChain
+
+
+class HarWriter:
+    """Writes a HAR file entry by entry
+
+    The log header is written when the file is opened and every entry is
+    serialized and written as soon as it is recorded, so only the entry being
+    written is held in memory however long the test runs. close() writes the
+    closing brackets; a file left unclosed by a crash is missing only those.
+    """
+
+    def __init__(self, path: str):
+        """Open the file and write the log header
+
+        Args:
+            path: HAR file path (parent directories are created)
+        """
+        self.path = path
+        self.entries = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w", encoding="utf-8")
+        creator = {"name": FrameworkConstants.FRAMEWORK_NAME, "version": FrameworkConstants.VERSION}
+        self._file.write(f'{{"log": {{"version": "{HarConstants.VERSION}", "creator": {json.dumps(creator)}, "entries": [\n')
+
+    def write_entry(self, entry: Dict[str, Any]) -> None:
+        """Append one entry to the file"""
+        data = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(f",\n{data}" if self.entries else data)
+            self.entries += 1
+
+    def close(self) -> None:
+        """Finish the entries array and close the file"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write("\n]}}\n")
+            self._file.close()
+            self._file = None
+
+
+class HarRecorder:
+    """Turns a driver's captured requests into HAR entries while a test records
+
+    Capture backends hand every completed request to the recorder (selenium-wire
+    response hook, DevTools loadingFinished event); nothing is buffered between
+    start() and stop(), entries go straight to a HarWriter and to any listeners
+    (e.g. per-test network metrics). Without a HAR file or listener the hooks
+    return immediately.
+    """
+
+    _text_mime = re.compile(HarConstants.TEXT_MIME_PATTERN)
+
+    def __init__(self, pump: Optional[Callable[[], None]] = None, max_text_kb: int = HarConstants.DEFAULT_MAX_TEXT_KB):
+        """Initialize the recorder
+
+        Args:
+            pump: Optional callable delivering pending captures, called before a recording stops (pull-based backends)
+            max_text_kb: Textual response bodies up to this size are embedded (0 disables)
+        """
+        self.max_text_bytes = max_text_kb * 1024
+        self._pump = pump
+        self._writer: Optional[HarWriter] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._started: Dict[Hashable, List[Tuple[datetime, float]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, pump: Optional[Callable[[], None]] = None) -> "HarRecorder":
+        """Create a recorder with the body size limit configured for this run"""
+        from config.settings import Settings
+
+        return cls(pump=pump, max_text_kb=Settings.get_har_config().max_text_kb)
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "HarRecorder":
+        """Record a selenium-wire driver's traffic through its interceptor chain
+
+        selenium-wire keeps no timing details, so a request's start is taken in
+        the request hook and its whole duration is reported as "wait". The request
+        passed to response interceptors is a copy without the storage id, so
+        requests are matched by method, URL and a digest of the body; concurrent
+        GraphQL POSTs to the same URL keep their own start times.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            HarRecorder: Recorder exposed as driver.har_recorder
+        """
+        recorder = cls.from_settings()
+        chain = InterceptorChain.install(driver)
+        chain.add_request_hook(recorder._on_wire_request)
+        chain.add_response_hook(recorder._on_wire_response)
+        driver.har_recorder = recorder
+        return recorder
+
+    @property
+    def recording(self) -> bool:
+        """Whether entries are being built, for a HAR file or a listener"""
+        return self._writer is not None or bool(self._listeners)
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call a function with every HAR entry built from now on, with or without a HAR file"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Stop calling a listener, after handing it the captures that are still pending"""
+        if self._pump is not None:
+            self._pump()
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self.recording:
+                self._started.clear()
+
+    def start(self, path: str) -> None:
+        """Start writing completed requests to a new HAR file
+
+        Args:
+            path: HAR file path
+        """
+        self.stop()
+        writer = HarWriter(path)
+        with self._lock:
+            self._writer = writer
+
+    def stop(self) -> Optional[str]:
+        """Stop recording and close the HAR file
+
+        Returns:
+            str: Path of the finished HAR file, or None if nothing was recording
+        """
+        if self._writer is not None and self._pump is not None:
+            self._pump()
+        with self._lock:
+            writer, self._writer = self._writer, None
+            if not self.recording:
+                self._started.clear()
+        if writer is None:
+            return None
+        writer.close()
+        return writer.path
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """Write one HAR entry to the HAR file and hand it to the listeners"""
+        writer = self._writer
+        if writer is not None:
+            writer.write_entry(entry)
+        for listener in list(self._listeners):
+            listener(entry)
+
+    def build_entry(
+        self,
+        started: datetime,
+        request: Dict[str, Any],
+        response: Dict[str, Any],
+        timings: Dict[str, float],
+        server_ip: str = "",
+        phase_timings: bool = True,
+    ) -> Dict[str, Any]:
+        """Assemble a HAR entry; its total time is the sum of the known timing phases
+
+        Entries whose timings hold only the total duration (in "wait") are
+        marked with the custom field "_phaseTimings": false.
+        """
+        entry = {
+            "startedDateTime": started.isoformat(),
+            "time": round(sum(value for name, value in timings.items() if value > 0 and name != "ssl"), 3),
+            "request": request,
+            "response": response,
+            "cache": {},
+            "timings": {name: round(value, 3) for name, value in timings.items()},
+        }
+        if server_ip:
+            entry["serverIPAddress"] = server_ip
+        if not phase_timings:
+            entry["_phaseTimings"] = False
+        return entry
+
+    def build_content(self, body: Optional[bytes], encoded_size: int, mime_type: str) -> Dict[str, Any]:
+        """Describe a response body: decoded size, bytes saved by compression and textual bodies up to the limit
+
+        Without the body (not fetched) the transferred size stands in for the decoded size.
+        """
+        if body is None:
+            return {"size": max(encoded_size, 0), "mimeType": mime_type}
+        content: Dict[str, Any] = {"size": len(body), "mimeType": mime_type}
+        if encoded_size >= 0 and len(body) > encoded_size:
+            content["compression"] = len(body) - encoded_size
+        if body and self.wants_text(mime_type) and len(body) <= self.max_text_bytes:
+            content["text"] = body.decode("utf-8", errors="replace")
+        return content
+
+    def wants_text(self, mime_type: str) -> bool:
+        """Whether bodies of this content type are embedded as text"""
+        return bool(self.max_text_bytes and self._text_mime.search(mime_type))
+
+    def record_devtools_request(self, request, finished_timestamp: Optional[float], encoded_size: int) -> None:
+        """Record a request captured from DevTools Network events
+
+        Phases come from the response's ResourceTiming; requests without one
+        (served from cache, failed) report their whole duration as "wait".
+        Textual bodies are fetched from Chrome only when they can be embedded.
+
+        Args:
+            request: CapturedRequest whose loading finished, failed or was redirected
+            finished_timestamp: Network event timestamp of the end of the request (seconds)
+            encoded_size: Bytes transferred for the response (-1 if unknown)
+        """
+        if not self.recording:
+            return
+        response = request.response
+        timing = (response.timing if response is not None else None) or {}
+
+        total = 0.0
+        if finished_timestamp is not None and request.timestamp is not None:
+            total = max(0.0, (finished_timestamp - request.timestamp) * 1000)
+
+        if timing:
+            def phase(start: str, end: str) -> float:
+                return timing[end] - timing[start] if timing.get(start, -1) >= 0 else -1
+
+            # ResourceTiming offsets are milliseconds relative to requestTime
+            firsts = [timing.get(name, -1) for name in ("dnsStart", "connectStart", "sendStart")]
+            blocked = next((value for value in firsts if value >= 0), -1)
+            receive_start = timing.get("receiveHeadersEnd", 0)
+            finished = (finished_timestamp - timing["requestTime"]) * 1000 if finished_timestamp else receive_start
+            timings = {
+                "blocked": blocked,
+                "dns": phase("dnsStart", "dnsEnd"),
+                "connect": phase("connectStart", "connectEnd"),
+                "send": max(0.0, timing.get("sendEnd", 0) - timing.get("sendStart", 0)),
+                "wait": max(0.0, receive_start - timing.get("sendEnd", 0)),
+                "receive": max(0.0, finished - receive_start),
+                "ssl": phase("sslStart", "sslEnd"),
+            }
+        else:
+            timings = {"blocked": -1, "dns": -1, "connect": -1, "send": 0, "wait": total, "receive": 0, "ssl": -1}
+
+        request_fields = {"method": request.method, "url": request.url, "queryString": self.query_string(request.url)}
+        if request.body:
+            request_fields["postData"] = {
+                "mimeType": request.headers.get("Content-Type", ""),
+                "text": request.body.decode("utf-8", errors="replace"),
+            }
+
+        if response is not None:
+            body = response.body if self.wants_text(response.mime_type) and response.fetchable else None
+            response_entry = self.build_message(
+                dict(response.headers),
+                self.http_version(response.protocol),
+                encoded_size,
+                status=response.status_code,
+                statusText=response.reason,
+                content=self.build_content(body, encoded_size, response.mime_type),
+                redirectURL=response.headers.get("Location", ""),
+            )
+        else:
+            response_entry = self.build_message(
+                {}, "", -1, status=0, statusText=request.error or "", content={"size": 0, "mimeType": ""},
+                redirectURL="", _error=request.error,
+            )
+
+        self.record(
+            self.build_entry(
+                request.date.astimezone(timezone.utc),
+                self.build_message(dict(request.headers), self.http_version(response.protocol if response else ""),
+                                   len(request.body), **request_fields),
+                response_entry,
+                timings,
+                response.remote_ip if response is not None else "",
+                phase_timings=bool(timing),
+            )
+        )
+
+    @staticmethod
+    def http_version(protocol: str) -> str:
+        """HAR httpVersion of a DevTools protocol name (h2, h3, http/1.1)"""
+        return {"h2": "HTTP/2.0", "h3": "HTTP/3", "http/1.1": "HTTP/1.1", "http/1.0": "HTTP/1.0"}.get(
+            (protocol or "").lower(), protocol or ""
+        )
+
+    @staticmethod
+    def build_message(
+        headers: Dict[str, str], http_version: str, body_size: int, **fields: Any
+    ) -> Dict[str, Any]:
+        """Assemble a HAR request or response object"""
+        message = dict(fields)
+        message.update(
+            {
+                "httpVersion": http_version,
+                "cookies": [],
+                "headers": [{"name": name, "value": str(value)} for name, value in headers.items()],
+                "headersSize": -1,
+                "bodySize": body_size,
+            }
+        )
+        return message
+
+    @staticmethod
+    def query_string(url: str) -> List[Dict[str, str]]:
+        """HAR queryString list of a URL"""
+        return [{"name": name, "value": value} for name, value in parse_qsl(urlsplit(url).query, keep_blank_values=True)]
+
+    @staticmethod
+    def _wire_key(request) -> Tuple[str, str, str]:
+        """Key matching a selenium-wire request to the copy passed with its response"""
+        return request.method, request.url, hashlib.sha1(request.body or b"").hexdigest()
+
+    def _on_wire_request(self, request) -> None:
+        if not self.recording:
+            return
+        with self._lock:
+            self._started.setdefault(self._wire_key(request), []).append(
+                (datetime.now(timezone.utc), time.monotonic())
+            )
+
+    def _on_wire_response(self, request, response) -> None:
+        if not self.recording:
+            return
+        key = self._wire_key(request)
+        with self._lock:
+            starts = self._started.get(key)
+            if not starts:
+                # Started before the recording
+                return
+            started, started_at = starts.pop(0)
+            if not starts:
+                del self._started[key]
+        elapsed = (time.monotonic() - started_at) * 1000
+
+        encoding = response.headers.get("Content-Encoding", "identity")
+        try:
+            body = decode(response.body, encoding)
+        except ValueError:
+            body = response.body
+        mime_type = response.headers.get("Content-Type", "")
+
+        request_fields = {"method": request.method, "url": request.url, "queryString": self.query_string(request.url)}
+        if request.body:
+            request_fields["postData"] = {
+                "mimeType": request.headers.get("Content-Type", ""),
+                "text": request.body.decode("utf-8", errors="replace"),
+            }
+
+        self.record(
+            self.build_entry(
+                started,
+                self.build_message(dict(request.headers), "HTTP/1.1", len(request.body), **request_fields),
+                self.build_message(
+                    dict(response.headers),
+                    "HTTP/1.1",
+                    len(response.body),
+                    status=response.status_code,
+                    statusText=response.reason,
+                    content=self.build_content(body, len(response.body), mime_type),
+                    redirectURL=response.headers.get("Location", ""),
+                ),
+                {"blocked": -1, "dns": -1, "connect": -1, "send": 0, "wait": elapsed, "receive": 0, "ssl": -1},
+                phase_timings=False,
+            )
+        )
@@ -0,0 +1,61 @@
+"""
+Interceptor Chain - Several selenium-wire request/response interceptors on one driver
+"""
+
+from typing import Any, Callable, List
+
+RequestHook = Callable[[Any], None]
+ResponseHook = Callable[[Any, Any], None]
+
+
+class InterceptorChain:
+    """Runs request and response hooks in registration order
+
+    selenium-wire accepts a single request_interceptor and response_interceptor
+    per driver; the chain takes both slots so independent features can each add
+    their own hook. A request hook that answers the request itself (with
+    request.create_response) ends the request chain; the response chain still
+    runs for the answer.
+    """
+
+    def __init__(self):
+        self.request_hooks: List[RequestHook] = []
+        self.response_hooks: List[ResponseHook] = []
+
+    @classmethod
+    def install(cls, driver) -> "InterceptorChain":
+        """Get a driver's interceptor chain, installing one on first use
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            InterceptorChain: The driver's chain
+        """
+        chain = getattr(driver, "interceptor_chain", None)
+        if chain is None:
+            chain = cls()
+            driver.request_interceptor = chain.intercept_request
+            driver.response_interceptor = chain.intercept_response
+            driver.interceptor_chain = chain
+        return chain
+
+    def add_request_hook(self, hook: RequestHook) -> None:
+        """Add a hook called with each captured request before it is sent"""
+        self.request_hooks.append(hook)
+
+    def add_response_hook(self, hook: ResponseHook) -> None:
+        """Add a hook called with each captured request and its response"""
+        self.response_hooks.append(hook)
+
+    def intercept_request(self, request) -> None:
+        """selenium-wire request interceptor running the request hooks"""
+        for hook in self.request_hooks:
+            hook(request)
+            if request.response is not None:
+                break
+
+    def intercept_response(self, request, response) -> None:
+        """selenium-wire response interceptor running the response hooks"""
+        for hook in self.response_hooks:
+            hook(request, response)
@@ -0,0 +1,303 @@
+"""
+Locator Race - Waits that check every fallback locator in one script call per poll
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import JavascriptException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config.constants import LocatorConstants
+from core.exceptions.framework_exceptions import ConfigurationException
+
+# In-browser equivalents of WebDriver's locator strategies and visibility check,
+# shared by the scripts that evaluate locators in the page
+LOCATOR_FUNCTIONS = """
+function find(strategy, value) {
+    switch (strategy) {
+        case "css selector":
+            return Array.prototype.slice.call(document.querySelectorAll(value));
+        case "id":
+            return Array.prototype.slice.call(document.querySelectorAll("#" + CSS.escape(value)));
+        case "name":
+            return Array.prototype.slice.call(document.querySelectorAll('[name="' + CSS.escape(value) + '"]'));
+        case "class name":
+            return Array.prototype.slice.call(document.getElementsByClassName(value));
+        case "tag name":
+            return Array.prototype.slice.call(document.getElementsByTagName(value));
+        case "xpath":
+            var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                if (snapshot.snapshotItem(i).nodeType === Node.ELEMENT_NODE) nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        case "link text":
+        case "partial link text":
+            return Array.prototype.slice.call(document.getElementsByTagName("a")).filter(function (link) {
+                var linkText = (link.innerText || "").trim();
+                return strategy === "link text" ? linkText === value : linkText.indexOf(value) !== -1;
+            });
+    }
+    throw new Error("Unsupported locator strategy: " + strategy);
+}
+
+function visible(element) {
+    if (!element.isConnected || element.getClientRects().length === 0) return false;
+    if (element.checkVisibility) {
+        return element.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== "hidden" && style.visibility !== "collapse" && style.opacity !== "0";
+}
+"""
+
+# Evaluates the locators in order and returns the first one whose elements meet
+# the condition, plus every locator that meets it, so statistics can credit all of
+# them. Invalid locators are skipped and reported instead of failing the check.
+RACE_FUNCTIONS = LOCATOR_FUNCTIONS + """
+function met(elements, condition, text) {
+    var first = elements[0];
+    switch (condition) {
+        case "present": return elements.length > 0;
+        case "visible": return !!first && visible(first);
+        case "clickable": return !!first && visible(first) && !first.disabled;
+        case "invisible": return !first || !visible(first);
+        case "text": return !!first && (first.innerText || first.textContent || "").indexOf(text) !== -1;
+    }
+    throw new Error("Unsupported condition: " + condition);
+}
+
+function race(locators, condition, text) {
+    var errors = {}, matched = [], winner = null;
+    for (var index = 0; index < locators.length; index++) {
+        try {
+            var elements = find(locators[index][0], locators[index][1]);
+            if (met(elements, condition, text)) {
+                matched.push(index);
+                if (winner === null) winner = {index: index, elements: condition === "invisible" ? [] : elements};
+            }
+        } catch (e) {
+            errors[index] = String(e.message || e);
+        }
+    }
+    if (winner === null) return {index: null, matched: matched, elements: [], errors: errors};
+    return {index: winner.index, matched: matched, elements: winner.elements, errors: errors};
+}
+"""
+
+RACE_SCRIPT = RACE_FUNCTIONS + """
+return race(arguments[0], arguments[1], arguments[2]);
+"""
+
+# Resolves as soon as a DOM mutation makes a locator meet the condition, or with
+# no match when the in-browser timeout expires. Visibility also changes without
+# mutations (stylesheets, transitions, scrolling), so those conditions are
+# re-checked on an interval as well.
+OBSERVE_SCRIPT = RACE_FUNCTIONS + """
+var locators = arguments[0], condition = arguments[1], text = arguments[2];
+var timeoutMs = arguments[3], recheckMs = arguments[4], done = arguments[arguments.length - 1];
+
+var result = race(locators, condition, text);
+if (result.index !== null) return done(result);
+
+var finished = false, observer, timer, recheck;
+function finish(outcome) {
+    if (finished) return;
+    finished = true;
+    observer.disconnect();
+    clearTimeout(timer);
+    clearInterval(recheck);
+    done(outcome);
+}
+function check() {
+    var outcome = race(locators, condition, text);
+    if (outcome.index !== null) finish(outcome);
+    else result = outcome;
+}
+
+observer = new MutationObserver(check);
+observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+if (condition !== "present") recheck = setInterval(check, recheckMs);
+timer = setTimeout(function () { finish(result); }, timeoutMs);
+"""
+
+
+@dataclass
+class LocatorMatch:
+    """The fallback locator that met a wait's condition first"""
+
+    index: int  # Position in the fallback list
+    locator: Tuple[str, str]
+    elements: List[WebElement]  # All elements of the locator (empty for "invisible")
+    elapsed: float  # Seconds from the start of the wait
+    matched: List[int] = field(default_factory=list)  # Positions of every locator meeting the condition
+
+    @property
+    def element(self) -> Optional[WebElement]:
+        """First element of the matching locator"""
+        return self.elements[0] if self.elements else None
+
+
+@dataclass
+class LocatorRaceResult:
+    """Outcome of a race: the match, or the errors of locators that could not be evaluated"""
+
+    match: Optional[LocatorMatch]
+    errors: Dict[int, str] = field(default_factory=dict)
+
+
+class LocatorRace:
+    """Waits until any of several fallback locators meets a condition
+
+    Trying fallback locators one after another with a full WebDriverWait each
+    makes a stale primary locator cost its whole timeout before the next one is
+    tried. A race checks all locators on every poll, in a single execute_script
+    round trip, and returns the first locator in list order whose elements meet
+    the condition, so the worst case is one timeout however many fallbacks a
+    page object lists.
+
+    Two wait engines are available: "poll" re-runs the check every
+    POLL_FREQUENCY seconds, "observer" runs one asynchronous script that
+    installs a MutationObserver and answers as soon as the DOM change that
+    satisfies the condition happens, without further WebDriver commands.
+    """
+
+    @staticmethod
+    def evaluate(
+        driver, locators: List[Tuple[str, str]], condition: str, text: str = ""
+    ) -> Tuple[Optional[int], List[WebElement], Dict[int, str], List[int]]:
+        """Check all locators once
+
+        Args:
+            driver: WebDriver instance
+            locators: Locator tuples (strategy, value) in order of preference
+            condition: One of LocatorConstants.CONDITIONS
+            text: Text the first element must contain (TEXT condition)
+
+        Returns:
+            Index of the first locator meeting the condition (None if none does), its elements,
+            the errors of locators that could not be evaluated and the indexes of all locators
+            meeting the condition
+        """
+        result = driver.execute_script(RACE_SCRIPT, [list(locator) for locator in locators], condition, text)
+        return LocatorRace._parse(result)
+
+    @classmethod
+    def wait(
+        cls,
+        driver,
+        locators: List[Tuple[str, str]],
+        condition: str,
+        timeout: float,
+        text: str = "",
+        poll_frequency: float = LocatorConstants.POLL_FREQUENCY,
+        engine: str = LocatorConstants.DEFAULT_WAIT_ENGINE,
+    ) -> LocatorRaceResult:
+        """Wait until any locator meets a condition
+
+        Args:
+            driver: WebDriver instance
+            locators: Locator tuples (strategy, value) in order of preference
+            condition: One of LocatorConstants.CONDITIONS
+            timeout: Maximum seconds to wait
+            text: Text the first element must contain (TEXT condition)
+            poll_frequency: Seconds between polls (poll engine)
+            engine: Wait engine, "poll" or "observer"
+
+        Returns:
+            LocatorRaceResult: The winning locator, or no match if the timeout expired
+
+        Raises:
+            ConfigurationException: If the condition or the wait engine is unknown
+        """
+        if condition not in LocatorConstants.CONDITIONS:
+            raise ConfigurationException(
+                f"Unknown locator condition '{condition}'",
+                {"condition": condition, "supported": LocatorConstants.CONDITIONS},
+            )
+        if engine == LocatorConstants.OBSERVER:
+            return cls.observe(driver, locators, condition, timeout, text)
+        if engine != LocatorConstants.POLL:
+            raise ConfigurationException(
+                f"Unknown wait engine '{engine}'", {"wait_engine": engine, "supported": LocatorConstants.WAIT_ENGINES}
+            )
+
+        start_time = time.monotonic()
+        errors: Dict[int, str] = {}
+
+        def poll(_driver) -> Any:
+            index, elements, poll_errors, matched = cls.evaluate(driver, locators, condition, text)
+            errors.update(poll_errors)
+            if index is None:
+                return False
+            return LocatorMatch(index, tuple(locators[index]), elements, time.monotonic() - start_time, matched)
+
+        wait = WebDriverWait(
+            driver, timeout, poll_frequency=poll_frequency, ignored_exceptions=(StaleElementReferenceException,)
+        )
+        try:
+            return LocatorRaceResult(wait.until(poll), errors)
+        except TimeoutException:
+            return LocatorRaceResult(None, errors)
+
+    @classmethod
+    def observe(
+        cls, driver, locators: List[Tuple[str, str]], condition: str, timeout: float, text: str = ""
+    ) -> LocatorRaceResult:
+        """Wait until any locator meets a condition, observed in the browser
+
+        The timeout runs in the browser; waits longer than OBSERVER_MAX_WAIT are
+        split into several scripts so none outlives the driver's script timeout.
+        A navigation during the wait restarts the observer on the new document.
+
+        Args:
+            driver: WebDriver instance
+            locators: Locator tuples (strategy, value) in order of preference
+            condition: One of LocatorConstants.CONDITIONS
+            timeout: Maximum seconds to wait
+            text: Text the first element must contain (TEXT condition)
+
+        Returns:
+            LocatorRaceResult: The winning locator, or no match if the timeout expired
+        """
+        start_time = time.monotonic()
+        errors: Dict[int, str] = {}
+        serialized = [list(locator) for locator in locators]
+
+        while True:
+            remaining = max(0.0, timeout - (time.monotonic() - start_time))
+            try:
+                result = driver.execute_async_script(
+                    OBSERVE_SCRIPT,
+                    serialized,
+                    condition,
+                    text,
+                    int(min(remaining, LocatorConstants.OBSERVER_MAX_WAIT) * 1000),
+                    LocatorConstants.OBSERVER_RECHECK_MS,
+                )
+            except JavascriptException as e:
+                if "unloaded" not in str(e):
+                    raise
+                # The page navigated away while observing: observe the new document
+                result = None
+
+            if result is not None:
+                index, elements, observe_errors, matched = cls._parse(result)
+                errors.update(observe_errors)
+                if index is not None:
+                    match = LocatorMatch(
+                        index, tuple(locators[index]), elements, time.monotonic() - start_time, matched
+                    )
+                    return LocatorRaceResult(match, errors)
+
+            if time.monotonic() - start_time >= timeout:
+                return LocatorRaceResult(None, errors)
+
+    @staticmethod
+    def _parse(result: Dict[str, Any]) -> Tuple[Optional[int], List[WebElement], Dict[int, str], List[int]]:
+        errors = {int(index): message for index, message in (result.get("errors") or {}).items()}
+        return result.get("index"), result.get("elements") or [], errors, result.get("matched") or []
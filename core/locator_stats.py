@@ -0,0 +1,237 @@
+"""
+Locator Stats - Persistent statistics of which fallback locators match, for adaptive ordering
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.constants import LocatorStatsConstants
+from utils.locks.file_lock import FileLock
+
+
+class LocatorStats:
+    """Records which fallback locator of a page object's list matched, across runs
+
+    Every wait of a locator list records the winning locator (or a miss), how
+    long it took and every locator that met the condition. Records are kept per
+    process and merged into a small JSON store in the shared cache directory at
+    the end of the session, under a cross-process lock. Each locator keeps a
+    decaying score credited whenever it matched, not only when it was tried
+    first; once a list has enough history and its primary failed to match in
+    the last recorded wait, waits try its locators in score order, so the
+    locator that currently matches on Twitch's DOM is preferred over a drifted
+    primary, and a primary that matches again regains its place.
+    The order used during a run comes from the store as it was when the run
+    started.
+    """
+
+    _lock = threading.Lock()
+    _history: Optional[Dict[str, Dict[str, Any]]] = None
+    _pending: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def key(page: str, locators: List[Tuple[str, str]]) -> str:
+        """Store key of a page object's locator list"""
+        return f"{page}:{json.dumps([list(locator) for locator in locators])}"
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        """Whether locator statistics are kept for this run"""
+        from config.settings import Settings
+
+        return Settings.get_locator_stats_config().enabled
+
+    @classmethod
+    def get_store_file(cls) -> str:
+        """Get the path of the on-disk store"""
+        from config.settings import Settings
+        from core.chromedriver_cache import ChromeDriverCache
+
+        stats_file = Settings.get_locator_stats_config().stats_file
+        if stats_file:
+            return os.path.expanduser(stats_file)
+        return os.path.join(ChromeDriverCache.get_cache_dir(), LocatorStatsConstants.STATS_FILE)
+
+    @classmethod
+    def order(cls, page: str, locators: List[Tuple[str, str]]) -> List[int]:
+        """Get the order in which to try a locator list
+
+        Duplicate locators are dropped. Lists with fewer than MIN_SAMPLES
+        recorded waits, or whose primary matched in the last recorded wait,
+        keep their declared order.
+
+        Args:
+            page: Page object class name
+            locators: Locator tuples as declared
+
+        Returns:
+            List[int]: Indexes into locators, best first
+        """
+        indexes = []
+        seen = set()
+        for index, locator in enumerate(locators):
+            if tuple(locator) not in seen:
+                seen.add(tuple(locator))
+                indexes.append(index)
+
+        entry = cls._load_history().get(cls.key(page, locators))
+        if entry is None or entry["waits"] < LocatorStatsConstants.MIN_SAMPLES:
+            return indexes
+        if 0 in entry.get("last_matched", []):
+            return indexes
+
+        scores = entry["scores"]
+        return sorted(indexes, key=lambda index: -scores.get(str(index), 0.0))
+
+    @classmethod
+    def record(
+        cls,
+        page: str,
+        locators: List[Tuple[str, str]],
+        winner: Optional[int],
+        elapsed: float,
+        matched: Optional[List[int]] = None,
+    ) -> None:
+        """Record the outcome of one wait
+
+        Args:
+            page: Page object class name
+            locators: Locator tuples as declared
+            winner: Index of the matching locator, or None if the wait timed out
+            elapsed: Seconds the wait took
+            matched: Indexes of every locator that met the condition (defaults to the winner)
+        """
+        if matched is None:
+            matched = [] if winner is None else [winner]
+        key = cls.key(page, locators)
+        with cls._lock:
+            pending = cls._pending.setdefault(
+                key, {"page": page, "locators": [list(locator) for locator in locators], "outcomes": []}
+            )
+            pending["outcomes"].append([winner, round(elapsed * 1000, 1), sorted(set(matched))])
+
+    @classmethod
+    def flush(cls) -> Optional[str]:
+        """Merge this process's records into the on-disk store
+
+        Returns:
+            Optional[str]: Path of the store, or None if there was nothing to write
+        """
+        with cls._lock:
+            pending, cls._pending = cls._pending, {}
+        if not pending:
+            return None
+
+        store_file = cls.get_store_file()
+        os.makedirs(os.path.dirname(store_file) or ".", exist_ok=True)
+        now = time.time()
+        with FileLock(f"{store_file}.lock", timeout=LocatorStatsConstants.LOCK_TIMEOUT):
+            entries = cls._read_store(store_file)
+            for key, records in pending.items():
+                entry = entries.setdefault(
+                    key,
+                    {"page": records["page"], "locators": records["locators"], "waits": 0, "misses": 0,
+                     "wins": {}, "win_ms": {}, "matches": {}, "scores": {}, "last_matched": []},
+                )
+                for winner, elapsed_ms, matched in records["outcomes"]:
+                    cls._apply(entry, winner, elapsed_ms, matched)
+                entry["last_seen"] = now
+
+            prune_before = now - LocatorStatsConstants.PRUNE_DAYS * 86400
+            entries = {key: entry for key, entry in entries.items() if entry.get("last_seen", 0) >= prune_before}
+            cls._write_store(store_file, entries)
+        return store_file
+
+    @classmethod
+    def summarize(cls, since: float = 0.0) -> List[str]:
+        """Build report lines for locator lists whose primary locator never matches or that repeat locators
+
+        Args:
+            since: Only report lists used after this time (epoch seconds)
+
+        Returns:
+            List[str]: Summary lines ready to print
+        """
+        entries = cls._read_store(cls.get_store_file())
+        lines = []
+        for entry in sorted(entries.values(), key=lambda entry: (entry["page"], entry["locators"])):
+            if entry.get("last_seen", 0) < since:
+                continue
+            locators = [tuple(locator) for locator in entry["locators"]]
+            if len(set(locators)) < len(locators):
+                lines.append(f"   {entry['page']}: duplicate locators in {locators}")
+            # Entries written before match counts were kept only know the wins
+            matches = entry.get("matches", entry["wins"])
+            if entry["waits"] >= LocatorStatsConstants.MIN_SAMPLES and not matches.get("0"):
+                best = max(entry["wins"], key=lambda index: entry["wins"][index], default=None)
+                winner = (
+                    f"#{best} {locators[int(best)]} matched {entry['wins'][best]} "
+                    f"(avg {entry['win_ms'][best] / entry['wins'][best]:.0f} ms)"
+                    if best is not None
+                    else "no locator matched"
+                )
+                lines.append(
+                    f"   {entry['page']}: primary {locators[0]} never matched in {entry['waits']} waits; {winner}"
+                )
+
+        if not lines:
+            return []
+        return [f"🔎 Locators needing attention ({len(lines)}):"] + lines
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the loaded history and unsaved records of this process"""
+        with cls._lock:
+            cls._history = None
+            cls._pending = {}
+
+    @staticmethod
+    def _apply(
+        entry: Dict[str, Any], winner: Optional[int], elapsed_ms: float, matched: Optional[List[int]] = None
+    ) -> None:
+        entry["waits"] += 1
+        for index in entry["scores"]:
+            entry["scores"][index] = round(entry["scores"][index] * LocatorStatsConstants.SCORE_DECAY, 4)
+        if winner is None:
+            entry["misses"] += 1
+            entry["last_matched"] = []
+            return
+        index = str(winner)
+        entry["wins"][index] = entry["wins"].get(index, 0) + 1
+        entry["win_ms"][index] = round(entry["win_ms"].get(index, 0.0) + elapsed_ms, 1)
+        # Every locator that met the condition is credited, so a recovered primary is noticed
+        entry["last_matched"] = sorted(set(matched or [winner]))
+        matches = entry.setdefault("matches", {})
+        for index in map(str, entry["last_matched"]):
+            matches[index] = matches.get(index, 0) + 1
+            entry["scores"][index] = round(entry["scores"].get(index, 0.0) + 1, 4)
+
+    @classmethod
+    def _load_history(cls) -> Dict[str, Dict[str, Any]]:
+        with cls._lock:
+            if cls._history is None:
+                cls._history = cls._read_store(cls.get_store_file())
+            return cls._history
+
+    @staticmethod
+    def _read_store(store_file: str) -> Dict[str, Dict[str, Any]]:
+        """Read the store, treating a missing, corrupt or outdated file as empty"""
+        try:
+            with open(store_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != LocatorStatsConstants.FORMAT_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    @staticmethod
+    def _write_store(store_file: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Atomically replace the store (caller holds the file lock)"""
+        temp_file = f"{store_file}.{os.getpid()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"version": LocatorStatsConstants.FORMAT_VERSION, "entries": entries}, f, indent=1)
+        os.replace(temp_file, store_file)
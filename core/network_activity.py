@@ -0,0 +1,193 @@
+"""
+Network Activity - Event-driven in-flight request tracking for network idle waits
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional
+
+from config.constants import NetworkIdleConstants
+from core.interceptors import InterceptorChain
+
+
+class NetworkActivityTracker:
+    """Counts requests that are in flight and remembers when traffic last changed
+
+    Capture backends report every request start and finish as it happens
+    (selenium-wire interceptors, DevTools Network events), so the counter and
+    last-activity timestamp are updated in O(1) and an idle wait wakes up as soon
+    as the last outstanding request completes instead of re-reading the whole
+    captured request list. Requests whose URL matches an ignored pattern
+    (long-polling, streaming) are never counted.
+    """
+
+    def __init__(
+        self,
+        ignored_url_patterns: Iterable[str] = (),
+        pump: Optional[Callable[[], None]] = None,
+        stale_after: float = NetworkIdleConstants.STALE_REQUEST_TIMEOUT,
+    ):
+        """Initialize the tracker
+
+        Args:
+            ignored_url_patterns: Regular expressions of URLs that never block idle
+            pump: Optional callable delivering pending events, called while waiting (pull-based backends)
+            stale_after: Seconds after which a request without a finish stops counting as in flight
+        """
+        self.stale_after = stale_after
+        self.started = 0
+        self.finished = 0
+        self.ignored = 0
+        self.last_activity = time.monotonic()
+        self._ignored_patterns = [re.compile(pattern) for pattern in ignored_url_patterns]
+        self._pump = pump
+        self._in_flight: Dict[Hashable, List[float]] = {}
+        self._count = 0
+        self._condition = threading.Condition()
+
+    @classmethod
+    def from_settings(cls, pump: Optional[Callable[[], None]] = None) -> "NetworkActivityTracker":
+        """Create a tracker ignoring the URL patterns configured for this run"""
+        from config.settings import Settings
+
+        return cls(Settings.get_network_idle_config().ignored_url_patterns, pump=pump)
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "NetworkActivityTracker":
+        """Track a selenium-wire driver's traffic through its interceptor chain
+
+        The request passed to response interceptors is a copy without the
+        storage id, so requests are matched by method and URL.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            NetworkActivityTracker: Tracker exposed as driver.network_activity
+        """
+        tracker = cls.from_settings()
+        chain = InterceptorChain.install(driver)
+        chain.add_request_hook(lambda request: tracker.request_started((request.method, request.url), request.url))
+        chain.add_response_hook(lambda request, response: tracker.request_finished((request.method, request.url)))
+        driver.network_activity = tracker
+        return tracker
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tracked requests still waiting for their response"""
+        with self._condition:
+            return self._count
+
+    def is_ignored(self, url: str) -> bool:
+        """Check whether a URL is excluded from tracking"""
+        return any(pattern.search(url) for pattern in self._ignored_patterns)
+
+    def request_started(self, key: Hashable, url: str) -> None:
+        """Record a request leaving the browser
+
+        Args:
+            key: Identifier the matching request_finished() call will use
+            url: Request URL
+        """
+        if self.is_ignored(url):
+            with self._condition:
+                self.ignored += 1
+            return
+
+        with self._condition:
+            self._in_flight.setdefault(key, []).append(time.monotonic())
+            self._count += 1
+            self.started += 1
+            self._touch_locked()
+
+    def request_finished(self, key: Hashable) -> None:
+        """Record the response (or failure) of a request
+
+        Args:
+            key: Identifier passed to request_started()
+        """
+        with self._condition:
+            starts = self._in_flight.get(key)
+            if not starts:
+                # Ignored, expired as stale or started before the last clear()
+                return
+            starts.pop(0)
+            if not starts:
+                del self._in_flight[key]
+            self._count -= 1
+            self.finished += 1
+            self._touch_locked()
+
+    def clear(self) -> None:
+        """Forget all in-flight requests, e.g. when a pooled driver is reset for the next test"""
+        with self._condition:
+            self._in_flight.clear()
+            self._count = 0
+            self._touch_locked()
+
+    def wait_for_idle(self, timeout: float, idle_time: float) -> bool:
+        """Wait until no tracked request has been in flight for idle_time seconds
+
+        A request without a finish stops counting as in flight after
+        stale_after seconds, or after STALE_TIMEOUT_SHARE of the timeout if that
+        is shorter, so one failed request (which selenium-wire never reports as
+        finished) cannot use up the whole wait.
+
+        Args:
+            timeout: Maximum seconds to wait
+            idle_time: Seconds without in-flight requests required to count as idle
+
+        Returns:
+            bool: True if the network became idle, False on timeout
+        """
+        deadline = time.monotonic() + timeout
+        stale_after = min(self.stale_after, timeout * NetworkIdleConstants.STALE_TIMEOUT_SHARE)
+        while True:
+            if self._pump is not None:
+                self._pump()
+
+            with self._condition:
+                now = time.monotonic()
+                self._expire_stale_locked(now, stale_after)
+
+                if self._count == 0:
+                    quiet = now - self.last_activity
+                    if quiet >= idle_time:
+                        return True
+                    wait = idle_time - quiet
+                else:
+                    wait = self._next_expiry_locked(stale_after) - now
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    return False
+
+                # Push-based backends notify on every event; pull-based ones must be pumped periodically
+                if self._pump is not None:
+                    wait = min(wait, NetworkIdleConstants.POLL_INTERVAL)
+                self._condition.wait(max(0.0, min(wait, remaining)))
+
+    def _touch_locked(self) -> None:
+        """Update the last-activity timestamp and wake up waiters"""
+        self.last_activity = time.monotonic()
+        self._condition.notify_all()
+
+    def _expire_stale_locked(self, now: float, stale_after: float) -> None:
+        """Stop counting requests that never finished (failed or aborted without an event)"""
+        if not self._count:
+            return
+        for key in list(self._in_flight):
+            starts = self._in_flight[key]
+            fresh = [started for started in starts if now - started < stale_after]
+            if len(fresh) != len(starts):
+                self._count -= len(starts) - len(fresh)
+                if fresh:
+                    self._in_flight[key] = fresh
+                else:
+                    del self._in_flight[key]
+
+    def _next_expiry_locked(self, stale_after: float) -> float:
+        """Monotonic time at which the oldest in-flight request turns stale"""
+        oldest = min(starts[0] for starts in self._in_flight.values())
+        return oldest + stale_after
@@ -0,0 +1,156 @@
+"""
+Network Metrics - Per-test timing and size aggregates of captured requests
+"""
+
+import json
+import threading
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+from config.constants import NetworkMetricsConstants
+from core.graphql_index import GraphQLIndex
+
+
+class NetworkMetrics:
+    """Aggregates the HAR entries of one test into percentiles per phase, host and GraphQL operation
+
+    Listens to a driver's HarRecorder, so it sees every completed request of
+    either capture backend as it finishes and keeps only the numbers it needs.
+    Phase timings (DNS, connect, TLS, time to first byte, download) are only
+    known for DevTools capture; selenium-wire entries contribute their total
+    duration and sizes. DNS, connect and TLS are only counted for requests that
+    opened a new connection.
+    """
+
+    PHASES = ["dns", "connect", "tls", "ttfb", "download", "total"]
+
+    def __init__(self, max_hosts: int = NetworkMetricsConstants.DEFAULT_MAX_HOSTS):
+        """Initialize empty metrics
+
+        Args:
+            max_hosts: Hosts with the most requests listed individually in the summary
+        """
+        self.max_hosts = max_hosts
+        self.requests = 0
+        self.failed = 0
+        self.transfer_bytes = 0
+        self.content_bytes = 0
+        self._phases: Dict[str, List[float]] = {phase: [] for phase in self.PHASES}
+        self._hosts: Dict[str, Dict[str, Any]] = {}
+        self._operations: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "NetworkMetrics":
+        """Create metrics with the host limit configured for this run"""
+        from config.settings import Settings
+
+        return cls(max_hosts=Settings.get_network_metrics_config().max_hosts)
+
+    def add_entry(self, entry: Dict[str, Any]) -> None:
+        """Account one HAR entry (HarRecorder listener)"""
+        request, response, timings = entry["request"], entry["response"], entry["timings"]
+        total = entry["time"]
+        transfer = max(response.get("bodySize", -1), 0)
+        content = response.get("content", {}).get("size", 0)
+        host = urlsplit(request["url"]).hostname or ""
+
+        phases = {"total": total}
+        if entry.get("_phaseTimings", True):
+            # HAR connect includes the TLS handshake
+            ssl = timings.get("ssl", -1)
+            connect = timings.get("connect", -1)
+            phases.update(
+                {
+                    "dns": timings.get("dns", -1),
+                    "connect": connect - max(ssl, 0) if connect >= 0 else -1,
+                    "tls": ssl,
+                    "ttfb": timings.get("wait", -1),
+                    "download": timings.get("receive", -1),
+                }
+            )
+
+        operations = []
+        if request.get("method") == "POST" and GraphQLIndex.is_graphql_url(request["url"]):
+            operations = self._operation_names(request.get("postData", {}).get("text", ""))
+
+        with self._lock:
+            self.requests += 1
+            self.failed += response.get("status", 0) == 0
+            self.transfer_bytes += transfer
+            self.content_bytes += content
+            for phase, value in phases.items():
+                if value >= 0:
+                    self._phases[phase].append(value)
+
+            host_stats = self._hosts.setdefault(host, {"requests": 0, "transfer_bytes": 0, "total": [], "ttfb": []})
+            host_stats["requests"] += 1
+            host_stats["transfer_bytes"] += transfer
+            host_stats["total"].append(total)
+            if phases.get("ttfb", -1) >= 0:
+                host_stats["ttfb"].append(phases["ttfb"])
+
+            for operation in operations:
+                self._operations.setdefault(operation, []).append(total)
+
+    def summary(self) -> Dict[str, Any]:
+        """Get the compact JSON-serializable summary of the test's traffic
+
+        Returns:
+            dict: Request counts, bytes, per-phase percentiles and per-host and per-operation latencies (ms)
+        """
+        with self._lock:
+            hosts = sorted(self._hosts.items(), key=lambda item: item[1]["requests"], reverse=True)
+            listed, rest = hosts[: self.max_hosts], hosts[self.max_hosts:]
+
+            host_summary = {
+                host: {
+                    "requests": stats["requests"],
+                    "transfer_bytes": stats["transfer_bytes"],
+                    "total_ms": self._distribution(stats["total"]),
+                    "ttfb_ms": self._distribution(stats["ttfb"]),
+                }
+                for host, stats in listed
+            }
+            if rest:
+                host_summary["other"] = {
+                    "hosts": len(rest),
+                    "requests": sum(stats["requests"] for _, stats in rest),
+                    "transfer_bytes": sum(stats["transfer_bytes"] for _, stats in rest),
+                    "total_ms": self._distribution([value for _, stats in rest for value in stats["total"]]),
+                }
+
+            return {
+                "requests": self.requests,
+                "failed": self.failed,
+                "transfer_bytes": self.transfer_bytes,
+                "content_bytes": self.content_bytes,
+                "timings_ms": {phase: self._distribution(values) for phase, values in self._phases.items() if values},
+                "hosts": host_summary,
+                "graphql_ms": {
+                    operation: self._distribution(values) for operation, values in sorted(self._operations.items())
+                },
+            }
+
+    @staticmethod
+    def _distribution(values: List[float]) -> Dict[str, float]:
+        """Count, percentiles and max of values, rounded to 0.1 ms"""
+        from utils.reporters.metrics_reporter import MetricsReporter
+
+        if not values:
+            return {"count": 0}
+        distribution = {"count": len(values)}
+        for percent in NetworkMetricsConstants.PERCENTILES:
+            distribution[f"p{percent}"] = round(MetricsReporter.percentile(values, percent), 1)
+        distribution["max"] = round(max(values), 1)
+        return distribution
+
+    @staticmethod
+    def _operation_names(payload: str) -> List[str]:
+        """Operation names of a GraphQL payload, one per operation of a batch"""
+        try:
+            parsed = json.loads(payload or "null")
+        except ValueError:
+            return []
+        operations = parsed if isinstance(parsed, list) else [parsed]
+        return [operation.get("operationName") or "" for operation in operations if isinstance(operation, dict)]
@@ -0,0 +1,81 @@
+"""
+Performance Profile - Network and CPU throttling of a live driver for low-end device simulation
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+from config.constants import PerformanceProfileConstants
+from core.exceptions.framework_exceptions import ConfigurationException
+
+
+@dataclass(frozen=True)
+class PerformanceProfile:
+    """Network latency, throughput and CPU speed of a simulated device"""
+
+    name: str
+    latency_ms: float
+    download_kbps: float
+    upload_kbps: float
+    cpu_slowdown: float
+
+    @property
+    def throttled(self) -> bool:
+        """Whether the profile slows anything down"""
+        return bool(self.latency_ms or self.download_kbps or self.upload_kbps or self.cpu_slowdown > 1)
+
+
+class PerformanceThrottler:
+    """Applies performance profiles to Chrome over DevTools
+
+    Network conditions (Network.emulateNetworkConditions) and the CPU slowdown
+    (Emulation.setCPUThrottlingRate) hold for the driver's page target until
+    changed, surviving navigations and session resets, so a profile costs two
+    DevTools commands per checkout instead of a browser launch.
+    """
+
+    @staticmethod
+    def get(name: str) -> PerformanceProfile:
+        """Get a named performance profile
+
+        Args:
+            name: Profile name (e.g. "slow-4g")
+
+        Returns:
+            PerformanceProfile: The profile
+
+        Raises:
+            ConfigurationException: If the profile is unknown
+        """
+        if name not in PerformanceProfileConstants.PROFILES:
+            raise ConfigurationException(
+                f"Unknown performance profile '{name}'",
+                {"performance_profile": name, "supported": PerformanceThrottler.names()},
+            )
+        return PerformanceProfile(name=name, **PerformanceProfileConstants.PROFILES[name])
+
+    @staticmethod
+    def names() -> List[str]:
+        """Get the names of all performance profiles"""
+        return list(PerformanceProfileConstants.PROFILES)
+
+    @staticmethod
+    def apply(driver, profile: PerformanceProfile) -> None:
+        """Throttle the driver's current page target to a profile (the "none" profile lifts throttling)
+
+        Args:
+            driver: Chrome WebDriver instance
+            profile: Profile to apply
+        """
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.emulateNetworkConditions",
+            {
+                "offline": False,
+                "latency": profile.latency_ms,
+                # DevTools expects bytes per second, -1 disables the limit
+                "downloadThroughput": profile.download_kbps * 1024 / 8 if profile.download_kbps else -1,
+                "uploadThroughput": profile.upload_kbps * 1024 / 8 if profile.upload_kbps else -1,
+            },
+        )
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": max(1, profile.cpu_slowdown)})
@@ -0,0 +1,137 @@
+"""
+Process Monitor - Memory and CPU usage of a browser's process tree
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+
+@dataclass
+class ProcessTreeUsage:
+    """Resource usage summed over a process and all of its descendants"""
+
+    rss_mb: float
+    cpu_seconds: float
+    process_count: int
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Get the usage as a dictionary"""
+        return asdict(self)
+
+
+class ProcessMonitor:
+    """Measures the chromedriver process tree (chromedriver, Chrome and its helper processes)
+
+    Reads /proc on Linux and falls back to ps elsewhere; returns None where
+    neither is available.
+    """
+
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    _CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    @classmethod
+    def get_driver_usage(cls, driver) -> Optional[ProcessTreeUsage]:
+        """Measure the process tree started by a driver's chromedriver service
+
+        Args:
+            driver: WebDriver instance launched with a local service
+
+        Returns:
+            ProcessTreeUsage: Usage of the tree, or None if it cannot be measured
+        """
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is None or process.poll() is not None:
+            return None
+        return cls.get_tree_usage(process.pid)
+
+    @classmethod
+    def get_tree_usage(cls, root_pid: int) -> Optional[ProcessTreeUsage]:
+        """Measure a process and all of its descendants
+
+        Args:
+            root_pid: PID of the root process
+
+        Returns:
+            ProcessTreeUsage: Usage of the tree, or None if it cannot be measured
+        """
+        processes = cls._read_processes()
+        if processes is None or root_pid not in processes:
+            return None
+
+        children: Dict[int, List[int]] = {}
+        for pid, (ppid, _, _) in processes.items():
+            children.setdefault(ppid, []).append(pid)
+
+        rss_bytes = 0
+        cpu_seconds = 0.0
+        count = 0
+        pending = [root_pid]
+        while pending:
+            pid = pending.pop()
+            _, rss, cpu = processes[pid]
+            rss_bytes += rss
+            cpu_seconds += cpu
+            count += 1
+            pending.extend(children.get(pid, []))
+
+        return ProcessTreeUsage(rss_mb=rss_bytes / (1024 * 1024), cpu_seconds=cpu_seconds, process_count=count)
+
+    @classmethod
+    def _read_processes(cls) -> Optional[Dict[int, Tuple[int, int, float]]]:
+        """Get parent PID, RSS bytes and CPU seconds of every process"""
+        if sys.platform.startswith("linux") and os.path.isdir("/proc"):
+            return cls._read_proc()
+        if sys.platform != "win32":
+            return cls._read_ps()
+        return None
+
+    @classmethod
+    def _read_proc(cls) -> Dict[int, Tuple[int, int, float]]:
+        """Read process usage from /proc/<pid>/stat"""
+        processes = {}
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{name}/stat", encoding="utf-8") as f:
+                    stat = f.read()
+            except OSError:
+                continue
+
+            # The command name may contain spaces, fields after it are fixed
+            fields = stat[stat.rfind(")") + 2:].split()
+            ppid = int(fields[1])
+            cpu_seconds = (int(fields[11]) + int(fields[12])) / cls._CLOCK_TICKS
+            rss_bytes = int(fields[21]) * cls._PAGE_SIZE
+            processes[int(name)] = (ppid, rss_bytes, cpu_seconds)
+        return processes
+
+    @classmethod
+    def _read_ps(cls) -> Optional[Dict[int, Tuple[int, int, float]]]:
+        """Read process usage from ps (macOS and other Unix systems)"""
+        try:
+            output = subprocess.run(
+                ["ps", "-A", "-o", "pid=,ppid=,rss=,time="], capture_output=True, text=True, timeout=10
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+
+        processes = {}
+        for line in output.splitlines():
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            processes[int(parts[0])] = (int(parts[1]), int(parts[2]) * 1024, cls._parse_cpu_time(parts[3]))
+        return processes
+
+    @staticmethod
+    def _parse_cpu_time(value: str) -> float:
+        """Parse ps cumulative CPU time ([[dd-]hh:]mm:ss[.ss])"""
+        days, _, clock = value.rpartition("-")
+        seconds = 0.0
+        for part in clock.split(":"):
+            seconds = seconds * 60 + float(part)
+        return seconds + (int(days) * 86400 if days else 0)
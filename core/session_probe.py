@@ -0,0 +1,206 @@
+"""
+Session Probe - Cheap detection of WebDriver sessions whose Chrome or chromedriver died
+"""
+
+import json
+import socket
+import urllib.error
+import urllib.request
+from typing import Any, Callable, Dict, Optional
+
+from selenium.common.exceptions import InvalidSessionIdException, SessionNotCreatedException, WebDriverException
+from selenium.webdriver.remote.command import Command
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+
+from config.constants import SessionProbeConstants
+from core.exceptions.framework_exceptions import DeadSessionException
+
+
+class SessionProbe:
+    """Liveness checks for a WebDriver session
+
+    A check first asks the operating system whether chromedriver is still
+    running, then sends one cheap command (the current window handle) straight
+    to chromedriver with a short timeout, so a hung or crashed browser is
+    detected in milliseconds instead of after a full command timeout. Only a
+    refused or reset connection, or an error body naming a dead session, marks
+    the session dead; a probe that keeps timing out is inconclusive.
+    """
+
+    # chromedriver listens locally, HTTP(S)_PROXY must not reroute the probe
+    _opener = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+    @classmethod
+    def check(cls, driver) -> Optional[str]:
+        """Check whether a driver's session is dead
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            Optional[str]: Why the session is dead, or None if it is alive
+        """
+        guard = getattr(driver, "session_guard", None)
+        if guard is not None and guard.dead_reason:
+            return guard.dead_reason
+
+        process = getattr(getattr(driver, "service", None), "process", None)
+        if process is not None and process.poll() is not None:
+            return f"chromedriver exited with code {process.returncode}"
+
+        return cls._probe(driver)
+
+    @classmethod
+    def is_dead_error(cls, message: str) -> bool:
+        """Check whether a chromedriver error message means the session is gone"""
+        message = message.lower()
+        return any(marker in message for marker in SessionProbeConstants.DEAD_SESSION_MARKERS)
+
+    @classmethod
+    def _probe(cls, driver) -> Optional[str]:
+        """Ask chromedriver for the session's window handle, bypassing the client's long timeout"""
+        server_url = cls._server_url(driver)
+        if not server_url or not driver.session_id:
+            return None
+
+        url = f"{server_url.rstrip('/')}/session/{driver.session_id}/window"
+        for _ in range(SessionProbeConstants.PROBE_ATTEMPTS):
+            try:
+                with cls._opener.open(url, timeout=SessionProbeConstants.PROBE_TIMEOUT) as response:
+                    body = json.load(response)
+                break
+            except urllib.error.HTTPError as e:
+                # chromedriver answers errors with a JSON body and a 4xx/5xx status
+                try:
+                    body = json.load(e)
+                except ValueError:
+                    return f"chromedriver answered HTTP {e.code}"
+                break
+            except (OSError, ValueError) as e:
+                reason = e.reason if isinstance(e, urllib.error.URLError) else e
+                if isinstance(reason, (ConnectionRefusedError, ConnectionResetError)):
+                    return f"chromedriver unreachable: {reason}"
+                if not isinstance(reason, socket.timeout):
+                    # Neither a dead chromedriver nor a slow one, e.g. a malformed answer
+                    return None
+        else:
+            # chromedriver is busy, the command that failed decides
+            return None
+
+        value = body.get("value") if isinstance(body, dict) else None
+        if isinstance(value, dict) and value.get("error"):
+            error = f"{value['error']}: {value.get('message', '')}"
+            if cls.is_dead_error(error):
+                return error.splitlines()[0]
+        return None
+
+    @staticmethod
+    def _server_url(driver) -> Optional[str]:
+        """Get the chromedriver URL a driver sends its commands to"""
+        executor = getattr(driver, "command_executor", None)
+        client_config = getattr(executor, "_client_config", None)
+        if client_config is not None:
+            return client_config.remote_server_addr
+        return getattr(executor, "_url", None)
+
+
+class SessionGuard:
+    """Turns commands failing on a dead session into DeadSessionException
+
+    Installed on a driver by wrapping its execute method, which every driver
+    and element command goes through. When a command fails with an error that
+    can mean a dead session, the session is probed; if it is dead the owner is
+    notified (to respawn the driver) and every later command fails immediately
+    instead of waiting for chromedriver.
+    """
+
+    # Errors a live session never raises for missing elements, stale references or slow pages
+    SUSPICIOUS_ERRORS = (InvalidSessionIdException, SessionNotCreatedException, Urllib3HTTPError, ConnectionError)
+
+    def __init__(self, driver, on_dead: Callable[[Any, str], None]):
+        """Initialize the guard and wrap the driver's execute method
+
+        Args:
+            driver: WebDriver instance to guard
+            on_dead: Callable notified with the driver and reason once the session is found dead
+        """
+        self.driver = driver
+        self.dead_reason: Optional[str] = None
+        self._on_dead = on_dead
+        self._execute = driver.execute
+        driver.execute = self.execute
+        driver.session_guard = self
+
+    @classmethod
+    def install(cls, driver, on_dead: Callable[[Any, str], None]) -> "SessionGuard":
+        """Guard a driver, reusing its existing guard if it already has one
+
+        Args:
+            driver: WebDriver instance to guard
+            on_dead: Callable notified with the driver and reason once the session is found dead
+
+        Returns:
+            SessionGuard: The driver's guard
+        """
+        guard = getattr(driver, "session_guard", None)
+        if guard is None:
+            return cls(driver, on_dead)
+        guard._on_dead = on_dead
+        return guard
+
+    def execute(self, driver_command: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a command on the wrapped driver
+
+        Raises:
+            DeadSessionException: If the session is dead
+        """
+        if self.dead_reason is not None:
+            if driver_command == Command.QUIT:
+                # Nothing left to delete, quit() still stops the chromedriver service
+                return {"value": None}
+            raise self._dead_session_exception(driver_command)
+
+        try:
+            return self._execute(driver_command, params)
+        except Exception as e:
+            if driver_command == Command.QUIT or not self._is_suspicious(e):
+                raise
+            reason = SessionProbe.check(self.driver)
+            if reason is None:
+                raise
+            self.mark_dead(reason)
+            raise self._dead_session_exception(driver_command) from e
+
+    def mark_dead(self, reason: str, notify: bool = True) -> None:
+        """Record that the session is dead and notify the owner once
+
+        Args:
+            reason: Why the session is dead
+            notify: Whether to call the owner's on_dead callback
+        """
+        if self.dead_reason is not None:
+            return
+        self.dead_reason = reason
+        if not notify:
+            return
+        try:
+            self._on_dead(self.driver, reason)
+        except Exception as e:
+            print(f"Warning: Error handling dead WebDriver session: {e}")
+
+    def _is_suspicious(self, error: Exception) -> bool:
+        """Check whether a command error could come from a dead session"""
+        if isinstance(error, self.SUSPICIOUS_ERRORS):
+            return True
+        # Crashes and lost DevTools connections surface as plain "unknown error"
+        return type(error) is WebDriverException or (
+            isinstance(error, WebDriverException) and SessionProbe.is_dead_error(str(error))
+        )
+
+    def _dead_session_exception(self, driver_command: str) -> DeadSessionException:
+        """Build the exception raised for a command on the dead session"""
+        return DeadSessionException(
+            f"WebDriver session is dead: {self.dead_reason}",
+            reason=self.dead_reason,
+            details={"command": driver_command, "session_id": self.driver.session_id},
+        )
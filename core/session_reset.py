@@ -0,0 +1,154 @@
+"""
+Session Reset - Fast DevTools-based cleanup of reused WebDriver sessions
+"""
+
+from typing import List, Set
+
+from selenium.common.exceptions import WebDriverException
+
+from config.constants import SessionResetConstants
+from core.exceptions.framework_exceptions import SessionResetException
+from core.visited_origins import VisitedOrigins
+
+
+class SessionReset:
+    """Resets a live Chrome session to a clean state without relaunching the browser
+
+    The reset closes extra windows, loads a blank page and clears cookies, HTTP cache,
+    per-origin storage (local/session storage, IndexedDB, service workers, cache
+    storage) and captured network requests. Storage is cleared for every origin
+    the driver loaded a document from since the last reset, as reported by its
+    capture backend, plus the origins of the frames still open. The verification
+    step re-checks that contract and raises SessionResetException listing
+    whatever leaked.
+    """
+
+    @classmethod
+    def reset(cls, driver, extra_origins: List[str] = None, verify: bool = SessionResetConstants.VERIFY_RESET) -> None:
+        """Reset a driver to a clean state
+
+        Args:
+            driver: Chrome WebDriver instance to reset
+            extra_origins: Additional origins whose storage is always cleared (e.g. the base URL)
+            verify: Whether to verify the reset afterwards
+
+        Raises:
+            SessionResetException: If a reset command fails or state leaked after the reset
+        """
+        try:
+            origins = cls._close_windows_and_collect_origins(driver)
+            origins.update(VisitedOrigins.origin(url) for url in extra_origins or [])
+            visited = getattr(driver, "visited_origins", None)
+            if visited is not None:
+                origins.update(visited.take())
+            origins.discard(None)
+
+            driver.get(SessionResetConstants.BLANK_URL)
+
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            for origin in sorted(origins):
+                driver.execute_cdp_cmd(
+                    "Storage.clearDataForOrigin",
+                    {"origin": origin, "storageTypes": SessionResetConstants.CLEARED_STORAGE_TYPES},
+                )
+
+            # Clear captured traffic last so nothing from the reset itself remains
+            if hasattr(driver, "requests"):
+                del driver.requests
+            for tracker in (getattr(driver, "network_activity", None), getattr(driver, "graphql", None)):
+                if tracker is not None:
+                    tracker.clear()
+        except WebDriverException as e:
+            raise SessionResetException(f"Failed to reset driver session: {e.msg or e}")
+
+        if verify:
+            cls.verify(driver, sorted(origins))
+
+    @classmethod
+    def verify(cls, driver, origins: List[str]) -> None:
+        """Verify that a driver holds no state from the previous test
+
+        Args:
+            driver: Chrome WebDriver instance to verify
+            origins: Origins whose storage must be empty
+
+        Raises:
+            SessionResetException: If any state leaked
+        """
+        leaks = []
+
+        try:
+            handles = driver.window_handles
+            if len(handles) != 1:
+                leaks.append(f"{len(handles)} windows open")
+
+            if driver.current_url != SessionResetConstants.BLANK_URL:
+                leaks.append(f"current URL is {driver.current_url}")
+
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+            if cookies:
+                leaks.append(f"{len(cookies)} cookies remain")
+
+            if hasattr(driver, "last_request") and driver.last_request is not None:
+                leaks.append("captured requests remain")
+
+            for origin in origins:
+                leaks.extend(cls._storage_leaks(driver, origin))
+        except WebDriverException as e:
+            raise SessionResetException(f"Failed to verify driver session reset: {e.msg or e}", leaks)
+
+        if leaks:
+            raise SessionResetException("Driver session state leaked after reset", leaks)
+
+    @classmethod
+    def _close_windows_and_collect_origins(cls, driver) -> Set[str]:
+        """Clear session storage in every window, close extra windows and collect frame origins"""
+        origins = set()
+        handles = driver.window_handles
+
+        for handle in reversed(handles):
+            driver.switch_to.window(handle)
+            origins.update(cls._frame_origins(driver))
+
+            # Session storage lives with the tab, so it has to be cleared from the page
+            driver.execute_script("try { window.sessionStorage.clear(); } catch (e) {}")
+
+            if handle != handles[0]:
+                driver.close()
+
+        driver.switch_to.window(handles[0])
+        return origins
+
+    @classmethod
+    def _frame_origins(cls, driver) -> Set[str]:
+        """Get security origins of all frames in the current window"""
+        origins = set()
+        pending = [driver.execute_cdp_cmd("Page.getFrameTree", {}).get("frameTree", {})]
+
+        while pending:
+            node = pending.pop()
+            origin = node.get("frame", {}).get("securityOrigin")
+            if origin and origin.startswith("http"):
+                origins.add(origin)
+            pending.extend(node.get("childFrames", []))
+
+        return origins
+
+    @classmethod
+    def _storage_leaks(cls, driver, origin: str) -> List[str]:
+        """Check IndexedDB databases and quota-managed storage usage for an origin"""
+        leaks = []
+
+        databases = driver.execute_cdp_cmd(
+            "IndexedDB.requestDatabaseNames", {"securityOrigin": origin}
+        ).get("databaseNames", [])
+        if databases:
+            leaks.append(f"{origin}: IndexedDB databases {databases}")
+
+        usage = driver.execute_cdp_cmd("Storage.getUsageAndQuota", {"origin": origin})
+        for entry in usage.get("usageBreakdown", []):
+            if entry.get("storageType") in SessionResetConstants.VERIFIED_STORAGE_TYPES and entry.get("usage"):
+                leaks.append(f"{origin}: {entry['storageType']} uses {entry['usage']} bytes")
+
+        return leaks
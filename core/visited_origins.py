@@ -0,0 +1,77 @@
+"""
+Visited Origins - Origins of the documents a driver loaded, for complete session resets
+"""
+
+import threading
+from typing import Callable, Optional, Set
+from urllib.parse import urlparse
+
+from config.constants import SessionResetConstants
+from core.interceptors import InterceptorChain
+
+
+class VisitedOrigins:
+    """Collects the origin of every document (page or frame) a driver loads
+
+    Per-origin storage (localStorage, IndexedDB, service workers, cache
+    storage) is written by documents and the workers they start, so a reset
+    that clears these origins covers every site a test navigated through, not
+    just the pages still open when the driver is returned.
+    Capture backends report document requests as they are sent.
+    """
+
+    def __init__(self, pump: Optional[Callable[[], None]] = None):
+        """Initialize an empty set
+
+        Args:
+            pump: Optional callable delivering pending captures before the origins are read (pull-based backends)
+        """
+        self._pump = pump
+        self._origins: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def attach_to_wire_driver(cls, driver) -> "VisitedOrigins":
+        """Collect a selenium-wire driver's document origins through its interceptor chain
+
+        Document requests are recognized by their Sec-Fetch-Dest header.
+
+        Args:
+            driver: selenium-wire WebDriver instance
+
+        Returns:
+            VisitedOrigins: Collector exposed as driver.visited_origins
+        """
+        visited = cls()
+
+        def on_request(request) -> None:
+            if request.headers.get("Sec-Fetch-Dest", "") in SessionResetConstants.DOCUMENT_DESTINATIONS:
+                visited.add(request.url)
+
+        InterceptorChain.install(driver).add_request_hook(on_request)
+        driver.visited_origins = visited
+        return visited
+
+    @staticmethod
+    def origin(url: str) -> Optional[str]:
+        """Get the origin (scheme://host[:port]) of a URL, or None for non-HTTP URLs"""
+        parsed = urlparse(url)
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
+
+    def add(self, url: str) -> None:
+        """Record the origin of a document URL"""
+        origin = self.origin(url)
+        if origin is None:
+            return
+        with self._lock:
+            self._origins.add(origin)
+
+    def take(self) -> Set[str]:
+        """Get the origins recorded since the last call and start over"""
+        if self._pump is not None:
+            self._pump()
+        with self._lock:
+            origins, self._origins = self._origins, set()
+        return origins
@@ -10,8 +10,10 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 
 from core.base.base_page import BasePage
-from core.exceptions.framework_exceptions import ElementNotFoundException
-from config.constants import TimeoutConstants
+from core.exceptions.framework_exceptions import (ConfigurationException,
+                                                  ElementNotFoundException,
+                                                  TimeoutException)
+from config.constants import GraphQLConstants, TimeoutConstants
 from pages.twitch_streamer_page import TwitchStreamerPage
 
 class TwitchSearchPage(BasePage):
@@ -25,6 +27,7 @@ class TwitchSearchPage(BasePage):
 
     def __init__(self, driver: WebDriver):
         super().__init__(driver)
+        self._search_term: Optional[str] = None
 
     def search_for_term(self, search_term: str) -> bool:
         """Perform search for the given term
@@ -49,6 +52,7 @@ class TwitchSearchPage(BasePage):
             # Clear and input search term
             search_input.clear()
             search_input.send_keys(search_term)
+            self._search_term = search_term
             return True
         except ElementNotFoundException:
             # Log the error but return False instead of raising exception
@@ -65,12 +69,29 @@ class TwitchSearchPage(BasePage):
             list: List of search result elements, empty list if none found
         """
         try:
-            self.wait_for_network_idle()
+            self._wait_for_search_suggestions()
             elements = self.find_elements(self.SEARCH_RESULTS)
             return elements if elements else []
         except Exception:
             return []
 
+    def _wait_for_search_suggestions(self) -> None:
+        """Wait for the typeahead GraphQL response of the current search term
+
+        Falls back to a network idle wait without GraphQL capture or when the
+        response does not arrive in time.
+        """
+        term = self._search_term
+        try:
+            self.wait_for_graphql(
+                GraphQLConstants.SEARCH_SUGGESTIONS_OPERATION,
+                predicate=lambda exchange: term is None or exchange.variables.get("queryFragment") == term,
+                timeout=TimeoutConstants.QUICK_WAIT,
+            )
+        except (ConfigurationException, TimeoutException) as e:
+            self.logger.info(f"[GraphQL] Falling back to network idle wait: {e}")
+            self.wait_for_network_idle()
+
     def wait_for_search_streamer_results(self) -> bool:
         self.wait_for_page_load()
         return self.is_element_present(self.STREAMER_LINK) and self.is_element_present(
@@ -85,15 +106,11 @@ class TwitchSearchPage(BasePage):
             bool: False if no streamer found or error occurs
         """
         try:
-            # Use flexible locators to find and click first streamer
-            streamer_elements = [
-                x
-                for x in self.find_elements(self.STREAMER_LINK)
-                if self.is_element_within_viewport(x)
-            ]
-
-            if streamer_elements:
-                streamer_elements[0].click()
+            # Query every streamer link once and click the first one not covered by overlays
+            streamer_links = [link for link in self.query_elements(self.STREAMER_LINK) if link.topmost]
+
+            if streamer_links:
+                streamer_links[0].element.click()
                 return TwitchStreamerPage(self.driver)
             return False
         except ElementNotFoundException:
@@ -0,0 +1,103 @@
+"""
+Unit tests for the static asset disk cache
+"""
+
+import gzip
+import os
+
+import pytest
+from seleniumwire.request import Request, Response
+from seleniumwire.thirdparty.mitmproxy.http import HTTPResponse
+
+from config.constants import AssetCacheConstants
+from core.asset_cache import AssetCache, AssetCacheStats
+
+ASSET_URL = "https://static.twitchcdn.net/assets/player-core-0123456789abcdef.js"
+ASSET_BODY = b"console.log('player');" * 200
+
+
+@pytest.fixture(autouse=True)
+def totals(monkeypatch):
+    # Process-wide counters feed the end-of-session summary, tests must not leak into it
+    monkeypatch.setattr(AssetCache, "_totals", AssetCacheStats())
+
+
+def make_request(url=ASSET_URL):
+    return Request(method="GET", url=url, headers=[("Accept-Encoding", "gzip")])
+
+
+def make_response(body=ASSET_BODY, encoding="gzip"):
+    headers = [("Content-Type", "application/javascript"), ("Cache-Control", "public, max-age=31536000, immutable")]
+    if encoding == "gzip":
+        body = gzip.compress(body)
+        headers.append(("Content-Encoding", "gzip"))
+    headers.append(("Content-Length", str(len(body))))
+    return Response(status_code=200, reason="OK", headers=headers, body=body)
+
+
+def serve(cache, url=ASSET_URL):
+    """Answer a request from the cache the way selenium-wire sends a created response"""
+    request = make_request(url)
+    cache._on_request(request)
+    if request.response is None:
+        return None
+    return HTTPResponse.make(
+        status_code=request.response.status_code,
+        content=request.response.body,
+        headers=[(name.encode("utf-8"), value.encode("utf-8")) for name, value in request.response.headers.items()],
+    )
+
+
+class TestAssetCache:
+    """Store, lookup and eviction of cached assets"""
+
+    def test_gzip_asset_round_trips_through_the_proxy_undamaged(self, tmp_path):
+        cache = AssetCache(str(tmp_path), max_mb=0)
+        cache._on_response(make_request(), make_response())
+
+        served = serve(cache)
+
+        assert served is not None
+        assert "Content-Encoding" not in served.headers
+        assert served.raw_content == ASSET_BODY
+        assert served.headers["Content-Length"] == str(len(ASSET_BODY))
+        assert served.headers[AssetCacheConstants.HIT_HEADER] == "hit"
+
+    def test_miss_leaves_request_to_the_network(self, tmp_path):
+        cache = AssetCache(str(tmp_path), max_mb=0)
+        assert serve(cache) is None
+
+    def test_non_asset_and_uncacheable_responses_are_not_stored(self, tmp_path):
+        cache = AssetCache(str(tmp_path), max_mb=0)
+        cache._on_response(make_request("https://www.twitch.tv/directory"), make_response())
+        private = make_response()
+        del private.headers["Cache-Control"]
+        private.headers["Cache-Control"] = "private"
+        cache._on_response(make_request(), private)
+
+        assert os.listdir(tmp_path) == []
+
+    def test_entry_of_older_layout_is_a_miss(self, tmp_path):
+        cache = AssetCache(str(tmp_path), max_mb=0)
+        cache.store(ASSET_URL, 200, [], ASSET_BODY)
+        path = cache._path(ASSET_URL)
+        with open(path, "rb") as asset_file:
+            lines = asset_file.read().split(b"\n", 1)
+        with open(path, "wb") as asset_file:
+            asset_file.write(lines[0].replace(b'"version": 2', b'"version": 1') + b"\n" + lines[1])
+
+        assert cache.lookup(ASSET_URL) is None
+        assert not os.path.exists(path)
+
+    def test_evict_removes_least_recently_used_assets(self, tmp_path):
+        cache = AssetCache(str(tmp_path), max_mb=0)
+        urls = [f"https://static.twitchcdn.net/assets/chunk-{index:016x}.js" for index in range(3)]
+        for age, url in enumerate(urls):
+            cache.store(url, 200, [], b"x" * 1000)
+            os.utime(cache._path(url), (1000 + age, 1000 + age))
+        cache.max_bytes = 3000
+
+        assert cache.evict() == 1
+        assert cache.lookup(urls[0]) is None
+        assert cache.lookup(urls[1]) is not None
+        assert cache.lookup(urls[2]) is not None
@@ -0,0 +1,130 @@
+"""
+Unit tests for the bounded selenium-wire request storages
+"""
+
+import pytest
+from seleniumwire.request import Request, Response
+
+from seleniumwire.request import WebSocketMessage
+
+from core.capture_storage import BoundedDiskStorage, BoundedMemoryStorage, CaptureStorage, _BoundedStorageMixin
+
+URL = "https://gql.twitch.tv/gql"
+
+
+def save_exchange(storage, body=b"x" * 100, url=URL):
+    request = Request(method="POST", url=url, headers=[], body=b"{}")
+    storage.save_request(request)
+    storage.save_response(request.id, Response(status_code=200, reason="OK", headers=[], body=body))
+    return request
+
+
+@pytest.fixture(params=[BoundedMemoryStorage, BoundedDiskStorage], ids=["memory", "disk"])
+def storage_class(request):
+    return request.param
+
+
+class TestBoundedStorage:
+    """Oldest requests are evicted to stay within the entry and byte limits"""
+
+    def test_evicts_oldest_by_entries(self, tmp_path, storage_class):
+        storage = storage_class(base_dir=str(tmp_path), max_entries=2, max_bytes=0, max_body_bytes=0)
+        requests = [save_exchange(storage) for _ in range(3)]
+
+        assert [request.id for request in storage.load_requests()] == [request.id for request in requests[1:]]
+        stats = storage.take_stats()
+        assert (stats.stored, stats.evicted_entries, stats.evicted_bytes) == (3, 1, 0)
+
+    def test_evicts_oldest_by_bytes(self, tmp_path, storage_class):
+        exchange_bytes = len(URL) + 2 + 100
+        storage = storage_class(
+            base_dir=str(tmp_path), max_entries=0, max_bytes=2 * exchange_bytes, max_body_bytes=0
+        )
+        for _ in range(3):
+            save_exchange(storage)
+
+        stats = storage.take_stats()
+        assert len(storage.load_requests()) == 2
+        assert stats.evicted_bytes == 1
+        assert stats.stored_bytes == 2 * exchange_bytes
+
+    def test_newest_request_is_always_kept(self, tmp_path, storage_class):
+        storage = storage_class(base_dir=str(tmp_path), max_entries=0, max_bytes=10, max_body_bytes=0)
+        request = save_exchange(storage)
+
+        assert [stored.id for stored in storage.load_requests()] == [request.id]
+
+    def test_bodies_are_truncated(self, tmp_path, storage_class):
+        storage = storage_class(base_dir=str(tmp_path), max_entries=0, max_bytes=0, max_body_bytes=10)
+        save_exchange(storage)
+
+        assert storage.load_requests()[0].response.body == b"x" * 10
+        assert storage.take_stats().truncated_bodies == 1
+
+    def test_response_saved_twice_is_accounted_once(self, tmp_path, storage_class):
+        # selenium-wire saves the response of a mocked request twice
+        storage = storage_class(base_dir=str(tmp_path), max_entries=0, max_bytes=0, max_body_bytes=0)
+        request = save_exchange(storage)
+        storage.save_response(request.id, Response(status_code=200, reason="OK", headers=[], body=b"x" * 100))
+
+        assert storage.take_stats().stored_bytes == len(URL) + 2 + 100
+
+    def test_clear_resets_bytes(self, tmp_path, storage_class):
+        storage = storage_class(base_dir=str(tmp_path), max_entries=0, max_bytes=0, max_body_bytes=0)
+        save_exchange(storage)
+        storage.clear_requests()
+
+        assert storage.load_requests() == []
+        assert storage.take_stats().stored_bytes == 0
+
+    def test_requests_outside_scopes_are_not_stored(self, tmp_path, storage_class):
+        storage = storage_class(
+            base_dir=str(tmp_path), max_entries=0, max_bytes=0, max_body_bytes=0, scopes=[r"gql\.twitch\.tv"]
+        )
+        stored = save_exchange(storage)
+        skipped = save_exchange(storage, url="https://static.twitchcdn.net/app.js")
+        storage.save_ws_message(skipped.id, WebSocketMessage(from_client=True, content="ping", date=None))
+
+        # selenium-wire only runs the response interceptors for requests with an id
+        assert skipped.id is not None
+        assert [request.id for request in storage.load_requests()] == [stored.id]
+        assert storage.take_stats().stored == 1
+
+    def test_mixin_requires_evict(self):
+        class Unbounded(_BoundedStorageMixin):
+            pass
+
+        with pytest.raises(TypeError):
+            Unbounded()
+
+
+class FakeStorage:
+    def __init__(self, home_dir):
+        self.home_dir = home_dir
+
+    def cleanup(self):
+        pass
+
+
+class FakeBackend:
+    def __init__(self, home_dir):
+        self.storage = FakeStorage(home_dir)
+
+
+class FakeWireDriver:
+    def __init__(self, home_dir):
+        self.backend = FakeBackend(home_dir)
+
+
+class TestInstall:
+    """Scopes apply to the storage only, the interceptors see every request"""
+
+    def test_driver_scopes_are_not_set(self, tmp_path):
+        driver = FakeWireDriver(str(tmp_path / "storage-1"))
+
+        storage = CaptureStorage.install(driver, "memory", ["gql.twitch.tv"], 0, 0, 0)
+
+        assert not hasattr(driver, "scopes")
+        assert driver.backend.storage is storage
+        assert storage.in_scope(URL)
+        assert not storage.in_scope("https://static.twitchcdn.net/app.js")
@@ -0,0 +1,193 @@
+"""
+Unit tests for recording and replaying GraphQL traffic
+"""
+
+import asyncio
+import gzip
+import json
+import time
+
+import pytest
+from seleniumwire.request import Request, Response
+
+from config.constants import CassetteConstants
+from core.cassette import Cassette, ReplayLatency
+from core.exceptions.framework_exceptions import CassetteException, ConfigurationException
+
+GQL_URL = "https://gql.twitch.tv/gql"
+
+
+def payload(name="SearchResultsPage", **variables):
+    return json.dumps({"operationName": name, "variables": variables}).encode("utf-8")
+
+
+def make_request(body, method="POST"):
+    return Request(method=method, url=GQL_URL, headers=[("Origin", "https://m.twitch.tv")], body=body)
+
+
+def make_response(data):
+    body = gzip.compress(json.dumps({"data": data}).encode("utf-8"))
+    headers = [("Content-Type", "application/json"), ("Content-Encoding", "gzip"), ("Set-Cookie", "session=1")]
+    return Response(status_code=200, reason="OK", headers=headers, body=body)
+
+
+def record(path, exchanges):
+    cassette = Cassette()
+    cassette.start(CassetteConstants.RECORD, path)
+    for body, data in exchanges:
+        cassette._on_response(make_request(body), make_response(data))
+    return cassette.stop()
+
+
+def replay(cassette, body):
+    request = make_request(body)
+    cassette._on_request(request)
+    return request.response
+
+
+class TestRequestKey:
+    """Requests match by operation names and variables without volatile members"""
+
+    def test_volatile_variables_are_ignored(self):
+        assert Cassette.request_key(payload(query="a", requestID="1")) == Cassette.request_key(
+            payload(query="a", requestID="2")
+        )
+
+    def test_variables_change_the_key(self):
+        assert Cassette.request_key(payload(query="a")) != Cassette.request_key(payload(query="b"))
+
+    def test_persisted_query_hash_is_ignored(self):
+        with_hash = json.loads(payload(query="a"))
+        with_hash["extensions"] = {"persistedQuery": {"sha256Hash": "abc"}}
+        assert Cassette.request_key(json.dumps(with_hash).encode("utf-8")) == Cassette.request_key(payload(query="a"))
+
+    def test_batch_key_lists_operation_names(self):
+        batch = json.dumps([json.loads(payload("First")), json.loads(payload("Second"))]).encode("utf-8")
+        assert Cassette.request_key(batch).startswith("First+Second:")
+
+    def test_non_json_has_no_key(self):
+        assert Cassette.request_key(b"not json") is None
+        assert Cassette.request_key(b"[]") is None
+
+
+class TestReplay:
+    """Recorded responses are served back in order"""
+
+    def test_responses_replay_in_order_and_last_repeats(self, tmp_path):
+        path = str(tmp_path / "test.json.gz")
+        summary = record(path, [(payload(page=1), "first"), (payload(page=1), "second")])
+        assert summary["recorded"] == 2
+
+        cassette = Cassette()
+        cassette.start(CassetteConstants.REPLAY, path)
+        bodies = [json.loads(replay(cassette, payload(page=1, requestID="x")).body) for _ in range(3)]
+
+        assert [body["data"] for body in bodies] == ["first", "second", "second"]
+        assert cassette.stop()["replayed"] == 3
+
+    def test_recorded_headers_are_filtered(self, tmp_path):
+        path = str(tmp_path / "test.json.gz")
+        record(path, [(payload(), "data")])
+
+        cassette = Cassette()
+        cassette.start(CassetteConstants.REPLAY, path)
+        response = replay(cassette, payload())
+
+        assert response.headers["Content-Type"] == "application/json"
+        assert "Set-Cookie" not in response.headers
+        assert "Content-Encoding" not in response.headers
+
+    def test_unmatched_request_fails_on_stop(self, tmp_path):
+        path = str(tmp_path / "test.json.gz")
+        record(path, [(payload(page=1), "data")])
+
+        cassette = Cassette()
+        cassette.start(CassetteConstants.REPLAY, path)
+        response = replay(cassette, payload(page=2))
+
+        assert response.status_code == CassetteConstants.UNMATCHED_STATUS
+        with pytest.raises(CassetteException):
+            cassette.stop()
+
+    def test_missing_cassette(self, tmp_path):
+        with pytest.raises(CassetteException):
+            Cassette().start(CassetteConstants.REPLAY, str(tmp_path / "missing.json.gz"))
+
+    def test_unknown_mode(self, tmp_path):
+        with pytest.raises(ConfigurationException):
+            Cassette().start("rewind", str(tmp_path / "test.json.gz"))
+
+
+class FakeFlow:
+    """mitmproxy flow answered by the request hooks, recording intercepts"""
+
+    def __init__(self, request, loop):
+        self.request = request
+        self.response = request.response
+        self.loop = loop
+        self.intercepted_at = None
+        self.resumed_at = None
+
+    def intercept(self):
+        self.intercepted_at = self.loop.time()
+
+    def resume(self):
+        self.resumed_at = self.loop.time()
+
+
+class TestReplayLatency:
+    """Replay latency holds the answered flow without blocking the proxy"""
+
+    def test_request_hook_does_not_sleep(self, tmp_path):
+        path = str(tmp_path / "test.json.gz")
+        record(path, [(payload(), "data")])
+        cassette = Cassette(latency_ms=500)
+        cassette.start(CassetteConstants.REPLAY, path)
+
+        started = time.monotonic()
+        request = make_request(payload())
+        cassette._on_request(request)
+
+        assert time.monotonic() - started < 0.25
+        assert request.response.status_code == 200
+
+    def test_concurrent_answers_are_delayed_in_parallel(self, tmp_path):
+        path = str(tmp_path / "test.json.gz")
+        record(path, [(payload(page=1), "first"), (payload(page=2), "second")])
+        cassette = Cassette(latency_ms=100)
+        cassette.start(CassetteConstants.REPLAY, path)
+        addon = ReplayLatency(cassette)
+
+        async def replay_concurrently():
+            loop = asyncio.get_running_loop()
+            flows = []
+            for page in (1, 2):
+                request = make_request(payload(page=page))
+                cassette._on_request(request)
+                # selenium-wire assigns the storage id after the request hooks
+                request.id = f"request-{page}"
+                flows.append(FakeFlow(request, loop))
+            started = loop.time()
+            for flow in flows:
+                addon.request(flow)
+            hook_time = loop.time() - started
+            await asyncio.sleep(0.3)
+            return flows, hook_time
+
+        flows, hook_time = asyncio.run(replay_concurrently())
+
+        assert hook_time < 0.05
+        for flow in flows:
+            assert flow.intercepted_at is not None
+            assert 0.09 <= flow.resumed_at - flow.intercepted_at < 0.2
+        assert abs(flows[0].resumed_at - flows[1].resumed_at) < 0.05
+
+    def test_unrelated_flows_pass_through(self):
+        addon = ReplayLatency(Cassette(latency_ms=100))
+        flow = FakeFlow(make_request(payload()), loop=None)
+        flow.request.id = "other"
+        flow.response = object()
+
+        addon.request(flow)
+
+        assert flow.intercepted_at is None
@@ -0,0 +1,41 @@
+"""
+Unit tests for DevTools network capture on a dead session
+"""
+
+import json
+
+from core.cdp_network import CdpNetworkCapture
+from core.exceptions.framework_exceptions import DeadSessionException
+
+
+class DeadDriver:
+    """Driver whose session guard rejects every command"""
+
+    def get_log(self, log_type):
+        raise DeadSessionException("Session is dead", reason="chromedriver exited")
+
+    def execute_cdp_cmd(self, cmd, params):
+        raise DeadSessionException("Session is dead", reason="chromedriver exited")
+
+
+class TestCdpNetworkCaptureDeadSession:
+    """Teardown of capture artifacts still works after the session died"""
+
+    def test_har_recording_stops_and_closes_its_file(self, tmp_path):
+        capture = CdpNetworkCapture(DeadDriver())
+        har_path = str(tmp_path / "test.har")
+        capture.har.start(har_path)
+
+        assert capture.har.stop() == har_path
+        with open(har_path, encoding="utf-8") as har_file:
+            assert json.load(har_file)["log"]["entries"] == []
+
+    def test_listener_removal_and_body_fetch_do_not_raise(self):
+        capture = CdpNetworkCapture(DeadDriver())
+        entries = []
+        capture.har.add_listener(entries.append)
+
+        capture.har.remove_listener(entries.append)
+
+        assert capture.get_response_body("1.1") == b""
+        assert not capture.har.recording
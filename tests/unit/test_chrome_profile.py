@@ -0,0 +1,94 @@
+"""
+Unit tests for cloning per-driver Chrome profiles from the template
+"""
+
+import os
+import threading
+
+from config.constants import ChromeProfileConstants
+from core.chrome_profile import ChromeProfileManager
+from core.chromedriver_cache import ChromeDriverCache
+
+CACHE_ENTRY = os.path.join("Default", "Cache", "Cache_Data", "0123456789abcdef_0")
+
+
+def make_template(template_dir):
+    files = {
+        CACHE_ENTRY: b"cached response",
+        os.path.join("Default", "Cookies"): b"consent",
+        "SingletonLock": b"",
+        ChromeProfileConstants.TEMPLATE_MARKER_FILE: b"{}",
+    }
+    for relative_path, content in files.items():
+        path = os.path.join(template_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+
+class TestCloneTree:
+    """Profiles are independent copies of the template"""
+
+    def test_clone_copies_files_and_skips_locks(self, tmp_path):
+        template_dir, profile_dir = tmp_path / "template", tmp_path / "profile"
+        make_template(str(template_dir))
+        profile_dir.mkdir()
+
+        ChromeProfileManager._clone_tree(str(template_dir), str(profile_dir))
+
+        assert (profile_dir / "Default" / "Cookies").read_bytes() == b"consent"
+        assert not (profile_dir / "SingletonLock").exists()
+        assert not (profile_dir / ChromeProfileConstants.TEMPLATE_MARKER_FILE).exists()
+
+    def test_cache_entries_are_not_shared_with_template(self, tmp_path, monkeypatch):
+        # Chrome rewrites cache entries in place, a shared inode would leak writes into the template
+        monkeypatch.setattr(ChromeProfileManager, "_reflink_supported", False)
+        template_dir, profile_dir = tmp_path / "template", tmp_path / "profile"
+        make_template(str(template_dir))
+        profile_dir.mkdir()
+
+        ChromeProfileManager._clone_tree(str(template_dir), str(profile_dir))
+        with open(profile_dir / CACHE_ENTRY, "r+b") as f:
+            f.write(b"rewritten")
+
+        assert os.stat(profile_dir / CACHE_ENTRY).st_nlink == 1
+        assert (template_dir / CACHE_ENTRY).read_bytes() == b"cached response"
+
+
+class TestTemplateWarmup:
+    """Warming the template does not block the profile registry"""
+
+    def test_release_during_warmup(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ChromeDriverCache, "get_cache_dir", classmethod(lambda cls: str(tmp_path)))
+        monkeypatch.setattr(ChromeDriverCache, "get_chrome_major_version", classmethod(lambda cls: "120"))
+        monkeypatch.setattr(ChromeProfileManager, "_profiles_root", classmethod(lambda cls: str(tmp_path)))
+        monkeypatch.setattr(ChromeProfileManager, "_template_checked", False)
+        warming, finish_warming = threading.Event(), threading.Event()
+
+        def warm_template(staging_dir):
+            warming.set()
+            finish_warming.wait(5)
+
+        allocated = []
+        allocation = threading.Thread(target=lambda: allocated.append(ChromeProfileManager.allocate(warm_template)))
+        allocation.start()
+        try:
+            assert warming.wait(5)
+            profile_dir = tmp_path / "profile"
+            profile_dir.mkdir()
+            driver = object()
+            releasing = threading.Thread(
+                target=lambda: (
+                    ChromeProfileManager.register(driver, str(profile_dir)),
+                    ChromeProfileManager.release(driver),
+                )
+            )
+            releasing.start()
+            releasing.join(2)
+
+            assert not releasing.is_alive()
+            assert not profile_dir.exists()
+        finally:
+            finish_warming.set()
+            allocation.join(5)
+        assert allocated and os.path.isdir(allocated[0])
@@ -0,0 +1,98 @@
+"""
+Unit tests for Chrome driver creation: device emulation and failure handling
+"""
+
+import os
+
+import pytest
+from selenium import webdriver
+
+from core.chrome_profile import ChromeProfileManager
+from core.chromedriver_cache import ChromeDriverCache
+from core.device_emulation import DeviceCatalog
+from core.driver_manager import ChromeDriverFactory, NetworkCapture
+from core.driver_timing import DriverStartupMetrics, StartupTimer
+from core.exceptions.framework_exceptions import DriverException
+
+
+class FailingDriver:
+    """Driver whose setup after construction fails"""
+
+    def __init__(self):
+        self.quit_calls = 0
+
+    def implicitly_wait(self, seconds):
+        raise RuntimeError("session setup failed")
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+class RecordingDriver:
+    """Driver that accepts every setup call and records DevTools commands"""
+
+    def __init__(self, service=None, options=None):
+        self.options = options
+        self.cdp_commands = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_commands.append((cmd, params))
+
+    def get(self, url):
+        pass
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def factory_env(tmp_path, monkeypatch):
+    """Run driver creation without Chrome, chromedriver or a template profile"""
+    profile_dir = tmp_path / "profile"
+    profile_dir.mkdir()
+    monkeypatch.setenv("CHROME_PROFILE_TEMPLATE", "false")
+    monkeypatch.setattr(ChromeProfileManager, "allocate", classmethod(lambda cls, warm=None: str(profile_dir)))
+    monkeypatch.setattr(ChromeDriverCache, "get_driver_path", classmethod(lambda cls: "/usr/bin/true"))
+    # Keep the startup records of fake drivers out of the session's startup summary
+    monkeypatch.setattr(DriverStartupMetrics, "_records", [])
+    return profile_dir
+
+
+class TestDeviceEmulation:
+    """Fresh drivers get the same catalog profile that pooled drivers are restored to"""
+
+    def test_launch_applies_catalog_profile_without_chromedriver_preset(self, factory_env, monkeypatch):
+        monkeypatch.setattr(webdriver, "Chrome", RecordingDriver)
+        monkeypatch.setattr(StartupTimer, "time_driver_construction", lambda self, construct, service, wire: construct())
+
+        driver = ChromeDriverFactory()._create_chrome_mobile_driver("Pixel 7", capture=NetworkCapture.NONE)
+        ChromeProfileManager.release(driver)
+
+        assert "mobileEmulation" not in driver.options.experimental_options
+        commands = dict(driver.cdp_commands)
+        assert commands["Emulation.setUserAgentOverride"]["userAgent"] == DeviceCatalog.get("Pixel 7").user_agent
+        assert commands["Emulation.setDeviceMetricsOverride"]["width"] == DeviceCatalog.get("Pixel 7").width
+
+
+class TestDriverFactory:
+    """Cleanup of drivers whose setup fails after construction"""
+
+    def test_driver_is_quit_and_profile_removed_when_setup_fails(self, factory_env, monkeypatch):
+        profile_dir = factory_env
+        driver = FailingDriver()
+        monkeypatch.setattr(StartupTimer, "time_driver_construction", lambda self, construct, service, wire: driver)
+
+        with pytest.raises(DriverException):
+            ChromeDriverFactory()._create_chrome_mobile_driver("iPhone SE", capture=NetworkCapture.NONE)
+
+        assert driver.quit_calls == 1
+        assert not os.path.exists(profile_dir)
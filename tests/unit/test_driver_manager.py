@@ -0,0 +1,137 @@
+"""
+Unit tests for driver checkout and release bookkeeping in DriverManager
+"""
+
+import pytest
+
+from core.driver_manager import DriverManager
+from core.driver_pool import PooledDriver
+from core.driver_timing import DriverStartupMetrics
+from core.exceptions.framework_exceptions import DeadSessionException, DriverException, SessionResetException
+from core.session_probe import SessionProbe
+
+WORKER_KEY = DriverManager._get_worker_key("unit")
+
+
+class FakeDriver:
+    """Driver that accepts every command"""
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+    def quit(self):
+        pass
+
+
+class FakePool:
+    """Pool handing out one lease and recording what comes back"""
+
+    def __init__(self):
+        self.lease = PooledDriver(driver=FakeDriver(), key="key")
+        self.discarded = []
+        self.replenished = []
+        self.checked_in = []
+        self.reset_error = None
+
+    def checkout(self, key):
+        return self.lease
+
+    def checkin(self, lease):
+        if self.reset_error is not None:
+            self.discard(lease)
+            raise self.reset_error
+        self.checked_in.append(lease)
+
+    def discard(self, lease):
+        self.discarded.append(lease)
+
+    def replenish(self, key):
+        self.replenished.append(key)
+
+
+class FakeHealthMonitor:
+    """Health monitor asking to recycle every driver once a reason is set"""
+
+    def __init__(self, recycle_reason=None):
+        self.recycle_reason = recycle_reason
+
+    def check(self, lease, usage):
+        return self.recycle_reason
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake_pool = FakePool()
+    monkeypatch.setattr(DriverManager, "_get_pool", classmethod(lambda cls: fake_pool))
+    monkeypatch.setenv("DRIVER_MODE", "process")
+    # Checkout and lock wait metrics feed the end-of-session summary, tests must not leak into it
+    monkeypatch.setattr(DriverStartupMetrics, "_checkout_seconds", [])
+    monkeypatch.setattr(DriverStartupMetrics, "_lock_waits", {})
+    yield fake_pool
+    DriverManager._cleanup_worker(WORKER_KEY)
+
+
+class TestDriverCheckout:
+    """Leases are returned when setting up a checked-out driver fails"""
+
+    def test_lease_is_discarded_when_throttling_fails(self, pool, monkeypatch):
+        def fail(driver):
+            raise RuntimeError("throttling failed")
+
+        monkeypatch.setattr(DriverManager, "_apply_performance_profile", classmethod(lambda cls, driver: fail(driver)))
+
+        with pytest.raises(DriverException):
+            DriverManager.get_mobile_wire_driver(worker_id="unit")
+
+        assert pool.discarded == [pool.lease]
+        assert WORKER_KEY not in DriverManager._leases
+        assert WORKER_KEY not in DriverManager._drivers
+
+
+    def test_dead_session_is_not_wrapped(self, pool, monkeypatch):
+        def fail(driver):
+            raise DeadSessionException("WebDriver session is dead", reason="chromedriver exited")
+
+        monkeypatch.setattr(DriverManager, "_apply_performance_profile", classmethod(lambda cls, driver: fail(driver)))
+
+        with pytest.raises(DeadSessionException):
+            DriverManager.get_mobile_wire_driver(worker_id="unit")
+
+        assert pool.discarded == [pool.lease]
+        assert WORKER_KEY not in DriverManager._drivers
+
+
+class TestDriverRelease:
+    """Returned leases are reused, or quit and replaced"""
+
+    @pytest.fixture
+    def health_monitor(self, pool, monkeypatch):
+        monitor = FakeHealthMonitor()
+        monkeypatch.setattr(DriverManager, "_get_health_monitor", classmethod(lambda cls: monitor))
+        monkeypatch.setattr(SessionProbe, "check", classmethod(lambda cls, driver: None))
+        DriverManager._leases[WORKER_KEY] = pool.lease
+        DriverManager._drivers[WORKER_KEY] = pool.lease.driver
+        return monitor
+
+    def test_healthy_driver_is_checked_in(self, pool, health_monitor):
+        DriverManager.release_driver(worker_id="unit")
+
+        assert pool.checked_in == [pool.lease]
+        assert pool.replenished == []
+
+    def test_recycled_driver_is_replaced(self, pool, health_monitor):
+        health_monitor.recycle_reason = "served 50 tests"
+
+        DriverManager.release_driver(worker_id="unit")
+
+        assert pool.discarded == [pool.lease]
+        assert pool.replenished == ["key"]
+
+    def test_driver_failing_reset_is_replaced(self, pool, health_monitor):
+        pool.reset_error = SessionResetException("reset failed")
+
+        with pytest.raises(SessionResetException):
+            DriverManager.release_driver(worker_id="unit")
+
+        assert pool.discarded == [pool.lease]
+        assert pool.replenished == ["key"]
@@ -0,0 +1,213 @@
+"""
+Unit tests for the driver pool's checkout, return, expiry and prefetch accounting
+"""
+
+import itertools
+import threading
+import time
+
+import pytest
+
+from core.driver_pool import DriverPool, PoolStats
+from core.exceptions.framework_exceptions import DriverException
+
+KEY = "chrome-mobile"
+
+
+class FakeFactory:
+    """Creates numbered fake drivers and records which ones were quit"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.created = []
+        self.destroyed = []
+        self._ids = itertools.count()
+
+    def create(self, key):
+        time.sleep(self.delay)
+        driver = f"{key}-{next(self._ids)}"
+        self.created.append(driver)
+        return driver
+
+    def destroy(self, driver):
+        self.destroyed.append(driver)
+
+
+def make_pool(factory, **kwargs):
+    return DriverPool(create=factory.create, destroy=factory.destroy, **kwargs)
+
+
+def wait_for_launches(pool):
+    for thread in list(pool._prefetch_threads):
+        thread.join(5)
+
+
+class TestCheckout:
+    """Drivers are borrowed, returned and reused"""
+
+    def test_returned_driver_is_reused(self):
+        factory = FakeFactory()
+        pool = make_pool(factory)
+
+        first = pool.checkout(KEY)
+        pool.checkin(first)
+        second = pool.checkout(KEY)
+
+        assert second is first
+        assert second.checkouts == 2
+        assert factory.created == [first.driver]
+        assert (pool.pool_stats.misses, pool.pool_stats.reuse_hits) == (1, 1)
+
+    def test_checkin_without_reuse_quits_driver(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, reuse=False)
+
+        entry = pool.checkout(KEY)
+        pool.checkin(entry)
+
+        assert factory.destroyed == [entry.driver]
+        assert pool.stats() == {}
+
+    def test_failed_reset_quits_driver_and_raises(self):
+        factory = FakeFactory()
+
+        def reset(driver):
+            raise RuntimeError("reset failed")
+
+        pool = make_pool(factory, reset=reset)
+        entry = pool.checkout(KEY)
+        with pytest.raises(RuntimeError):
+            pool.checkin(entry)
+
+        assert factory.destroyed == [entry.driver]
+        assert pool.stats() == {}
+
+    def test_invalid_idle_driver_is_replaced(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, validate=lambda driver: driver != f"{KEY}-0")
+
+        pool.checkin(pool.checkout(KEY))
+        entry = pool.checkout(KEY)
+
+        assert entry.driver == f"{KEY}-1"
+        assert factory.destroyed == [f"{KEY}-0"]
+        assert pool.pool_stats.invalid_discards == 1
+
+    def test_full_pool_times_out(self):
+        pool = make_pool(FakeFactory(), max_size=1, checkout_timeout=0.05)
+        pool.checkout(KEY)
+
+        with pytest.raises(DriverException):
+            pool.checkout(KEY)
+
+    def test_full_pool_waits_for_checkin(self):
+        pool = make_pool(FakeFactory(), max_size=1, checkout_timeout=5)
+        entry = pool.checkout(KEY)
+        threading.Timer(0.05, pool.checkin, args=(entry,)).start()
+
+        assert pool.checkout(KEY) is entry
+
+    def test_closed_pool_refuses_checkout(self):
+        factory = FakeFactory()
+        pool = make_pool(factory)
+        pool.checkin(pool.checkout(KEY))
+        pool.close()
+
+        assert factory.destroyed == [f"{KEY}-0"]
+        with pytest.raises(DriverException):
+            pool.checkout(KEY)
+
+
+class TestExpiry:
+    """Idle drivers above the minimum are quit after idle_timeout"""
+
+    def test_expired_drivers_above_minimum_are_quit(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, min_size=1, idle_timeout=0)
+        first = pool.checkout(KEY)
+        second = pool.checkout(KEY)
+        pool.checkin(first)
+        pool.checkin(second)
+        time.sleep(0.01)
+
+        entry = pool.checkout(KEY)
+
+        # The oldest idle driver expires, the minimum one is kept and handed out
+        assert factory.destroyed == [first.driver]
+        assert entry is second
+        assert pool.stats()[KEY]["total"] == 1
+
+
+class TestPrefetch:
+    """Background launches only when no returning driver will serve the next checkout"""
+
+    def test_no_prefetch_while_checked_out_driver_will_return(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, prefetch_depth=1)
+
+        entry = pool.checkout(KEY)
+        wait_for_launches(pool)
+        pool.checkin(entry)
+        pool.close()
+
+        assert factory.created == [entry.driver]
+        assert pool.pool_stats.prefetched == 0
+        assert pool.pool_stats.unused_prefetches == 0
+
+    def test_prefetch_replaces_discarded_driver(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, prefetch_depth=1)
+
+        pool.discard(pool.checkout(KEY))
+        pool.replenish(KEY)
+        wait_for_launches(pool)
+        entry = pool.checkout(KEY)
+
+        assert entry.prefetched
+        assert pool.pool_stats.prefetched == 1
+        assert (pool.pool_stats.misses, pool.pool_stats.prefetch_hits) == (1, 1)
+
+    def test_prefetch_without_reuse(self):
+        factory = FakeFactory()
+        pool = make_pool(factory, reuse=False, prefetch_depth=1)
+
+        pool.checkin(pool.checkout(KEY))
+        wait_for_launches(pool)
+        entry = pool.checkout(KEY)
+
+        assert entry.prefetched
+        assert pool.pool_stats.prefetch_hits == 1
+
+    def test_waiting_for_launch_counts_as_prefetch_wait(self):
+        factory = FakeFactory(delay=0.1)
+        pool = make_pool(factory, reuse=False, prefetch_depth=1)
+
+        pool.checkin(pool.checkout(KEY))
+        entry = pool.checkout(KEY)
+
+        assert entry.prefetched
+        assert pool.pool_stats.prefetch_waits == 1
+        assert pool.pool_stats.prefetch_wait_seconds > 0
+
+    def test_returned_driver_won_while_waiting_counts_as_reuse(self):
+        factory = FakeFactory(delay=0.3)
+        pool = make_pool(factory, prefetch_depth=2)
+
+        # A launch is under way when the next checkout starts, the returned driver arrives first
+        first = pool.checkout(KEY)
+        threading.Timer(0.05, pool.checkin, args=(first,)).start()
+        entry = pool.checkout(KEY)
+        wait_for_launches(pool)
+
+        assert entry is first
+        assert pool.pool_stats.reuse_hits == 1
+        assert pool.pool_stats.prefetch_waits == 0
+
+    def test_shared_stats_accumulate_across_pools(self):
+        stats = PoolStats()
+        for _ in range(2):
+            pool = make_pool(FakeFactory(), stats=stats)
+            pool.checkout(KEY)
+
+        assert stats.as_dict()["checkouts"] == 2
+        assert stats.misses == 2
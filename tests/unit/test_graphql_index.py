@@ -0,0 +1,83 @@
+"""
+Unit tests for indexing captured GraphQL exchanges
+"""
+
+import json
+import threading
+
+import pytest
+
+from core.exceptions.framework_exceptions import TimeoutException
+from core.graphql_index import GraphQLIndex
+
+GQL_URL = "https://gql.twitch.tv/gql"
+
+
+def operation(name, **variables):
+    return {"operationName": name, "variables": variables, "extensions": {}}
+
+
+def add(index, payload, result, status_code=200):
+    index.add_exchange(GQL_URL, json.dumps(payload).encode("utf-8"), status_code, json.dumps(result).encode("utf-8"))
+
+
+class TestAddExchange:
+    """Payloads are split into one exchange per operation"""
+
+    def test_single_operation(self):
+        index = GraphQLIndex()
+        add(index, operation("SearchResultsPage", query="starcraft"), {"data": {"searchFor": {}}})
+
+        exchange = index.find("SearchResultsPage")
+        assert exchange.variables == {"query": "starcraft"}
+        assert exchange.data == {"searchFor": {}}
+        assert exchange.errors == []
+        assert (exchange.status_code, exchange.url) == (200, GQL_URL)
+
+    def test_batch_is_split_in_order(self):
+        index = GraphQLIndex()
+        add(
+            index,
+            [operation("First"), operation("Second"), "not an operation", operation("Third")],
+            [{"data": 1}, {"errors": [{"message": "failed"}]}, {"data": 2}],
+        )
+
+        assert index.find("First").data == 1
+        assert index.find("Second").errors == [{"message": "failed"}]
+        # Results stay aligned with payload positions; missing results are None
+        assert index.find("Third").response is None
+        assert [exchange.operation_name for exchange in index.exchanges()] == ["First", "Second", "Third"]
+
+    def test_invalid_json_is_ignored(self):
+        index = GraphQLIndex()
+        index.add_exchange(GQL_URL, b"{not json", 200, b"{}")
+        index.add_exchange(GQL_URL, json.dumps(operation("Query")).encode("utf-8"), 502, b"<html>Bad Gateway</html>")
+
+        assert index.exchanges() == []
+
+    def test_find_returns_latest_match(self):
+        index = GraphQLIndex()
+        for page in range(3):
+            add(index, operation("Directory", page=page), {"data": page})
+
+        assert index.find("Directory").data == 2
+        assert index.find("Directory", lambda exchange: exchange.variables["page"] == 0).data == 0
+        assert index.find("Missing") is None
+
+    def test_is_graphql_url(self):
+        assert GraphQLIndex.is_graphql_url(GQL_URL)
+        assert not GraphQLIndex.is_graphql_url("https://m.twitch.tv/search")
+
+
+class TestWaitFor:
+    """Waits return as soon as a matching exchange arrives"""
+
+    def test_exchange_arriving_during_wait(self):
+        index = GraphQLIndex()
+        threading.Timer(0.05, add, args=(index, operation("Query"), {"data": True})).start()
+
+        assert index.wait_for("Query", timeout=2).data is True
+
+    def test_timeout(self):
+        with pytest.raises(TimeoutException):
+            GraphQLIndex().wait_for("Query", timeout=0.05)
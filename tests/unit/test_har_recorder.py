@@ -0,0 +1,113 @@
+"""
+Unit tests for the streamed HAR export
+"""
+
+import gzip
+import json
+import time
+
+from seleniumwire.request import Request, Response
+
+from core.har_recorder import HarRecorder, HarWriter
+
+GQL_URL = "https://gql.twitch.tv/gql?client=web"
+
+
+def make_exchange(body=b'{"data": {}}', payload=b'{"operationName": "Q"}'):
+    request = Request(method="POST", url=GQL_URL, headers=[("Content-Type", "application/json")], body=payload)
+    compressed = gzip.compress(body)
+    response = Response(
+        status_code=200,
+        reason="OK",
+        headers=[("Content-Type", "application/json"), ("Content-Encoding", "gzip")],
+        body=compressed,
+    )
+    return request, response
+
+
+class TestHarWriter:
+    """Files written entry by entry are valid HAR"""
+
+    def test_empty_file_is_valid(self, tmp_path):
+        writer = HarWriter(str(tmp_path / "har" / "empty.har"))
+        writer.close()
+
+        with open(writer.path, encoding="utf-8") as f:
+            har = json.load(f)
+        assert har["log"]["entries"] == []
+        assert har["log"]["version"]
+
+    def test_entries_are_written_in_order(self, tmp_path):
+        writer = HarWriter(str(tmp_path / "test.har"))
+        for index in range(3):
+            writer.write_entry({"index": index, "text": "ümlaut"})
+        writer.close()
+        writer.write_entry({"index": 3})
+
+        with open(writer.path, encoding="utf-8") as f:
+            har = json.load(f)
+        assert [entry["index"] for entry in har["log"]["entries"]] == [0, 1, 2]
+        assert writer.entries == 3
+
+
+class TestHarRecorder:
+    """Recorded selenium-wire exchanges become HAR entries"""
+
+    def test_wire_exchange(self, tmp_path):
+        recorder = HarRecorder(max_text_kb=64)
+        recorder.start(str(tmp_path / "test.har"))
+        request, response = make_exchange()
+        recorder._on_wire_request(request)
+        recorder._on_wire_response(request, response)
+        path = recorder.stop()
+
+        with open(path, encoding="utf-8") as f:
+            entries = json.load(f)["log"]["entries"]
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry["request"]["postData"]["text"] == '{"operationName": "Q"}'
+        assert entry["request"]["queryString"] == [{"name": "client", "value": "web"}]
+        assert entry["response"]["content"]["text"] == '{"data": {}}'
+        assert entry["response"]["bodySize"] == len(response.body)
+        assert entry["_phaseTimings"] is False
+
+    def test_concurrent_posts_keep_their_own_durations(self, tmp_path):
+        recorder = HarRecorder()
+        recorder.start(str(tmp_path / "test.har"))
+        slow = make_exchange(payload=b'{"operationName": "Slow"}')
+        fast = make_exchange(payload=b'{"operationName": "Fast"}')
+        recorder._on_wire_request(slow[0])
+        time.sleep(0.2)
+        recorder._on_wire_request(fast[0])
+        # The later request completes first
+        recorder._on_wire_response(*fast)
+        recorder._on_wire_response(*slow)
+
+        with open(recorder.stop(), encoding="utf-8") as f:
+            entries = json.load(f)["log"]["entries"]
+        durations = {json.loads(entry["request"]["postData"]["text"])["operationName"]: entry["time"] for entry in entries}
+        assert durations["Fast"] < 100
+        assert durations["Slow"] >= 200
+
+    def test_requests_started_before_recording_are_skipped(self, tmp_path):
+        recorder = HarRecorder()
+        request, response = make_exchange()
+        recorder._on_wire_request(request)
+        recorder.start(str(tmp_path / "test.har"))
+        recorder._on_wire_response(request, response)
+
+        with open(recorder.stop(), encoding="utf-8") as f:
+            assert json.load(f)["log"]["entries"] == []
+
+    def test_listener_without_har_file(self):
+        recorder = HarRecorder()
+        entries = []
+        recorder.add_listener(entries.append)
+        request, response = make_exchange()
+        recorder._on_wire_request(request)
+        recorder._on_wire_response(request, response)
+        recorder.remove_listener(entries.append)
+
+        assert len(entries) == 1
+        assert recorder.stop() is None
+        assert not recorder.recording
@@ -0,0 +1,129 @@
+"""
+Unit tests for the adaptive ordering of fallback locators
+"""
+
+import pytest
+
+from config.constants import LocatorStatsConstants
+from core.locator_stats import LocatorStats
+
+PAGE = "TwitchSearchPage"
+LOCATORS = [("css selector", "input[type=search]"), ("xpath", "//input"), ("css selector", "input")]
+
+
+def new_entry():
+    return {"page": PAGE, "locators": [list(locator) for locator in LOCATORS], "waits": 0, "misses": 0,
+            "wins": {}, "win_ms": {}, "scores": {}}
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store_file = tmp_path / "locator_stats.json"
+    monkeypatch.setenv("LOCATOR_STATS_FILE", str(store_file))
+    LocatorStats.reset()
+    yield store_file
+    LocatorStats.reset()
+
+
+def record_and_reload(outcomes, matched=None):
+    for winner in outcomes:
+        LocatorStats.record(PAGE, LOCATORS, winner, 0.1, matched=matched)
+    LocatorStats.flush()
+    LocatorStats.reset()
+
+
+class TestApply:
+    """Every wait decays older scores and credits the winner"""
+
+    def test_win_and_miss(self):
+        entry = new_entry()
+        LocatorStats._apply(entry, 1, 120.0)
+        LocatorStats._apply(entry, None, 5000.0)
+
+        assert (entry["waits"], entry["misses"]) == (2, 1)
+        assert entry["wins"] == {"1": 1}
+        assert entry["win_ms"] == {"1": 120.0}
+        assert entry["scores"] == {"1": LocatorStatsConstants.SCORE_DECAY}
+
+    def test_every_matching_locator_is_credited(self):
+        entry = new_entry()
+        LocatorStats._apply(entry, 2, 40.0, [0, 2])
+
+        assert entry["wins"] == {"2": 1}
+        assert entry["matches"] == {"0": 1, "2": 1}
+        assert entry["scores"] == {"0": 1, "2": 1}
+        assert entry["last_matched"] == [0, 2]
+
+    def test_recent_wins_outweigh_older_ones(self):
+        entry = new_entry()
+        for winner in [0, 0, 0, 2, 2, 2, 2]:
+            LocatorStats._apply(entry, winner, 10.0)
+
+        assert entry["wins"] == {"0": 3, "2": 4}
+        assert entry["scores"]["2"] > entry["scores"]["0"]
+
+
+class TestOrder:
+    """Lists are reordered by score once they have enough history"""
+
+    def test_declared_order_without_history(self, store):
+        assert LocatorStats.order(PAGE, LOCATORS) == [0, 1, 2]
+
+    def test_duplicates_are_dropped(self, store):
+        assert LocatorStats.order(PAGE, LOCATORS + [LOCATORS[0]]) == [0, 1, 2]
+
+    def test_declared_order_below_min_samples(self, store):
+        record_and_reload([2] * (LocatorStatsConstants.MIN_SAMPLES - 1))
+
+        assert LocatorStats.order(PAGE, LOCATORS) == [0, 1, 2]
+
+    def test_winner_first_after_min_samples(self, store):
+        record_and_reload([2] * LocatorStatsConstants.MIN_SAMPLES)
+
+        assert LocatorStats.order(PAGE, LOCATORS) == [2, 0, 1]
+
+    def test_recovered_primary_regains_first_place(self, store):
+        record_and_reload([2] * LocatorStatsConstants.MIN_SAMPLES)
+        assert LocatorStats.order(PAGE, LOCATORS) == [2, 0, 1]
+
+        # The fallback is tried first and wins, but the primary matched as well
+        record_and_reload([2], matched=[0, 2])
+
+        assert LocatorStats.order(PAGE, LOCATORS) == [0, 1, 2]
+
+    def test_other_pages_keep_their_own_history(self, store):
+        record_and_reload([2] * LocatorStatsConstants.MIN_SAMPLES)
+
+        assert LocatorStats.order("TwitchStreamerPage", LOCATORS) == [0, 1, 2]
+
+
+class TestStore:
+    """Records are merged into the on-disk store"""
+
+    def test_flush_merges_runs(self, store):
+        record_and_reload([1, 1])
+        record_and_reload([1, None])
+
+        entry = LocatorStats._read_store(str(store))[LocatorStats.key(PAGE, LOCATORS)]
+        assert (entry["waits"], entry["misses"], entry["wins"]) == (4, 1, {"1": 3})
+
+    def test_flush_without_records_writes_nothing(self, store):
+        assert LocatorStats.flush() is None
+        assert not store.exists()
+
+    def test_outdated_store_is_ignored(self, store):
+        store.write_text('{"version": 0, "entries": {"key": {}}}', encoding="utf-8")
+
+        assert LocatorStats._read_store(str(store)) == {}
+
+    def test_summary_ignores_primary_matching_behind_a_fallback(self, store):
+        record_and_reload([2] * LocatorStatsConstants.MIN_SAMPLES, matched=[0, 2])
+
+        assert LocatorStats.summarize() == []
+
+    def test_summary_reports_primary_that_never_matches(self, store):
+        record_and_reload([2] * LocatorStatsConstants.MIN_SAMPLES)
+
+        lines = LocatorStats.summarize()
+        assert len(lines) == 2
+        assert "never matched" in lines[1]
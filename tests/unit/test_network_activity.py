@@ -0,0 +1,51 @@
+"""
+Unit tests for in-flight request tracking
+"""
+
+import threading
+import time
+
+from core.network_activity import NetworkActivityTracker
+
+URL = "https://gql.twitch.tv/gql"
+
+
+class TestNetworkActivityTracker:
+    """Idle waits follow request starts and finishes"""
+
+    def test_idle_when_nothing_in_flight(self):
+        tracker = NetworkActivityTracker()
+        assert tracker.wait_for_idle(timeout=1, idle_time=0.01)
+
+    def test_finish_wakes_up_waiter(self):
+        tracker = NetworkActivityTracker()
+        tracker.request_started("a", URL)
+        threading.Timer(0.05, tracker.request_finished, args=("a",)).start()
+
+        start_time = time.monotonic()
+        assert tracker.wait_for_idle(timeout=2, idle_time=0.01)
+        assert time.monotonic() - start_time < 1
+        assert (tracker.started, tracker.finished, tracker.in_flight) == (1, 1, 0)
+
+    def test_ignored_urls_never_block(self):
+        tracker = NetworkActivityTracker(ignored_url_patterns=[r"\.ttvnw\.net/"])
+        tracker.request_started("segment", "https://video-edge.abc.ttvnw.net/v1/segment/1.ts")
+        assert tracker.in_flight == 0
+        assert tracker.ignored == 1
+
+    def test_unfinished_request_expires_within_the_wait(self):
+        # A failed selenium-wire request is never finished; it must not block the whole wait
+        tracker = NetworkActivityTracker(stale_after=60)
+        tracker.request_started("failed", URL)
+
+        start_time = time.monotonic()
+        assert tracker.wait_for_idle(timeout=0.4, idle_time=0.01)
+        assert time.monotonic() - start_time < 0.4
+        assert tracker.in_flight == 0
+
+    def test_late_finish_of_expired_request_is_ignored(self):
+        tracker = NetworkActivityTracker(stale_after=0.01)
+        tracker.request_started("slow", URL)
+        assert tracker.wait_for_idle(timeout=1, idle_time=0.01)
+        tracker.request_finished("slow")
+        assert (tracker.finished, tracker.in_flight) == (0, 0)
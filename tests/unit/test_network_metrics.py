@@ -0,0 +1,102 @@
+"""
+Unit tests for per-test network timing aggregates
+"""
+
+import json
+
+from core.network_metrics import NetworkMetrics
+
+GQL_URL = "https://gql.twitch.tv/gql"
+
+
+def entry(url, total, timings=None, status=200, body_size=1000, content_size=4000, post_data=None, phases=True):
+    har_entry = {
+        "time": total,
+        "request": {"method": "POST" if post_data is not None else "GET", "url": url},
+        "response": {"status": status, "bodySize": body_size, "content": {"size": content_size}},
+        "timings": timings or {"wait": total},
+    }
+    if post_data is not None:
+        har_entry["request"]["postData"] = {"text": json.dumps(post_data)}
+    if not phases:
+        har_entry["_phaseTimings"] = False
+    return har_entry
+
+
+class TestAddEntry:
+    """Entries are split into phases, hosts and GraphQL operations"""
+
+    def test_phases_of_new_connection(self):
+        metrics = NetworkMetrics()
+        metrics.add_entry(
+            entry(
+                "https://m.twitch.tv/",
+                120,
+                {"dns": 10, "connect": 50, "ssl": 30, "send": 1, "wait": 40, "receive": 19},
+            )
+        )
+
+        timings = metrics.summary()["timings_ms"]
+        # HAR connect includes the TLS handshake
+        assert timings["connect"]["max"] == 20
+        assert timings["tls"]["max"] == 30
+        assert timings["ttfb"]["max"] == 40
+        assert timings["download"]["max"] == 19
+
+    def test_reused_connection_skips_connection_phases(self):
+        metrics = NetworkMetrics()
+        metrics.add_entry(
+            entry("https://m.twitch.tv/", 50, {"dns": -1, "connect": -1, "ssl": -1, "wait": 45, "receive": 5})
+        )
+
+        timings = metrics.summary()["timings_ms"]
+        assert "dns" not in timings and "connect" not in timings and "tls" not in timings
+        assert timings["total"]["count"] == 1
+
+    def test_wire_entries_contribute_total_only(self):
+        metrics = NetworkMetrics()
+        metrics.add_entry(entry("https://m.twitch.tv/", 80, phases=False))
+
+        assert set(metrics.summary()["timings_ms"]) == {"total"}
+        assert metrics.summary()["hosts"]["m.twitch.tv"]["ttfb_ms"] == {"count": 0}
+
+    def test_failed_requests_and_sizes(self):
+        metrics = NetworkMetrics()
+        metrics.add_entry(entry("https://m.twitch.tv/", 10))
+        metrics.add_entry(entry("https://m.twitch.tv/", 10, status=0, body_size=-1, content_size=0))
+
+        summary = metrics.summary()
+        assert (summary["requests"], summary["failed"]) == (2, 1)
+        assert (summary["transfer_bytes"], summary["content_bytes"]) == (1000, 4000)
+
+    def test_graphql_batch_counts_every_operation(self):
+        metrics = NetworkMetrics()
+        metrics.add_entry(entry(GQL_URL, 30, post_data=[{"operationName": "First"}, {"operationName": "Second"}]))
+        metrics.add_entry(entry(GQL_URL, 50, post_data={"operationName": "First"}))
+
+        graphql = metrics.summary()["graphql_ms"]
+        assert graphql["First"] == {"count": 2, "p50": 40.0, "p95": 49.0, "max": 50}
+        assert graphql["Second"]["count"] == 1
+
+
+class TestSummary:
+    """The summary lists the busiest hosts and sums the rest"""
+
+    def test_hosts_beyond_limit_are_summed(self):
+        metrics = NetworkMetrics(max_hosts=1)
+        for _ in range(3):
+            metrics.add_entry(entry("https://static.twitchcdn.net/a.js", 10))
+        metrics.add_entry(entry("https://gql.twitch.tv/gql", 20))
+        metrics.add_entry(entry("https://m.twitch.tv/", 30))
+
+        hosts = metrics.summary()["hosts"]
+        assert list(hosts) == ["static.twitchcdn.net", "other"]
+        assert hosts["static.twitchcdn.net"]["requests"] == 3
+        assert (hosts["other"]["hosts"], hosts["other"]["requests"]) == (2, 2)
+        assert hosts["other"]["total_ms"]["max"] == 30
+
+    def test_empty_summary_is_serializable(self):
+        summary = NetworkMetrics().summary()
+
+        assert json.loads(json.dumps(summary))["requests"] == 0
+        assert summary["timings_ms"] == {}
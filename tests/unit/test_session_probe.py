@@ -0,0 +1,98 @@
+"""
+Unit tests for WebDriver session liveness probes
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.constants import SessionProbeConstants
+from core.session_probe import SessionProbe
+
+
+class FakeChromedriver(BaseHTTPRequestHandler):
+    """Answers the window handle command with the configured status and body"""
+
+    status = 200
+    body = {"value": "CDwindow-1"}
+    delay = 0
+    requests = 0
+
+    def do_GET(self):
+        FakeChromedriver.requests += 1
+        time.sleep(self.delay)
+        data = json.dumps(self.body).encode("utf-8")
+        self.send_response(self.status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeExecutor:
+    def __init__(self, url):
+        self._url = url
+
+
+class FakeDriver:
+    def __init__(self, url):
+        self.command_executor = FakeExecutor(url)
+        self.session_id = "0123456789abcdef"
+
+
+@pytest.fixture
+def chromedriver(monkeypatch):
+    # A proxy from the environment would answer for chromedriver, or not at all
+    monkeypatch.setenv("HTTP_PROXY", "http://127.0.0.1:9")
+    monkeypatch.setenv("http_proxy", "http://127.0.0.1:9")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    monkeypatch.setattr(FakeChromedriver, "requests", 0)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeChromedriver)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def driver_for(server):
+    return FakeDriver(f"http://127.0.0.1:{server.server_port}")
+
+
+class TestSessionProbe:
+    """Probes reach chromedriver directly, ignoring proxy settings"""
+
+    def test_live_session(self, chromedriver):
+        assert SessionProbe.check(driver_for(chromedriver)) is None
+
+    def test_dead_session(self, chromedriver, monkeypatch):
+        monkeypatch.setattr(FakeChromedriver, "status", 404)
+        monkeypatch.setattr(
+            FakeChromedriver, "body", {"value": {"error": "invalid session id", "message": "invalid session id\nstack"}}
+        )
+
+        assert SessionProbe.check(driver_for(chromedriver)) == "invalid session id: invalid session id"
+
+    def test_missing_element_error_is_not_dead(self, chromedriver, monkeypatch):
+        monkeypatch.setattr(FakeChromedriver, "status", 404)
+        monkeypatch.setattr(FakeChromedriver, "body", {"value": {"error": "no such element", "message": "no such element"}})
+
+        assert SessionProbe.check(driver_for(chromedriver)) is None
+
+    def test_unreachable_chromedriver(self):
+        assert SessionProbe.check(FakeDriver("http://127.0.0.1:9")).startswith("chromedriver unreachable")
+
+    def test_slow_chromedriver_is_not_dead(self, chromedriver, monkeypatch):
+        monkeypatch.setattr(SessionProbeConstants, "PROBE_TIMEOUT", 0.1)
+        monkeypatch.setattr(FakeChromedriver, "delay", 0.3)
+
+        assert SessionProbe.check(driver_for(chromedriver)) is None
+        assert FakeChromedriver.requests == SessionProbeConstants.PROBE_ATTEMPTS
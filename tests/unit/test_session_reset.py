@@ -0,0 +1,144 @@
+"""
+Unit tests for clearing every origin a reused session visited
+"""
+
+import json
+
+import pytest
+from seleniumwire.request import Request
+
+from config.constants import SessionResetConstants
+from core.cdp_network import CdpNetworkCapture
+from core.exceptions.framework_exceptions import SessionResetException
+from core.session_reset import SessionReset
+from core.visited_origins import VisitedOrigins
+
+BASE_URL = "https://m.twitch.tv"
+
+
+class FakeSwitchTo:
+    def window(self, handle):
+        pass
+
+
+class FakeDriver:
+    """Single-window driver whose only open frame is the blank page, recording DevTools commands"""
+
+    def __init__(self, leaked_databases=None):
+        self.window_handles = ["main"]
+        self.switch_to = FakeSwitchTo()
+        self.current_url = "https://www.twitch.tv/"
+        self.commands = []
+        self.leaked_databases = leaked_databases or {}
+
+    def get(self, url):
+        self.current_url = url
+
+    def execute_script(self, script):
+        pass
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        if cmd == "Page.getFrameTree":
+            return {"frameTree": {"frame": {"securityOrigin": "://"}}}
+        if cmd == "IndexedDB.requestDatabaseNames":
+            return {"databaseNames": self.leaked_databases.get(params["securityOrigin"], [])}
+        return {}
+
+    def cleared_origins(self):
+        return {params["origin"] for cmd, params in self.commands if cmd == "Storage.clearDataForOrigin"}
+
+    def verified_origins(self):
+        return {params["securityOrigin"] for cmd, params in self.commands if cmd == "IndexedDB.requestDatabaseNames"}
+
+
+class FakeChain:
+    def __init__(self):
+        self.hooks = []
+
+    def add_request_hook(self, hook):
+        self.hooks.append(hook)
+
+
+def document_request(url, destination):
+    return Request(method="GET", url=url, headers=[("Sec-Fetch-Dest", destination)], body=b"")
+
+
+class TestVisitedOrigins:
+    """Document loads are collected as origins"""
+
+    def test_wire_hook_records_documents_only(self, monkeypatch):
+        chain = FakeChain()
+        monkeypatch.setattr("core.visited_origins.InterceptorChain.install", lambda driver: chain)
+        driver = FakeDriver()
+        visited = VisitedOrigins.attach_to_wire_driver(driver)
+
+        for url, destination in [
+            ("https://www.twitch.tv/directory", "document"),
+            ("https://embed.example.com:8443/player", "iframe"),
+            ("https://static.twitchcdn.net/app.js", "script"),
+        ]:
+            chain.hooks[0](document_request(url, destination))
+
+        assert driver.visited_origins is visited
+        assert visited.take() == {"https://www.twitch.tv", "https://embed.example.com:8443"}
+        assert visited.take() == set()
+
+    def test_cdp_capture_records_document_requests(self):
+        events = [
+            ("1", "https://www.twitch.tv/directory", "Document"),
+            ("2", "https://gql.twitch.tv/gql", "Fetch"),
+            ("3", "data:text/html,frame", "Document"),
+        ]
+
+        class LogDriver:
+            def get_log(self, log_type):
+                return [
+                    {
+                        "message": json.dumps(
+                            {
+                                "message": {
+                                    "method": "Network.requestWillBeSent",
+                                    "params": {"requestId": request_id, "request": {"url": url}, "type": resource_type},
+                                }
+                            }
+                        )
+                    }
+                    for request_id, url, resource_type in events
+                ]
+
+        capture = CdpNetworkCapture(LogDriver())
+
+        assert capture.origins.take() == {"https://www.twitch.tv"}
+
+
+class TestReset:
+    """Storage is cleared and verified for every visited origin"""
+
+    def test_origins_navigated_away_from_are_cleared_and_verified(self):
+        driver = FakeDriver()
+        driver.visited_origins = VisitedOrigins()
+        driver.visited_origins.add("https://www.twitch.tv/directory")
+        driver.visited_origins.add("https://clips.twitch.tv/clip")
+
+        SessionReset.reset(driver, extra_origins=[BASE_URL], verify=True)
+
+        expected = {BASE_URL, "https://www.twitch.tv", "https://clips.twitch.tv"}
+        assert driver.cleared_origins() == expected
+        assert driver.verified_origins() == expected
+        assert driver.current_url == SessionResetConstants.BLANK_URL
+
+    def test_leak_on_visited_origin_fails_verification(self):
+        driver = FakeDriver(leaked_databases={"https://www.twitch.tv": ["cache"]})
+        driver.visited_origins = VisitedOrigins()
+        driver.visited_origins.add("https://www.twitch.tv/")
+
+        with pytest.raises(SessionResetException):
+            SessionReset.reset(driver, extra_origins=[BASE_URL], verify=True)
+
+    def test_driver_without_capture_clears_extra_origins(self):
+        driver = FakeDriver()
+
+        SessionReset.reset(driver, extra_origins=[BASE_URL], verify=True)
+
+        assert driver.cleared_origins() == {BASE_URL}
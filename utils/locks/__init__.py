@@ -0,0 +1 @@
+# Lock utilities
@@ -0,0 +1,93 @@
+"""
+Cross-process file lock shared by parallel test workers
+"""
+
+import os
+import time
+from typing import Optional
+
+from core.exceptions.framework_exceptions import TimeoutException
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Exclusive lock backed by a lock file, usable across xdist worker processes
+
+    Example:
+        with FileLock("/tmp/resource.lock", timeout=60):
+            # Only one process at a time runs this block
+            update_shared_resource()
+    """
+
+    def __init__(self, path: str, timeout: Optional[float] = None, poll_interval: float = 0.1):
+        """Initialize the lock
+
+        Args:
+            path: Path of the lock file (created if missing)
+            timeout: Maximum seconds to wait for the lock (None waits forever)
+            poll_interval: Seconds between acquisition attempts
+        """
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> None:
+        """Acquire the lock, waiting up to the configured timeout
+
+        Raises:
+            TimeoutException: If the lock could not be acquired in time
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        start_time = time.monotonic()
+
+        while True:
+            try:
+                self._lock_fd(fd)
+                self._fd = fd
+                return
+            except OSError:
+                if self.timeout is not None and time.monotonic() - start_time >= self.timeout:
+                    os.close(fd)
+                    raise TimeoutException(f"acquire file lock {self.path}", self.timeout)
+                time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        """Release the lock if it is held"""
+        if self._fd is None:
+            return
+
+        try:
+            self._unlock_fd(self._fd)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+    @staticmethod
+    def _lock_fd(fd: int) -> None:
+        """Try to lock a file descriptor without blocking (raises OSError if held elsewhere)"""
+        if os.name == "nt":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    @staticmethod
+    def _unlock_fd(fd: int) -> None:
+        """Unlock a file descriptor locked by _lock_fd"""
+        if os.name == "nt":
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_UN)
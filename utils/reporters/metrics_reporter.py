@@ -0,0 +1,261 @@
+"""
+Session metrics reporting across parallel workers
+"""
+
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+from config.constants import DriverTimingConstants
+
+
+class MetricsReporter:
+    """Collects framework metrics per worker and summarizes them at session end
+
+    Each worker exports a JSON-serializable snapshot of its metrics. Under
+    pytest-xdist the snapshots travel to the controller through the worker output
+    channel, where they are merged and printed once for the whole run.
+    """
+
+    @classmethod
+    def export(cls) -> Dict[str, Any]:
+        """Export this worker's metrics
+
+        Returns:
+            Dict[str, Any]: JSON-serializable metrics snapshot
+        """
+        from core.asset_cache import AssetCache
+        from core.driver_manager import DriverManager
+
+        return {
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+            "pool": DriverManager.get_prefetch_stats(),
+            "startup": DriverManager.get_startup_timings(),
+            "health": DriverManager.get_recycle_stats(),
+            "capture": DriverManager.get_capture_totals(),
+            "asset_cache": AssetCache.get_totals(),
+        }
+
+    @classmethod
+    def summarize(cls, exports: List[Dict[str, Any]]) -> List[str]:
+        """Build human-readable summary lines from worker snapshots
+
+        Args:
+            exports: Metrics snapshots from one or more workers
+
+        Returns:
+            List[str]: Summary lines ready to print
+        """
+        lines = []
+        lines.extend(cls._summarize_pool([export.get("pool", {}) for export in exports]))
+        lines.extend(cls._summarize_startup([export.get("startup", {}) for export in exports]))
+        lines.extend(cls._summarize_launch_profiles([export.get("startup", {}) for export in exports]))
+        lines.extend(cls._summarize_health([export.get("health", {}) for export in exports]))
+        lines.extend(cls._summarize_lock_waits([export.get("startup", {}) for export in exports]))
+        lines.extend(cls._summarize_capture([export.get("capture", {}) for export in exports]))
+        lines.extend(cls._summarize_asset_cache([export.get("asset_cache", {}) for export in exports]))
+        return lines
+
+    @classmethod
+    def write_startup_records(cls, exports: List[Dict[str, Any]], report_dir: str) -> Optional[str]:
+        """Write every worker's driver startup records to a JSON file
+
+        Args:
+            exports: Metrics snapshots from one or more workers
+            report_dir: Report directory the metrics folder is created in
+
+        Returns:
+            Optional[str]: Path of the written file, or None if no driver was started
+        """
+        workers = {
+            export.get("worker", "main"): export.get("startup", {})
+            for export in exports
+            if export.get("startup", {}).get("records")
+        }
+        if not workers:
+            return None
+
+        metrics_dir = os.path.join(report_dir, DriverTimingConstants.METRICS_DIR)
+        os.makedirs(metrics_dir, exist_ok=True)
+        path = os.path.join(metrics_dir, DriverTimingConstants.STARTUP_RECORDS_FILE)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"workers": workers}, f, indent=2)
+        return path
+
+    @staticmethod
+    def percentile(values: List[float], percent: float) -> float:
+        """Get a percentile of values using linear interpolation between closest ranks"""
+        if not values:
+            return 0.0
+        ordered = sorted(values)
+        rank = (len(ordered) - 1) * percent / 100.0
+        lower = int(rank)
+        upper = min(lower + 1, len(ordered) - 1)
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+    @classmethod
+    def _summarize_pool(cls, pool_stats: List[Dict[str, float]]) -> List[str]:
+        """Summarize driver checkout outcomes and prefetch hit/miss rates"""
+        totals: Dict[str, float] = {}
+        for stats in pool_stats:
+            for name, value in stats.items():
+                totals[name] = totals.get(name, 0) + value
+
+        checkouts = int(totals.get("checkouts", 0))
+        if not checkouts:
+            return []
+
+        # Only checkouts that needed a new driver say anything about prefetching
+        launches = int(totals.get("prefetch_hits", 0) + totals.get("prefetch_waits", 0) + totals.get("misses", 0))
+        hit_rate = 100.0 * totals.get("prefetch_hits", 0) / launches if launches else 100.0
+
+        return [
+            f"🚗 Driver checkouts: {checkouts} "
+            f"(reused: {int(totals.get('reuse_hits', 0))}, "
+            f"prefetch hits: {int(totals.get('prefetch_hits', 0))}, "
+            f"prefetch waits: {int(totals.get('prefetch_waits', 0))}, "
+            f"misses: {int(totals.get('misses', 0))})",
+            f"⚡ Prefetch hit rate: {hit_rate:.0f}% of new drivers "
+            f"(waited {totals.get('prefetch_wait_seconds', 0):.1f}s in total, "
+            f"{int(totals.get('prefetched', 0))} prefetched, "
+            f"{int(totals.get('unused_prefetches', 0))} unused, "
+            f"{int(totals.get('prefetch_failures', 0))} failed)",
+        ]
+
+    @classmethod
+    def _summarize_startup(cls, startups: List[Dict[str, list]]) -> List[str]:
+        """Summarize driver startup time per phase as p50/p95"""
+        from core.driver_timing import DriverStartupMetrics
+
+        records = [record for startup in startups for record in startup.get("records", [])]
+        checkouts = [seconds for startup in startups for seconds in startup.get("checkout_seconds", [])]
+        if not records:
+            return []
+
+        lines = [f"⏱️  Driver startup p50/p95 over {len(records)} launches:"]
+        for phase in DriverStartupMetrics.ordered_phases(records):
+            values = [record["phases"][phase] for record in records if phase in record["phases"]]
+            lines.append(
+                f"   {phase:<22} {cls.percentile(values, 50):6.2f}s / {cls.percentile(values, 95):6.2f}s"
+            )
+
+        totals = [record["total"] for record in records]
+        lines.append(f"   {'total':<22} {cls.percentile(totals, 50):6.2f}s / {cls.percentile(totals, 95):6.2f}s")
+        if checkouts:
+            lines.append(
+                f"   {'test wait for driver':<22} "
+                f"{cls.percentile(checkouts, 50):6.2f}s / {cls.percentile(checkouts, 95):6.2f}s"
+            )
+        return lines
+
+    @classmethod
+    def _summarize_launch_profiles(cls, startups: List[Dict[str, Any]]) -> List[str]:
+        """Summarize startup time and memory footprint per launch profile"""
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        samples: Dict[str, List[float]] = {}
+        for startup in startups:
+            for record in startup.get("records", []):
+                if record.get("launch_profile"):
+                    records.setdefault(record["launch_profile"], []).append(record)
+            for profile, values in startup.get("memory_samples", {}).items():
+                samples.setdefault(profile, []).extend(values)
+
+        lines = []
+        for profile, profile_records in sorted(records.items()):
+            totals = [record["total"] for record in profile_records]
+            startup_memory = [record["memory_mb"] for record in profile_records if record.get("memory_mb") is not None]
+            line = (
+                f"🧭 Launch profile '{profile}': {len(profile_records)} launches, "
+                f"startup p50 {cls.percentile(totals, 50):.2f}s / p95 {cls.percentile(totals, 95):.2f}s"
+            )
+            if startup_memory:
+                line += f", memory at startup p50 {cls.percentile(startup_memory, 50):.0f} MB"
+            if samples.get(profile):
+                line += (
+                    f", after test p50 {cls.percentile(samples[profile], 50):.0f} MB"
+                    f" / p95 {cls.percentile(samples[profile], 95):.0f} MB"
+                )
+            lines.append(line)
+        return lines
+
+    @classmethod
+    def _summarize_health(cls, health_stats: List[Dict[str, float]]) -> List[str]:
+        """Summarize driver recycling decisions, dead sessions and peak process tree usage"""
+        checks = sum(stats.get("checks", 0) for stats in health_stats)
+        dead_sessions = sum(int(stats.get("dead_sessions", 0)) for stats in health_stats)
+        lines = [f"💀 Dead sessions replaced: {dead_sessions}"] if dead_sessions else []
+        if not checks:
+            return lines
+
+        by_reason = {
+            reason: sum(int(stats.get(f"recycled_{reason}", 0)) for stats in health_stats)
+            for reason in ("memory", "age", "tests")
+        }
+        peak_rss = max(stats.get("peak_rss_mb", 0) for stats in health_stats)
+        peak_cpu = max(stats.get("peak_cpu_seconds", 0) for stats in health_stats)
+
+        return lines + [
+            f"♻️  Driver recycling: {sum(by_reason.values())} of {int(checks)} returns "
+            f"(memory: {by_reason['memory']}, age: {by_reason['age']}, tests: {by_reason['tests']}), "
+            f"peak RSS {peak_rss:.0f} MB, peak CPU {peak_cpu:.1f}s"
+        ]
+
+    @classmethod
+    def _summarize_lock_waits(cls, startups: List[Dict[str, Any]]) -> List[str]:
+        """Summarize time spent waiting on DriverManager locks"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for startup in startups:
+            for name, waits in startup.get("lock_waits", {}).items():
+                merged = totals.setdefault(
+                    name, {"acquisitions": 0, "contended": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+                )
+                merged["acquisitions"] += waits.get("acquisitions", 0)
+                merged["contended"] += waits.get("contended", 0)
+                merged["wait_seconds"] += waits.get("wait_seconds", 0.0)
+                merged["max_wait_seconds"] = max(merged["max_wait_seconds"], waits.get("max_wait_seconds", 0.0))
+
+        if not totals:
+            return []
+
+        parts = [
+            f"{name} {int(waits['contended'])}/{int(waits['acquisitions'])} contended, "
+            f"waited {waits['wait_seconds']:.2f}s (max {waits['max_wait_seconds']:.2f}s)"
+            for name, waits in sorted(totals.items())
+        ]
+        return [f"🔒 DriverManager lock waits: {'; '.join(parts)}"]
+
+    @classmethod
+    def _summarize_capture(cls, capture_stats: List[Dict[str, int]]) -> List[str]:
+        """Summarize captured request storage: stored, evicted and truncated requests"""
+        stored = sum(stats.get("stored", 0) for stats in capture_stats)
+        if not stored:
+            return []
+
+        evicted_entries = sum(stats.get("evicted_entries", 0) for stats in capture_stats)
+        evicted_bytes = sum(stats.get("evicted_bytes", 0) for stats in capture_stats)
+        truncated = sum(stats.get("truncated_bodies", 0) for stats in capture_stats)
+        peak_mb = max(stats.get("peak_bytes", 0) for stats in capture_stats) / (1024 * 1024)
+
+        return [
+            f"📦 Captured requests: {stored} stored, {evicted_entries + evicted_bytes} evicted "
+            f"(count: {evicted_entries}, size: {evicted_bytes}), {truncated} bodies truncated, "
+            f"peak {peak_mb:.1f} MB per driver"
+        ]
+
+    @classmethod
+    def _summarize_asset_cache(cls, cache_stats: List[Dict[str, int]]) -> List[str]:
+        """Summarize the static asset cache: hit ratio, bytes saved, stored and evicted assets"""
+        hits = sum(stats.get("hits", 0) for stats in cache_stats)
+        misses = sum(stats.get("misses", 0) for stats in cache_stats)
+        if not hits + misses:
+            return []
+
+        saved_mb = sum(stats.get("bytes_saved", 0) for stats in cache_stats) / (1024 * 1024)
+        stored_mb = sum(stats.get("bytes_stored", 0) for stats in cache_stats) / (1024 * 1024)
+        stores = sum(stats.get("stores", 0) for stats in cache_stats)
+        evictions = sum(stats.get("evictions", 0) for stats in cache_stats)
+
+        return [
+            f"🗄️  Asset cache: {100.0 * hits / (hits + misses):.0f}% hit ratio ({hits} hits, {misses} misses), "
+            f"{saved_mb:.1f} MB served from disk, {stores} assets stored ({stored_mb:.1f} MB), {evictions} evicted"
+        ]